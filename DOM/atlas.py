@@ -0,0 +1,167 @@
+"""
+
+Атлас текстур.
+Упаковывает множество небольших изображений в несколько больших страниц.
+
+"""
+
+from __future__ import annotations
+
+import typing as ty
+
+import pygame as pg
+from loguru import logger
+
+
+class _Shelves:
+    def __init__(self, size: tuple[int, int]):
+        """
+        Раскладка изображений по полкам.
+        Полка - горизонтальная полоса, высота которой равна высоте
+        самого высокого изображения на ней.
+        :param size: Размер страницы.
+        """
+        self.width, self.height = size
+        self.shelf_x = 0  # Начало свободного места на текущей полке
+        self.shelf_y = 0  # Верх текущей полки
+        self.shelf_height = 0  # Высота текущей полки
+        self.right = self.bottom = 0  # Границы занятой области
+        self.used = 0  # Занятая площадь (в пикселях)
+
+    def place(self, size: tuple[int, int]) -> pg.Rect | None:
+        """
+        Ищет место для изображения.
+        :param size: Размер изображения.
+        :return: Область страницы или None, если места нет.
+        """
+        width, height = size
+        shelf_x, shelf_y, shelf_height = self.shelf_x, self.shelf_y, self.shelf_height
+        if shelf_x + width > self.width:  # Переходим на новую полку
+            shelf_x, shelf_y, shelf_height = 0, shelf_y + shelf_height, 0
+        if shelf_x + width > self.width or shelf_y + height > self.height:
+            return None
+
+        area = pg.Rect(shelf_x, shelf_y, width, height)
+        self.shelf_x, self.shelf_y = shelf_x + width, shelf_y
+        self.shelf_height = max(shelf_height, height)
+        self.right = max(self.right, area.right)
+        self.bottom = max(self.bottom, area.bottom)
+        self.used += width * height
+        return area
+
+
+class _Page(_Shelves):
+    def __init__(self, size: tuple[int, int], shelves: _Shelves | None = None):
+        """
+        Страница атласа.
+        :param size: Размер страницы.
+        :param shelves: Уже выполненная раскладка.
+        """
+        super(_Page, self).__init__(size)
+        if shelves is not None:
+            self.__dict__.update(
+                (name, value)
+                for name, value in shelves.__dict__.items()
+                if name not in ("width", "height")
+            )
+        self.surface = pg.Surface(size, pg.SRCALPHA, 32).convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+
+
+class TextureAtlas:
+    def __init__(self, page_size: tuple[int, int] = (1024, 1024)):
+        """
+        Атлас текстур.
+        Изображения копируются на общие страницы, а вместо них возвращаются
+        подповерхности (Surface.subsurface) страниц. Подповерхности не хранят
+        собственных пикселей и отрисовываются как обычные изображения.
+        :param page_size: Максимальный размер страницы.
+        """
+        self.page_size = page_size
+        self._pages: list[_Page] = []
+        self._images: dict[ty.Hashable, pg.Surface] = {}
+
+    def add(self, key: ty.Hashable, image: pg.Surface) -> pg.Surface:
+        """
+        Добавляет изображение в атлас.
+        Если изображение с таким ключом уже добавлено, возвращает его.
+        :param key: Ключ изображения.
+        :param image: Изображение.
+        :return: Изображение из атласа.
+        """
+        return self.add_many({key: image})[key]
+
+    def add_many(
+        self, images: dict[ty.Hashable, pg.Surface]
+    ) -> dict[ty.Hashable, pg.Surface]:
+        """
+        Добавляет несколько изображений в атлас.
+        Изображения, не поместившиеся на существующие страницы, раскладываются
+        на новые страницы, размер которых обрезается по занятой области.
+        :param images: Словарь: ключ -> изображение.
+        :return: Словарь: ключ -> изображение из атласа.
+        """
+        pending = []
+        for key, image in images.items():
+            if key in self._images:
+                continue
+            for page in self._pages:
+                if (area := page.place(image.get_size())) is not None:
+                    self._copy(key, image, page, area)
+                    break
+            else:
+                pending.append((key, image))
+
+        # Высокие изображения первыми - полки заполняются плотнее
+        pending.sort(key=lambda item: item[1].get_height(), reverse=True)
+        while pending:
+            width, height = pending[0][1].get_size()
+            shelves = _Shelves(
+                (max(self.page_size[0], width), max(self.page_size[1], height))
+            )
+            placed, rest = [], []
+            for key, image in pending:
+                if (area := shelves.place(image.get_size())) is not None:
+                    placed.append((key, image, area))
+                else:
+                    rest.append((key, image))
+            pending = rest
+
+            page = _Page((shelves.right, shelves.bottom), shelves)
+            self._pages.append(page)
+            for key, image, area in placed:
+                self._copy(key, image, page, area)
+            logger.opt(colors=True).trace(
+                f"Новая страница атласа <c>{page.surface.get_size()}</c>, "
+                f"изображений: <c>{len(placed)}</c>"
+            )
+
+        return {key: self._images[key] for key in images}
+
+    def _copy(self, key: ty.Hashable, image: pg.Surface, page: _Page, area: pg.Rect):
+        # Страница изначально прозрачная, а области не пересекаются,
+        # поэтому сложение копирует пиксели вместе с альфа-каналом
+        page.surface.blit(image, area, special_flags=pg.BLEND_RGBA_ADD)
+        self._images[key] = page.surface.subsurface(area)
+
+    def get(self, key: ty.Hashable) -> pg.Surface | None:
+        """
+        :param key: Ключ изображения.
+        :return: Изображение из атласа или None.
+        """
+        return self._images.get(key)
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        :return: Кол-во страниц и изображений, объем и заполненность страниц.
+        """
+        total = sum(page.width * page.height for page in self._pages)
+        return {
+            "pages": len(self._pages),
+            "images": len(self._images),
+            "bytes": sum(
+                page.surface.get_pitch() * page.surface.get_height()
+                for page in self._pages
+            ),
+            "fill": sum(page.used for page in self._pages) / total if total else 0,
+        }
@@ -11,7 +11,7 @@ import typing as ty
 
 import pygame as pg
 
-from base import Group, Button, Label, WidgetsGroup, InputBox
+from base import Group, Button, Label, WidgetsGroup, InputBox, RunLoop, FontRegistry
 from utils import (
     FinishStatus,
     check_password,
@@ -50,7 +50,7 @@ class Login(WidgetsGroup):
             text="Авторизация",
             padding=7,
             border_width=3,
-            font=pg.font.Font(font, 30),
+            font=FontRegistry.get(font, 30),
         )
 
         self.login = InputBox(
@@ -61,7 +61,7 @@ class Login(WidgetsGroup):
             description="Имя пользователя",
             width=self.rect.width * 0.9,
             padding=5,
-            font=pg.font.Font(font, 25),
+            font=FontRegistry.get(font, 25),
             inactive_border_color=pg.Color("#b9a66d"),
             active_border_color=pg.Color("#f0ce69"),
             border_width=2,
@@ -76,7 +76,7 @@ class Login(WidgetsGroup):
             description="Пароль",
             width=self.rect.width * 0.9,
             padding=5,
-            font=pg.font.Font(font, 20),
+            font=FontRegistry.get(font, 20),
             inactive_border_color=pg.Color("#b9a66d"),
             active_border_color=pg.Color("#f0ce69"),
             border_width=2,
@@ -92,7 +92,7 @@ class Login(WidgetsGroup):
             text="Войти",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, 17),
+            font=FontRegistry.get(font, 17),
             border_width=2,
             callback=lambda event: self.auth(parent),
         )
@@ -105,7 +105,7 @@ class Login(WidgetsGroup):
             text="зарегистрироваться",
             padding=5,
             color=pg.Color("#f0ce69"),
-            font=pg.font.Font(font, 13),
+            font=FontRegistry.get(font, 13),
             callback=lambda event: parent.show_signup_group(),
         )
 
@@ -159,7 +159,7 @@ class Signup(WidgetsGroup):
             text="Регистрация",
             border_width=3,
             padding=7,
-            font=pg.font.Font(font, 30),
+            font=FontRegistry.get(font, 30),
         )
 
         self.login = InputBox(
@@ -170,7 +170,7 @@ class Signup(WidgetsGroup):
             description="Имя пользователя",
             width=self.rect.width * 0.9,
             padding=5,
-            font=pg.font.Font(font, 20),
+            font=FontRegistry.get(font, 20),
             inactive_border_color=pg.Color("#b9a66d"),
             active_border_color=pg.Color("#f0ce69"),
             border_width=2,
@@ -185,7 +185,7 @@ class Signup(WidgetsGroup):
             description="Пароль",
             width=self.rect.width * 0.9,
             padding=5,
-            font=pg.font.Font(font, 20),
+            font=FontRegistry.get(font, 20),
             inactive_border_color=pg.Color("#b9a66d"),
             active_border_color=pg.Color("#f0ce69"),
             border_width=2,
@@ -201,7 +201,7 @@ class Signup(WidgetsGroup):
             description="Повторите пароль",
             width=self.rect.width * 0.9,
             padding=5,
-            font=pg.font.Font(font, 20),
+            font=FontRegistry.get(font, 20),
             inactive_border_color=pg.Color("#b9a66d"),
             active_border_color=pg.Color("#f0ce69"),
             border_width=2,
@@ -217,7 +217,7 @@ class Signup(WidgetsGroup):
             text="Создать аккаунт",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, 17),
+            font=FontRegistry.get(font, 17),
             border_width=2,
             callback=lambda event: self.auth(parent),
         )
@@ -230,7 +230,7 @@ class Signup(WidgetsGroup):
             text="авторизоваться",
             padding=5,
             color=pg.Color("#f0ce69"),
-            font=pg.font.Font(font, 13),
+            font=FontRegistry.get(font, 13),
             callback=lambda event: parent.show_login_group(),
         )
 
@@ -331,12 +331,7 @@ class AuthScreen(Group):
         """
         :return: FinishStatus.
         """
-        while self.running:  # Цикл окна
-            for event in pg.event.get():
-                if event.type == pg.QUIT:
-                    self.terminate()
-                self.handle_event(event)
-            self.render()
+        RunLoop(self).run()
         return self.finish_status
 
     def render(self) -> None:
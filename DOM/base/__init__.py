@@ -1,5 +1,11 @@
 from .anchor import Anchor
+from .animation import Timeline, Tween
+from .expiry import Expiry
+from .fonts import FontRegistry
 from .group import Group
+from .hit_index import HitGrid
+from .inbox import Inbox
+from .loop import RunLoop
 from .thread import Thread
 
 from .widgets import (
@@ -0,0 +1,221 @@
+"""
+
+Анимации, идущие по времени.
+
+Tween изменяет значение от start до end за duration секунд.
+Timeline продвигает анимации по часам, а не по кадрам, поэтому скорость
+анимаций не зависит от частоты кадров: при низкой частоте кадры пропускаются.
+Основной цикл окна (RunLoop) вызывает Timeline.step() каждый кадр
+и не засыпает, пока в Timeline есть анимации.
+Timeline.finish_all() сразу завершает все анимации (пропуск анимаций),
+Timeline.time_scale ускоряет или замедляет их.
+
+"""
+
+from __future__ import annotations
+
+import time
+import typing as ty
+from dataclasses import dataclass
+
+from loguru import logger
+
+from .events import BaseEvent
+
+Easing = ty.Callable[[float], float]
+
+
+def linear(t: float) -> float:
+    return t
+
+
+def ease_in(t: float) -> float:
+    return t * t
+
+
+def ease_out(t: float) -> float:
+    return 1 - (1 - t) * (1 - t)
+
+
+def ease_in_out(t: float) -> float:
+    return t * t * (3 - 2 * t)
+
+
+@dataclass(eq=False)
+class AnimationEnd(BaseEvent):
+    """
+    Событие завершения анимации.
+    """
+
+    tween: Tween
+
+
+class Tween:
+    def __init__(
+        self,
+        duration: float,
+        on_update: ty.Callable[[float], ty.Any] | None = None,
+        *,
+        start: float = 0,
+        end: float = 1,
+        easing: Easing = linear,
+        on_finish: ty.Callable[[], ty.Any] | None = None,
+        post_event: True | False = False,
+    ):
+        """
+        Анимация значения.
+        :param duration: Длительность (в секундах).
+        :param on_update: Функция, принимающая новое значение.
+        :param start: Начальное значение.
+        :param end: Конечное значение.
+        :param easing: Функция сглаживания: доля времени -> доля пути.
+        :param on_finish: Функция, вызываемая после завершения анимации.
+        :param post_event: True - после завершения отправить событие AnimationEnd.
+        """
+        self.duration = max(duration, 0)
+        self.on_update = on_update
+        self.start = start
+        self.end = end
+        self.easing = easing
+        self.on_finish = on_finish
+        self.post_event = post_event
+
+        self.elapsed = 0.0  # Прошедшее время анимации (в секундах)
+        self.last_step: float | None = None  # Время предыдущего шага (см. Timeline)
+        self.value = start
+        self.finished = False
+
+    @property
+    def progress(self) -> float:
+        """
+        :return: Доля прошедшего времени (от 0 до 1).
+        """
+        if not self.duration:
+            return 1.0
+        return min(self.elapsed / self.duration, 1.0)
+
+    def advance(self, dt: float) -> True | False:
+        """
+        Продвигает анимацию.
+        :param dt: Прошедшее время (в секундах).
+        :return: True - анимация завершена.
+        """
+        if self.finished:
+            return True
+        self.elapsed += dt
+        if self.progress >= 1:
+            self.finish()
+            return True
+        self._set(self.start + (self.end - self.start) * self.easing(self.progress))
+        return False
+
+    def finish(self) -> None:
+        """
+        Завершает анимацию: устанавливает конечное значение
+        и вызывает on_finish.
+        """
+        if self.finished:
+            return
+        self.elapsed = self.duration
+        self._set(self.end)
+        self.finished = True
+        if self.on_finish is not None:
+            self.on_finish()
+        if self.post_event:
+            AnimationEnd(self).post()
+
+    def _set(self, value: float) -> None:
+        self.value = value
+        if self.on_update is not None:
+            self.on_update(value)
+
+
+class Timeline:
+    _tweens: list[Tween] = []  # Активные анимации
+    clock: ty.Callable[[], float] = time.perf_counter
+    time_scale: float = 1.0  # Множитель скорости анимаций
+
+    # Метрики
+    _started = 0  # Кол-во запущенных анимаций
+    _finished = 0  # Кол-во завершенных анимаций
+    _skipped = 0  # Кол-во анимаций, завершенных досрочно
+
+    @classmethod
+    def add(cls, tween: Tween) -> Tween:
+        """
+        Запускает анимацию.
+        Вызывается из основного потока.
+        :param tween: Анимация.
+        :return: Анимация.
+        """
+        tween.last_step = cls.clock()
+        cls._tweens.append(tween)
+        cls._started += 1
+        return tween
+
+    @classmethod
+    def cancel(cls, tween: Tween) -> None:
+        """
+        Останавливает анимацию без вызова on_finish.
+        :param tween: Анимация.
+        """
+        if tween in cls._tweens:
+            cls._tweens.remove(tween)
+
+    @classmethod
+    def step(cls) -> True | False:
+        """
+        Продвигает все анимации на время, прошедшее с предыдущего шага.
+        Вызывается основным циклом окна раз в кадр.
+        :return: True - были активные анимации.
+        """
+        if not cls._tweens:
+            return False
+        now = cls.clock()
+        for tween in cls._tweens.copy():
+            if tween not in cls._tweens:
+                continue  # Анимация остановлена другой анимацией
+            dt = (now - tween.last_step) * cls.time_scale
+            tween.last_step = now
+            if tween.advance(dt):
+                cls._remove(tween)
+        return True
+
+    @classmethod
+    def finish_all(cls) -> None:
+        """
+        Сразу завершает все анимации, включая запущенные из on_finish.
+        """
+        while cls._tweens:
+            tween = cls._tweens[0]
+            tween.finish()
+            cls._skipped += 1
+            cls._remove(tween)
+        logger.opt(colors=True).debug(
+            f"Анимации пропущены, всего: <c>{cls._skipped}</c>"
+        )
+
+    @classmethod
+    def active(cls) -> True | False:
+        """
+        :return: True - есть активные анимации.
+        """
+        return bool(cls._tweens)
+
+    @classmethod
+    def _remove(cls, tween: Tween) -> None:
+        if tween in cls._tweens:
+            cls._tweens.remove(tween)
+            cls._finished += 1
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """
+        :return: Метрики анимаций.
+        """
+        return {
+            "active": len(cls._tweens),
+            "started": cls._started,
+            "finished": cls._finished,
+            "skipped": cls._skipped,
+        }
@@ -2,11 +2,17 @@
 
 События, для общения между виджетами.
 
+EventBus - подписки на типы событий. Объекты окна подписываются атрибутом
+класса event_types, а группы пересылают событие только тем вложенным объектам,
+которые на него подписаны (сами или через свои вложенные объекты).
+Обработчики вне дерева виджетов подписываются методом EventBus.subscribe.
+
 """
 
 from __future__ import annotations
 
 import typing as ty
+from collections import defaultdict
 from dataclasses import dataclass
 from inspect import isclass
 
@@ -64,3 +70,124 @@ class ButtonClickEvent(BaseEvent):
     """
 
     obj: Button  # Нажатая кнопка
+
+
+@dataclass(eq=False)
+class WakeupEvent(BaseEvent):
+    """
+    Событие, пробуждающее основной цикл окна (RunLoop).
+    """
+
+
+class EventBus:
+    # Обработчики вне дерева виджетов: тип события -> обработчики
+    _handlers: dict[int, list[ty.Callable[[pg.event.Event], ty.Any]]] = defaultdict(
+        list
+    )
+
+    # Метрики
+    _published: dict[int, int] = defaultdict(int)  # Кол-во событий каждого типа
+    _delivered: dict[int, int] = defaultdict(int)  # Кол-во вызовов обработчиков
+    _last_published: pg.event.Event | None = None  # Последнее учтенное событие
+
+    @staticmethod
+    def normalize(
+        event_types: ty.Iterable[int | ty.Type[BaseEvent]] | None,
+    ) -> frozenset[int] | None:
+        """
+        :param event_types: Типы событий pygame и классы событий BaseEvent.
+        :return: Множество типов событий. None - все события.
+        """
+        if event_types is None:
+            return None
+        return frozenset(
+            event_type.type if isclass(event_type) else event_type
+            for event_type in event_types
+        )
+
+    @classmethod
+    def subscribe(
+        cls,
+        event_type: int | ty.Type[BaseEvent],
+        handler: ty.Callable[[pg.event.Event], ty.Any],
+    ) -> None:
+        """
+        Подписывает обработчик на события одного типа.
+        :param event_type: Тип события pygame или класс события BaseEvent.
+        :param handler: Функция, принимающая событие.
+        """
+        (event_type,) = cls.normalize((event_type,))
+        cls._handlers[event_type].append(handler)
+
+    @classmethod
+    def unsubscribe(
+        cls,
+        event_type: int | ty.Type[BaseEvent],
+        handler: ty.Callable[[pg.event.Event], ty.Any],
+    ) -> None:
+        """
+        Отменяет подписку обработчика.
+        :param event_type: Тип события pygame или класс события BaseEvent.
+        :param handler: Функция, принимающая событие.
+        """
+        (event_type,) = cls.normalize((event_type,))
+        if handler in (handlers := cls._handlers[event_type]):
+            handlers.remove(handler)
+
+    @classmethod
+    def publish(cls, event: pg.event.Event) -> None:
+        """
+        Передает событие подписанным обработчикам.
+        Вызывается основным циклом окна для каждого события.
+        :param event: Событие.
+        """
+        cls.count_published(event)
+        if handlers := cls._handlers.get(event.type):
+            cls._delivered[event.type] += len(handlers)
+            for handler in handlers.copy():
+                handler(event)
+
+    @classmethod
+    def count_published(cls, event: pg.event.Event) -> None:
+        """
+        Учитывает событие, переданное обработчикам или корневой группе окна.
+        Событие, переданное и тем и другой, учитывается один раз.
+        :param event: Событие.
+        """
+        if event is not cls._last_published:
+            cls._last_published = event
+            cls._published[event.type] += 1
+
+    @classmethod
+    def count_delivered(cls, event_type: int, count: int) -> None:
+        """
+        Учитывает вызовы обработчиков событий объектами окна.
+        :param event_type: Тип события.
+        :param count: Кол-во вызовов.
+        """
+        cls._delivered[event_type] += count
+
+    @staticmethod
+    def event_name(event_type: int) -> str:
+        """
+        :param event_type: Тип события.
+        :return: Название события.
+        """
+        for event_class, class_type in BaseEvent.events.items():
+            if class_type == event_type:
+                return event_class.__name__
+        return pg.event.event_name(event_type)
+
+    @classmethod
+    def stats(cls) -> dict[str, dict[str, int]]:
+        """
+        :return: Метрики для каждого типа событий:
+            кол-во событий и вызовов обработчиков.
+        """
+        return {
+            cls.event_name(event_type): {
+                "published": cls._published[event_type],
+                "delivered": cls._delivered[event_type],
+            }
+            for event_type in cls._published.keys() | cls._delivered.keys()
+        }
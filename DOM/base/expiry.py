@@ -0,0 +1,118 @@
+"""
+
+Временные элементы окна: пинги, отметки попаданий, индикаторы.
+
+Expiry хранит время исчезновения каждого элемента в куче, упорядоченной
+по времени, и вызывает функцию удаления элемента, когда его время подходит.
+Основной цикл окна (RunLoop) вызывает Expiry.process() каждый кадр
+и, если окну нечего обновлять, спит до ближайшего времени исчезновения
+(но не дольше idle_timeout), а не опрашивает элементы по таймеру.
+Элементы, время которых наступит в пределах slack, удаляются вместе
+с ближайшим: несколько близких по времени элементов будят цикл один раз.
+
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+import typing as ty
+
+
+class Expiry:
+    # Куча: (время исчезновения, номер, ключ элемента)
+    _heap: list[tuple[float, int, ty.Hashable]] = []
+    # Ключ элемента -> (время исчезновения, функция удаления)
+    _deadlines: dict[ty.Hashable, tuple[float, ty.Callable[[], ty.Any]]] = {}
+    _counter = itertools.count()  # Порядок добавления элементов с равным временем
+    clock: ty.Callable[[], float] = time.monotonic
+    slack: float = 0.05  # Допустимое опережение удаления (в секундах)
+
+    # Метрики
+    _scheduled = 0  # Кол-во добавленных элементов
+    _renewed = 0  # Кол-во продлений уже добавленных элементов
+    _expired = 0  # Кол-во удаленных по времени элементов
+    _cancelled = 0  # Кол-во элементов, удаленных до истечения времени
+
+    @classmethod
+    def add(
+        cls, key: ty.Hashable, ttl: float, on_expire: ty.Callable[[], ty.Any]
+    ) -> None:
+        """
+        Добавляет временный элемент.
+        Если элемент с таким ключом уже есть, его время продлевается.
+        Вызывается из основного потока.
+        :param key: Ключ элемента.
+        :param ttl: Через сколько секунд элемент исчезнет.
+        :param on_expire: Функция, удаляющая элемент.
+        """
+        deadline = cls.clock() + ttl
+        if key in cls._deadlines:
+            cls._renewed += 1
+        else:
+            cls._scheduled += 1
+        cls._deadlines[key] = (deadline, on_expire)
+        # Прежняя запись элемента в куче останется и будет пропущена
+        heapq.heappush(cls._heap, (deadline, next(cls._counter), key))
+
+    @classmethod
+    def cancel(cls, key: ty.Hashable) -> None:
+        """
+        Удаляет элемент без вызова функции удаления.
+        :param key: Ключ элемента.
+        """
+        if cls._deadlines.pop(key, None) is not None:
+            cls._cancelled += 1
+
+    @classmethod
+    def process(cls) -> int:
+        """
+        Удаляет элементы, время которых подошло.
+        Вызывается основным циклом окна раз в кадр.
+        :return: Кол-во удаленных элементов.
+        """
+        if not cls._heap:
+            return 0
+        now = cls.clock() + cls.slack
+        expired = 0
+        while cls._heap and cls._heap[0][0] <= now:
+            deadline, _, key = heapq.heappop(cls._heap)
+            entry = cls._deadlines.get(key)
+            if entry is None or entry[0] != deadline:
+                continue  # Элемент продлен или удален
+            del cls._deadlines[key]
+            entry[1]()
+            expired += 1
+        cls._expired += expired
+        if not cls._deadlines:
+            cls._heap.clear()  # Остались только устаревшие записи
+        return expired
+
+    @classmethod
+    def time_left(cls) -> float | None:
+        """
+        :return: Время до исчезновения ближайшего элемента (в секундах)
+            или None, если элементов нет.
+        """
+        while cls._heap:
+            deadline, _, key = cls._heap[0]
+            entry = cls._deadlines.get(key)
+            if entry is not None and entry[0] == deadline:
+                return max(deadline - cls.slack - cls.clock(), 0)
+            heapq.heappop(cls._heap)
+        return None
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """
+        :return: Метрики временных элементов.
+        """
+        return {
+            "active": len(cls._deadlines),
+            "heap": len(cls._heap),
+            "scheduled": cls._scheduled,
+            "renewed": cls._renewed,
+            "expired": cls._expired,
+            "cancelled": cls._cancelled,
+        }
@@ -0,0 +1,109 @@
+"""
+
+Общие шрифты.
+
+Каждый вызов pg.font.Font заново открывает и разбирает файл шрифта.
+FontRegistry загружает шрифт для каждой пары (путь, размер) один раз
+и выдает всем виджетам один и тот же объект.
+Шрифты из реестра нельзя изменять (set_bold, set_underline и т.п.).
+
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import typing as ty
+
+import pygame as pg
+from loguru import logger
+
+
+class FontRegistry:
+    _fonts: dict[tuple[str | None, int], pg.font.Font] = {}
+    _lock = threading.Lock()
+
+    # Метрики
+    hits = 0  # Кол-во запросов загруженного шрифта
+    misses = 0  # Кол-во загрузок шрифта
+
+    @classmethod
+    def get(cls, path: str | None, size: int) -> pg.font.Font:
+        """
+        :param path: Путь к файлу шрифта. None - шрифт pygame по умолчанию.
+        :param size: Размер шрифта.
+        :return: Общий объект шрифта.
+        """
+        key = (path, int(size))
+        with cls._lock:
+            if (font := cls._fonts.get(key)) is None:
+                font = cls._fonts[key] = pg.font.Font(*key)
+                cls.misses += 1
+            else:
+                cls.hits += 1
+            return font
+
+    @classmethod
+    def preload(cls, path: str | None, sizes: ty.Iterable[int]) -> None:
+        """
+        Загружает шрифт нескольких размеров.
+        :param path: Путь к файлу шрифта.
+        :param sizes: Размеры шрифта.
+        """
+        for size in sizes:
+            cls.get(path, size)
+
+    @classmethod
+    def preload_ui(cls) -> None:
+        """
+        Загружает размеры шрифта, которые использует интерфейс
+        при текущем размере текста (переменная окружения font_size).
+        """
+        font_size = int(os.environ["font_size"])
+        sizes = {
+            font_size,
+            int(font_size * 0.7),
+            int(font_size * 0.8),
+            round(font_size * 0.8),
+        }
+        if icon_size := os.environ.get("icon_size"):
+            sizes.add(int(icon_size))
+        for path in {os.environ.get("font"), os.environ.get("FONT")}:
+            cls.preload(path, sorted(sizes))
+        logger.opt(colors=True).debug(f"Шрифты загружены: <c>{cls.stats()}</c>")
+
+    @staticmethod
+    def _file_size(path: str | None) -> int:
+        """
+        :return: Размер файла шрифта (в байтах).
+        """
+        if path is None:
+            path = os.path.join(
+                os.path.dirname(pg.font.__file__), pg.font.get_default_font()
+            )
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._fonts.clear()
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """
+        Объем памяти оценивается по размеру файлов:
+        каждый загруженный шрифт держит собственную копию файла.
+        :return: Метрики реестра.
+        """
+        with cls._lock:
+            keys = list(cls._fonts)
+        return {
+            "fonts": len(keys),
+            "files": len({path for path, _ in keys}),
+            "bytes": sum(cls._file_size(path) for path, _ in keys),
+            "hits": cls.hits,
+            "misses": cls.misses,
+        }
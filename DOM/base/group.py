@@ -6,16 +6,23 @@
 
 from __future__ import annotations
 
+import typing as ty
 from abc import ABC
 
 import pygame as pg
 from loguru import logger
 
+from .events import EventBus
+from .hit_index import HitIndex
 from .object import Object
-from .widget import BaseWidget
+
+if ty.TYPE_CHECKING:
+    from .widget import BaseWidget
 
 
 class Group(Object, ABC):
+    event_types = ()
+
     def __init__(
         self,
         parent: Group | None = None,
@@ -43,14 +50,15 @@ class Group(Object, ABC):
                 if obj not in self._objects:
                     logger.opt(colors=True).trace(f"adding {obj} to {self}")
                     obj.parent = self
+                    if hasattr(obj, "invalidate_global_rect"):
+                        obj.invalidate_global_rect()
                     self._objects.append(obj)
-                    obj.update()
+                    obj.invalidate()
+        Object._layout_version += 1
+        self._reset_routes()
         parent = self
         while parent:
-            if isinstance(parent, BaseWidget):
-                BaseWidget.update(parent)
-            else:
-                parent.update()
+            parent.invalidate(shallow=True)
             parent = parent.parent
 
     def remove(self, *objects: Object) -> None:
@@ -61,8 +69,12 @@ class Group(Object, ABC):
         for obj in objects:
             if obj in self._objects:
                 logger.opt(colors=True).trace(f"removing {obj} from {self}")
+                if not obj.hidden:
+                    obj.mark_dirty()
                 self._objects.remove(obj)
-        self.update()
+        Object._layout_version += 1
+        self._reset_routes()
+        self.invalidate()
 
     def update(self, *args, **kwargs) -> None:
         """
@@ -78,18 +90,176 @@ class Group(Object, ABC):
         Отображает все виджеты, входящие в группу.
         :param surface: Поверхность.
         """
+        self.flush()
+        blits = []
+        self.collect_blits(blits)
+        surface.blits(blits, doreturn=False)
+
+    def collect_blits(self, blits: list[tuple[pg.Surface, pg.Rect]]) -> None:
+        """
+        Добавляет изображения всех видимых виджетов группы в список отрисовки.
+        Порядок изображений совпадает с порядком отрисовки.
+        :param blits: Список пар (изображение, положение) для pg.Surface.blits.
+        """
         if not self.hidden:
             for widget in self._objects:
-                widget.draw(surface)
+                widget.collect_blits(blits)
+
+    def track_dirty_rects(self) -> None:
+        """
+        Включает отслеживание измененных областей окна.
+        Вызывается у корневой группы (экрана).
+        Первый кадр после вызова отрисовывается целиком.
+        """
+        self._dirty_rects: list[pg.Rect | None] = [None]
+
+    def pop_dirty_rects(self, bounds: pg.Rect) -> list[pg.Rect]:
+        """
+        Возвращает измененные области окна и очищает их список.
+        Пересекающиеся области объединяются.
+        :param bounds: Границы окна.
+        :return: Список областей.
+        """
+        dirty_rects = self.__dict__.get("_dirty_rects")
+        if not dirty_rects:
+            return []
+        self._dirty_rects = []
+
+        if None in dirty_rects:  # Требуется полная перерисовка
+            return [bounds.copy()]
+
+        return self.merge_rects(dirty_rects, bounds)
+
+    @staticmethod
+    def merge_rects(rects: list[pg.Rect], bounds: pg.Rect) -> list[pg.Rect]:
+        """
+        Обрезает области по границам и объединяет пересекающиеся.
+        :param rects: Список областей.
+        :param bounds: Границы.
+        :return: Список непересекающихся областей.
+        """
+        merged: list[pg.Rect] = []
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if not rect.width or not rect.height:
+                continue
+            # Объединяем с пересекающимися областями
+            while (i := rect.collidelist(merged)) != -1:
+                rect.union_ip(merged.pop(i))
+            merged.append(rect)
+        return merged
+
+    def draw_dirty(
+        self,
+        surface: pg.Surface,
+        background: ty.Callable[[pg.Surface], ...] | None = None,
+    ) -> list[pg.Rect]:
+        """
+        Перерисовывает только измененные области окна.
+        :param surface: Поверхность.
+        :param background: Функция, отрисовывающая фон окна.
+        :return: Список перерисованных областей. Передается в pg.display.update.
+        """
+        self.flush()
+        rects = self.pop_dirty_rects(surface.get_rect())
+        if rects:
+            # Список отрисовки собирается один раз для всех областей
+            blits = []
+            self.collect_blits(blits)
+            for rect in rects:
+                surface.set_clip(rect)
+                if background:
+                    background(surface)
+                surface.blits(blits, doreturn=False)
+            surface.set_clip(None)
+        return rects
 
     def handle_event(self, event: pg.event.Event) -> None:
         """
-        Отправляет событие всем виджетам в группе.
+        Отправляет событие виджетам группы, подписанным на его тип.
         :param event: Событие.
         """
+        if self.parent is None:
+            EventBus.count_published(event)
         if self.enabled:
-            for obj in self._objects:
-                obj.handle_event(event)
+            route = self._route(event.type)
+            if route:
+                EventBus.count_delivered(event.type, len(route))
+                for obj in route:
+                    obj.handle_event(event)
+
+    def subscribed_to(self, event_type: int) -> True | False:
+        """
+        :param event_type: Тип события.
+        :return: True - группа или один из вложенных объектов
+            обрабатывает события этого типа.
+        """
+        return Object.subscribed_to(self, event_type) or bool(self._route(event_type))
+
+    def _route(self, event_type: int) -> list[Object]:
+        """
+        :param event_type: Тип события.
+        :return: Объекты группы, подписанные на события этого типа.
+        """
+        if (routes := self.__dict__.get("_routes")) is None:
+            routes = self._routes = {}
+        if (route := routes.get(event_type)) is None:
+            route = routes[event_type] = [
+                obj
+                for obj in self.__dict__.get("_objects", ())
+                if obj.subscribed_to(event_type)
+            ]
+        return route
+
+    def _reset_routes(self) -> None:
+        """
+        Сбрасывает подписки группы и ее родителей
+        после изменения состава группы.
+        """
+        group = self
+        while group is not None:
+            group.__dict__.pop("_routes", None)
+            group = group.parent
+
+    def widget_at(self, pos: tuple[int, int]) -> BaseWidget | None:
+        """
+        Вызывается у корневой группы (экрана).
+        :param pos: Точка окна.
+        :return: Верхний видимый и включенный виджет, обрабатывающий нажатия
+            (pointer_target = True), под точкой или None.
+        """
+        if (hit_index := self.__dict__.get("_hit_index")) is None:
+            hit_index = self._hit_index = HitIndex(self)
+        return hit_index.widget_at(pos)
+
+    def alpha_report(self) -> list[tuple[BaseWidget, str, int]]:
+        """
+        Отладочный отчет: видимые виджеты группы, изображения которых
+        имеют альфа-канал и рисуются с попиксельным смешиванием цветов.
+        :return: Список (виджет, причина, площадь) от большей площади к меньшей.
+        """
+        report = []
+        groups = [self]
+        while groups:
+            group = groups.pop()
+            for obj in group.__dict__.get("_objects", ()):
+                if obj.hidden:
+                    continue
+                if hasattr(obj, "objects"):
+                    groups.append(obj)
+                if hasattr(obj, "alpha_reason") and (
+                    obj.image.get_flags() & pg.SRCALPHA
+                ):
+                    report.append((obj, obj.alpha_reason(), obj.rect.w * obj.rect.h))
+        report.sort(key=lambda item: item[2], reverse=True)
+
+        logger.opt(colors=True).debug(
+            f"{self}: изображений с альфа-каналом: <y>{len(report)}</y>, "
+            f"площадь: <y>{sum(area for *_, area in report)}</y> px"
+        )
+        for widget, reason, area in report:
+            logger.opt(colors=True).debug(f"  {widget}: {reason}, <c>{area}</c> px")
+        return report
 
     @property
     def objects(self) -> list[Object]:
@@ -0,0 +1,194 @@
+"""
+
+Поиск объектов под курсором.
+
+HitGrid - равномерная сетка прямоугольников: точка (или область) проверяется
+только с прямоугольниками своих ячеек.
+HitIndex - сетка глобальных прямоугольников виджетов окна, которые
+обрабатывают нажатия (pointer_target = True). Индекс строится при первом
+запросе и перестраивается, только если расположение виджетов изменилось.
+
+"""
+
+from __future__ import annotations
+
+import typing as ty
+
+import pygame as pg
+
+from .object import Object
+
+if ty.TYPE_CHECKING:
+    from .group import Group
+    from .widget import BaseWidget
+
+T = ty.TypeVar("T")
+
+
+class HitGrid(ty.Generic[T]):
+    def __init__(self, cell_width: float, cell_height: float):
+        """
+        Равномерная сетка прямоугольников.
+        Элементы, добавленные позже, считаются лежащими выше.
+        :param cell_width: Ширина ячейки.
+        :param cell_height: Высота ячейки.
+        """
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self._items: list[tuple[pg.Rect, T]] = []
+        self._cells: dict[tuple[int, int], list[int]] = {}
+
+    def add(self, rect: pg.Rect, item: T) -> None:
+        """
+        Добавляет элемент.
+        :param rect: Область элемента.
+        :param item: Элемент.
+        """
+        if not rect.width or not rect.height:
+            return
+        index = len(self._items)
+        self._items.append((rect, item))
+        for i in range(
+            int(rect.top // self.cell_height),
+            int((rect.bottom - 1) // self.cell_height) + 1,
+        ):
+            for j in range(
+                int(rect.left // self.cell_width),
+                int((rect.right - 1) // self.cell_width) + 1,
+            ):
+                self._cells.setdefault((i, j), []).append(index)
+
+    def items_at(self, pos: tuple[int, int]) -> list[T]:
+        """
+        :param pos: Точка.
+        :return: Элементы, содержащие точку, сверху вниз.
+        """
+        cell = (int(pos[1] // self.cell_height), int(pos[0] // self.cell_width))
+        items = []
+        for index in reversed(self._cells.get(cell, ())):
+            rect, item = self._items[index]
+            if rect.collidepoint(pos):
+                items.append(item)
+        return items
+
+    def items_in(self, rect: pg.Rect) -> list[T]:
+        """
+        :param rect: Область.
+        :return: Элементы, пересекающиеся с областью, снизу вверх.
+            Элемент, добавленный несколько раз, возвращается один раз.
+        """
+        indexes = set()
+        for i in range(
+            int(rect.top // self.cell_height),
+            int((rect.bottom - 1) // self.cell_height) + 1,
+        ):
+            for j in range(
+                int(rect.left // self.cell_width),
+                int((rect.right - 1) // self.cell_width) + 1,
+            ):
+                indexes.update(self._cells.get((i, j), ()))
+        items = {}
+        for index in sorted(indexes):
+            item_rect, item = self._items[index]
+            if item_rect.colliderect(rect):
+                items[item] = None
+        return list(items)
+
+    def top(self, pos: tuple[int, int]) -> T | None:
+        """
+        :param pos: Точка.
+        :return: Верхний элемент, содержащий точку, или None.
+        """
+        cell = (int(pos[1] // self.cell_height), int(pos[0] // self.cell_width))
+        for index in reversed(self._cells.get(cell, ())):
+            rect, item = self._items[index]
+            if rect.collidepoint(pos):
+                return item
+        return None
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._cells.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class HitIndex:
+    cell_size: int = 64  # Размер ячейки сетки (в пикселях)
+
+    def __init__(self, root: Group):
+        """
+        Индекс виджетов окна, обрабатывающих нажатия.
+        :param root: Корневая группа (экран).
+        """
+        self.root = root
+        self._grid: HitGrid[BaseWidget] = HitGrid(self.cell_size, self.cell_size)
+        self._version = -1  # Версия расположения, по которой построен индекс
+        self._last: tuple[tuple[int, int], BaseWidget | None] | None = None
+
+        # Метрики
+        self.builds = 0  # Кол-во построений индекса
+        self.lookups = 0  # Кол-во поисков в сетке
+
+    def widget_at(self, pos: tuple[int, int]) -> BaseWidget | None:
+        """
+        :param pos: Точка окна.
+        :return: Верхний видимый и включенный виджет, обрабатывающий нажатия,
+            под точкой или None.
+        """
+        pos = tuple(pos)
+        if self._version != Object._layout_version:
+            self._build()
+        elif self._last is not None and self._last[0] == pos:
+            # Одно событие проверяют все виджеты окна
+            return self._last[1]
+        self.lookups += 1
+        widget = self._grid.top(pos)
+        self._last = (pos, widget)
+        return widget
+
+    def _build(self) -> None:
+        """
+        Строит сетку по текущему расположению виджетов.
+        """
+        self._grid.clear()
+        self._last = None
+        if self.root.enabled and not self.root.hidden:
+            self._add_group(self.root, None)
+        self._version = Object._layout_version
+        self.builds += 1
+
+    def _add_group(self, group: Group, clip: pg.Rect | None) -> None:
+        """
+        Добавляет объекты группы в порядке их отрисовки.
+        :param group: Группа.
+        :param clip: Область, за пределами которой объекты группы не видны.
+        """
+        objects = group.__dict__.get("_objects", ())
+        if hasattr(group, "get_global_rect"):
+            # Виджеты рисуются на изображении группы, вложенные группы - поверх него
+            objects = [obj for obj in objects if not hasattr(obj, "objects")] + [
+                obj for obj in objects if hasattr(obj, "objects")
+            ]
+            clip = group.get_global_rect()
+        for obj in objects:
+            if obj.hidden or not obj.enabled:
+                continue
+            if getattr(obj, "pointer_target", False):
+                rect = obj.get_global_rect()
+                if clip is not None and not hasattr(obj, "objects"):
+                    rect = rect.clip(clip)
+                self._grid.add(rect, obj)
+            if hasattr(obj, "objects"):
+                self._add_group(obj, clip)
+
+    def stats(self) -> dict[str, int]:
+        """
+        :return: Метрики индекса.
+        """
+        return {
+            "widgets": len(self._grid),
+            "builds": self.builds,
+            "lookups": self.lookups,
+        }
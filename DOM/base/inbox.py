@@ -0,0 +1,173 @@
+"""
+
+Очередь вызовов для основного потока.
+
+Обработчики событий сервера и результаты заданий Thread выполняются
+в других потоках. Чтобы не изменять интерфейс из этих потоков,
+они отправляют вызовы в Inbox, а основной цикл окна выполняет их
+раз в кадр вызовом Inbox.process().
+Если основной цикл ждет событий, добавление вызова будит его (Inbox.on_post).
+
+Очередь не использует блокировок: добавление и извлечение элементов
+collections.deque и запись в dict атомарны.
+Вызовы изменяют состояние интерфейса, поэтому ни один из них не отбрасывается.
+Обновления состояния (post_update) объединяются по ключу: невыполненное
+обновление заменяется более поздним с тем же ключом, поэтому их в очереди
+не больше, чем ключей. Длина очереди остальных вызовов не ограничена.
+Если она растет быстрее, чем обрабатывается, выводится предупреждение.
+
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import typing as ty
+from collections import deque
+
+from loguru import logger
+
+
+class Inbox:
+    _warning_depth: int = 4096  # Длина очереди, при которой выводится предупреждение
+    _next_warning: int = _warning_depth  # Длина для следующего предупреждения
+    _sequence = itertools.count()  # Порядковые номера вызовов
+    # Вызов: (порядковый номер, функция, позиционные и именованные аргументы)
+    _messages: deque[tuple[int, ty.Callable[..., ty.Any], tuple, dict]] = deque()
+    # Обновления состояния: ключ -> последний вызов с этим ключом
+    _updates: dict[ty.Hashable, tuple[int, ty.Callable[..., ty.Any], tuple, dict]] = {}
+    # Отложенные вызовы. Повторный вызов с тем же ключом заменяет предыдущий
+    _deferred: dict[ty.Hashable, ty.Callable[[], ty.Any]] = {}
+    # Вызывается после добавления вызова. Устанавливается основным циклом окна
+    on_post: ty.Callable[[], ty.Any] | None = None
+
+    # Метрики
+    _posted = 0  # Кол-во принятых вызовов
+    _processed = 0  # Кол-во выполненных вызовов
+    _coalesced = 0  # Кол-во отложенных вызовов и обновлений, замененных новыми
+    _max_depth = 0  # Максимальная длина очереди
+
+    @classmethod
+    def post(cls, func: ty.Callable[..., ty.Any], *args, **kwargs) -> None:
+        """
+        Добавляет вызов в очередь.
+        Может вызываться из любого потока.
+        :param func: Функция, которую нужно вызвать в основном потоке.
+        :param args: Позиционные аргументы функции.
+        :param kwargs: Именованные аргументы функции.
+        """
+        cls._messages.append((next(cls._sequence), func, args, kwargs))
+        cls._posted += 1
+        depth = len(cls._messages)
+        if depth > cls._max_depth:
+            cls._max_depth = depth
+        if depth >= cls._next_warning:
+            # Следующее предупреждение - при вдвое большей длине
+            cls._next_warning = depth * 2
+            logger.opt(colors=True).warning(
+                f"Очередь основного потока не успевает обрабатываться, "
+                f"вызовов в очереди: <y>{depth}</y>"
+            )
+        if cls.on_post is not None:
+            cls.on_post()
+
+    @classmethod
+    def post_update(
+        cls, key: ty.Hashable, func: ty.Callable[..., ty.Any], *args, **kwargs
+    ) -> None:
+        """
+        Добавляет в очередь обновление состояния.
+        Невыполненное обновление с тем же ключом заменяется: выполняется
+        только последнее, в порядке его добавления относительно других вызовов.
+        Может вызываться из любого потока.
+        :param key: Ключ обновления.
+        :param func: Функция, которую нужно вызвать в основном потоке.
+        :param args: Позиционные аргументы функции.
+        :param kwargs: Именованные аргументы функции.
+        """
+        if key in cls._updates:
+            cls._coalesced += 1
+        cls._updates[key] = (next(cls._sequence), func, args, kwargs)
+        cls._posted += 1
+        if cls.on_post is not None:
+            cls.on_post()
+
+    @classmethod
+    def defer(
+        cls, func: ty.Callable[[], ty.Any], key: ty.Hashable | None = None
+    ) -> None:
+        """
+        Откладывает вызов до конца обработки очереди.
+        Вызовы с одинаковым ключом, добавленные за один кадр,
+        выполняются один раз.
+        :param func: Функция без аргументов.
+        :param key: Ключ вызова. По умолчанию - сама функция.
+        """
+        key = func if key is None else key
+        if key in cls._deferred:
+            cls._coalesced += 1
+        cls._deferred[key] = func
+        if cls.on_post is not None:
+            cls.on_post()
+
+    @classmethod
+    def process(cls) -> int:
+        """
+        Выполняет накопившиеся вызовы и обновления в порядке добавления,
+        а затем отложенные вызовы.
+        Вызывается из основного цикла окна раз в кадр.
+        Вызовы, добавленные во время обработки, будут выполнены в следующем кадре.
+        :return: Кол-во выполненных вызовов.
+        """
+        count = 0
+        messages = [cls._messages.popleft() for _ in range(len(cls._messages))]
+        if cls._updates:
+            updates = sorted(cls._updates.pop(key) for key in list(cls._updates))
+            messages = heapq.merge(messages, updates, key=lambda message: message[0])
+        for _, func, args, kwargs in messages:
+            cls._call(func, *args, **kwargs)
+            count += 1
+
+        for _ in range(len(cls._deferred)):
+            try:
+                func = cls._deferred.pop(next(iter(cls._deferred)))
+            except (StopIteration, KeyError):
+                break
+            cls._call(func)
+            count += 1
+
+        cls._processed += count
+        if len(cls._messages) < cls._warning_depth:
+            cls._next_warning = cls._warning_depth
+        return count
+
+    @classmethod
+    def has_pending(cls) -> True | False:
+        """
+        :return: True - в очереди есть невыполненные вызовы.
+        """
+        return bool(cls._messages or cls._updates or cls._deferred)
+
+    @staticmethod
+    def _call(func: ty.Callable[..., ty.Any], *args, **kwargs) -> None:
+        try:
+            func(*args, **kwargs)
+        except Exception:
+            import traceback
+
+            traceback.print_exc()
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """
+        :return: Метрики очереди.
+        """
+        return {
+            "queue_depth": len(cls._messages),
+            "updates": len(cls._updates),
+            "deferred": len(cls._deferred),
+            "posted": cls._posted,
+            "processed": cls._processed,
+            "coalesced": cls._coalesced,
+            "max_depth": cls._max_depth,
+        }
@@ -0,0 +1,144 @@
+"""
+
+Основной цикл окна.
+
+Цикл ограничивает частоту кадров, а если окну нечего обновлять
+(нет событий, вызовов в Inbox и анимаций Timeline), засыпает в pg.event.wait
+до следующего события или до исчезновения ближайшего временного элемента
+Expiry. Вызовы, добавленные в Inbox из других потоков,
+будят цикл событием WakeupEvent.
+
+"""
+
+from __future__ import annotations
+
+import math
+import typing as ty
+
+import pygame as pg
+from loguru import logger
+
+from .animation import Timeline
+from .events import EventBus, WakeupEvent
+from .expiry import Expiry
+from .inbox import Inbox
+from .widget import BaseWidget
+
+if ty.TYPE_CHECKING:
+    from .group import Group
+
+
+class RunLoop:
+    _waiting: True | False = False  # True - цикл ждет событий
+
+    def __init__(
+        self,
+        screen: Group,
+        *,
+        fps: int = 60,
+        idle_timeout: float = 1,
+        animating: ty.Callable[[], True | False] | None = None,
+        on_frame: ty.Callable[[], ty.Any] | None = None,
+    ):
+        """
+        Основной цикл окна.
+        Окно должно иметь атрибут running и методы render и terminate.
+        :param screen: Окно.
+        :param fps: Максимальная частота кадров.
+        :param idle_timeout: Максимальное время ожидания событий (в секундах).
+        :param animating: Функция, возвращающая True, пока в окне идет анимация.
+         Во время анимации цикл не засыпает.
+        :param on_frame: Функция, которая вызывается каждый кадр перед отрисовкой.
+        """
+        self.screen = screen
+        self.fps = fps
+        self.idle_timeout = idle_timeout
+        self.animating = animating
+        self.on_frame = on_frame
+        self.clock = pg.time.Clock()
+
+        self._frames = 0  # Кол-во отрисованных кадров
+        self._idle_frames = 0  # Кол-во кадров, перед которыми цикл засыпал
+
+    def run(self) -> None:
+        """
+        Запускает цикл. Цикл работает, пока screen.running == True.
+        """
+        screen = self.screen
+        Inbox.on_post = self.wakeup
+        EventBus.subscribe(pg.QUIT, self._on_quit)
+        walks_saved = BaseWidget.global_rect_hits
+        try:
+            while screen.running:
+                events = self._get_events()
+                with screen.batch():
+                    for event in events:
+                        if event.type == WakeupEvent.type:
+                            continue
+                        EventBus.publish(event)
+                        screen.handle_event(event)
+                    Expiry.process()  # До Inbox: обновления поля будут в этом кадре
+                    Inbox.process()
+                    Timeline.step()
+                if self.on_frame is not None:
+                    self.on_frame()
+                screen.render()
+                self._frames += 1
+                self.clock.tick(self.fps)
+        finally:
+            Inbox.on_post = None
+            EventBus.unsubscribe(pg.QUIT, self._on_quit)
+            walks_saved = BaseWidget.global_rect_hits - walks_saved
+            logger.opt(colors=True).debug(
+                f"Цикл окна {screen} остановлен, кадров: <c>{self._frames}</c>, "
+                f"из них после ожидания: <c>{self._idle_frames}</c>, "
+                f"обходов родителей сэкономлено за кадр: "
+                f"<c>{walks_saved / max(self._frames, 1):.1f}</c>"
+            )
+
+    def _on_quit(self, _event: pg.event.Event) -> None:
+        self.screen.terminate()
+
+    def _get_events(self) -> list[pg.event.Event]:
+        """
+        Возвращает события окна.
+        Если окну нечего обновлять, ждет первое событие не дольше idle_timeout
+        и не дольше, чем до исчезновения ближайшего временного элемента.
+        """
+        if (
+            not self._frames
+            or Timeline.active()
+            or (self.animating is not None and self.animating())
+        ):
+            return pg.event.get()
+
+        timeout = self.idle_timeout
+        if (time_left := Expiry.time_left()) is not None:
+            if not time_left:
+                return pg.event.get()
+            timeout = min(timeout, time_left)
+
+        RunLoop._waiting = True
+        try:
+            # Вызов мог быть добавлен в Inbox до установки флага
+            if Inbox.has_pending() or pg.event.peek():
+                return pg.event.get()
+            self._idle_frames += 1
+            event = pg.event.wait(math.ceil(timeout * 1000))
+        finally:
+            RunLoop._waiting = False
+
+        events = pg.event.get()
+        if event.type != pg.NOEVENT:
+            events.insert(0, event)
+        return events
+
+    @classmethod
+    def wakeup(cls) -> None:
+        """
+        Будит цикл, если он ждет событий.
+        Может вызываться из любого потока.
+        """
+        if cls._waiting:
+            cls._waiting = False
+            WakeupEvent().post()
@@ -8,11 +8,15 @@ from __future__ import annotations
 
 import typing as ty
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 
 from loguru import logger
 
+from .events import EventBus
+
 if ty.TYPE_CHECKING:
     import pygame as pg
+    from .events import BaseEvent
     from .group import Group
 
 
@@ -33,9 +37,32 @@ FIELDS = [
     "_inactive_background",
     "_active_background",
 ]  # Атрибуты, которые может содержать объект
+# Атрибуты, от которых зависит положение вложенных объектов в окне
+OFFSET_FIELDS = ("_padding", "_border_width")
 
 
 class Object(ABC):
+    _batch_depth: int = 0  # Вложенность блоков batch
+    # Отложенные обновления: объект -> True, если достаточно обновить только его,
+    # False - объект нужно обновить вместе с дочерними объектами
+    _pending: dict[Object, True | False] = {}
+    _resolving: set[Object] = set()  # Объекты, обновляемые в данный момент
+    __parent: Group | None = None  # Виджеты могут обращаться к rect до Object.__init__
+    # Версия расположения объектов. Увеличивается при перемещении, добавлении,
+    # удалении, скрытии и выключении объектов (см. HitIndex)
+    _layout_version: int = 0
+    # Типы событий, которые обрабатывает сам объект (не считая вложенных).
+    # None - все события. Класс, переопределивший handle_event без event_types,
+    # получает все события
+    event_types: ty.Collection[int | ty.Type[BaseEvent]] | None = None
+    _event_types: frozenset[int] | None = None  # event_types в виде множества типов
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "handle_event" in cls.__dict__ and "event_types" not in cls.__dict__:
+            cls.event_types = None
+        cls._event_types = EventBus.normalize(cls.event_types)
+
     def __init__(
         self,
         parent: Group | None,
@@ -65,14 +92,20 @@ class Object(ABC):
         """
         Снимает скрытие с объекта.
         """
-        self._hidden = False
+        if self._hidden:
+            self._hidden = False
+            self.mark_dirty()
+            Object._layout_version += 1
         logger.opt(colors=True).trace(f"show {self}")
 
     def hide(self) -> None:
         """
         Скрывает объект.
         """
-        self._hidden = True
+        if not self._hidden:
+            self.mark_dirty()
+            self._hidden = True
+            Object._layout_version += 1
         logger.opt(colors=True).trace(f"hide {self}")
 
     @property
@@ -83,14 +116,18 @@ class Object(ABC):
         """
         Включает объект.
         """
-        self._enabled = True
+        if not self._enabled:
+            self._enabled = True
+            Object._layout_version += 1
         logger.opt(colors=True).trace(f"enable {self}")
 
     def disable(self) -> None:
         """
         Выключает объект.
         """
-        self._enabled = False
+        if self._enabled:
+            self._enabled = False
+            Object._layout_version += 1
         logger.opt(colors=True).trace(f"disable {self}")
 
     @property
@@ -114,6 +151,133 @@ class Object(ABC):
     def parent(self, parent: Group | None):
         self.__parent = parent
 
+    @property
+    def root(self) -> Object:
+        """
+        :return: Корневой объект дерева (как правило - экран).
+        """
+        obj = self
+        while obj.parent is not None:
+            obj = obj.parent
+        return obj
+
+    @property
+    def tracks_dirty(self) -> True | False:
+        """
+        :return: True - корневая группа отслеживает измененные области окна.
+        """
+        return self.root.__dict__.get("_dirty_rects") is not None
+
+    def mark_dirty(self) -> None:
+        """
+        Помечает область окна, занимаемую объектом, как требующую перерисовки.
+        Область произвольного объекта неизвестна, поэтому перерисовывается все окно.
+        """
+        self._add_dirty_rect(None)
+
+    def _add_dirty_rect(self, rect: pg.Rect | None) -> None:
+        """
+        Передает измененную область окна корневой группе.
+        :param rect: Область окна. None - перерисовать окно целиком.
+        """
+        dirty_rects = self.root.__dict__.get("_dirty_rects")
+        if dirty_rects is not None:
+            dirty_rects.append(rect)
+
+    def invalidate(self, shallow: True | False = False) -> None:
+        """
+        Запрашивает обновление объекта.
+        Вне блока batch объект обновляется сразу.
+        Внутри блока обновление откладывается: повторные запросы объединяются,
+        а объект обновляется один раз при выходе из блока, при отрисовке
+        или при обращении к его положению (rect) или изображению (image).
+        :param shallow: True - обновить только сам объект, без дочерних.
+        """
+        if Object._batch_depth:
+            Object._pending[self] = Object._pending.get(self, True) and shallow
+        else:
+            self._update(shallow)
+
+    def _update(self, shallow: True | False = False) -> None:
+        """
+        Обновляет объект.
+        :param shallow: True - обновить только сам объект, без дочерних.
+        """
+        self.update()
+
+    def _apply(self, shallow: True | False) -> None:
+        """
+        Выполняет отложенное обновление объекта.
+        :param shallow: True - обновить только сам объект, без дочерних.
+        """
+        Object._resolving.add(self)
+        try:
+            self._update(shallow)
+        finally:
+            Object._resolving.discard(self)
+
+    def _resolve(self) -> None:
+        """
+        Выполняет отложенные обновления, от которых зависит объект:
+        обновление самого объекта и полные обновления его родителей.
+        """
+        if self in Object._resolving:
+            return
+        pending = Object._pending
+        path = []
+        obj = self
+        while obj is not None:
+            if obj in pending and (obj is self or pending[obj] is False):
+                path.append(obj)
+            obj = obj.parent
+        for obj in reversed(path):  # Сначала родители
+            if obj in pending:
+                obj._apply(pending.pop(obj))
+
+    @classmethod
+    @contextmanager
+    def batch(cls) -> ty.Iterator[None]:
+        """
+        Откладывает обновления объектов до конца блока.
+        Используется при построении окон и массовом изменении виджетов:
+        ```
+        with widget.batch():
+            widget.label.text = "..."
+            widget.add(...)
+        ```
+        """
+        Object._batch_depth += 1
+        try:
+            yield
+        finally:
+            Object._batch_depth -= 1
+            if not Object._batch_depth:
+                cls.flush()
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Выполняет все отложенные обновления.
+        Вложенные объекты обновляются раньше своих родителей.
+        """
+        pending = Object._pending
+        while pending:
+            for obj in sorted(pending, key=lambda obj: obj.depth, reverse=True):
+                if obj in pending:
+                    obj._apply(pending.pop(obj))
+
+    @property
+    def depth(self) -> int:
+        """
+        :return: Уровень вложенности объекта. У корневого объекта - 0.
+        """
+        depth = 0
+        obj = self.parent
+        while obj is not None:
+            depth += 1
+            obj = obj.parent
+        return depth
+
     @abstractmethod
     def update(self, *args, **kwargs) -> None:
         """
@@ -121,6 +285,13 @@ class Object(ABC):
         Обновляет объект.
         """
 
+    def subscribed_to(self, event_type: int) -> True | False:
+        """
+        :param event_type: Тип события.
+        :return: True - объект обрабатывает события этого типа.
+        """
+        return self._event_types is None or event_type in self._event_types
+
     @abstractmethod
     def handle_event(self, event: pg.event.Event) -> None:
         """
@@ -149,7 +320,10 @@ class Object(ABC):
                 "{self} <le>{key}</le>=<y>{value}</y>", self=self, key=key, value=value
             )
             super(Object, self).__setattr__(key, value)
-            (self.parent or self).update()
+            if key in OFFSET_FIELDS and hasattr(self, "invalidate_global_rect"):
+                self.invalidate_global_rect()
+                Object._layout_version += 1
+            (self.parent or self).invalidate()
             return
         super(Object, self).__setattr__(key, value)
 
@@ -0,0 +1,103 @@
+"""
+
+Кэш отрисованного текста.
+
+Одни и те же строки (надписи кнопок, числа характеристик, ники)
+отображаются многими виджетами и перерисовываются при каждом их обновлении.
+TextCache растеризует каждую строку один раз для шрифта и цвета
+и переиспользует изображение.
+
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+
+import pygame as pg
+
+
+class TextCache:
+    """
+    Кэш изображений текста с вытеснением давно не использованных (LRU).
+    Ключ - (шрифт, текст, цвет, сглаживание).
+    Объем кэша ограничен переменной окружения TEXT_CACHE_SIZE (в байтах).
+    Изображения из кэша нельзя изменять.
+    """
+
+    _surfaces: OrderedDict[tuple, pg.Surface] = OrderedDict()
+    _size = 0  # Объем изображений в кэше (в байтах)
+    _lock = threading.Lock()
+
+    # Метрики
+    hits = 0  # Кол-во строк, найденных в кэше
+    misses = 0  # Кол-во отрисованных строк
+    evictions = 0  # Кол-во вытесненных строк
+
+    @staticmethod
+    def budget() -> int:
+        """
+        :return: Максимальный объем кэша (в байтах).
+        """
+        return int(os.environ.get("TEXT_CACHE_SIZE", 16 * 1024 * 1024))
+
+    @classmethod
+    def render(
+        cls,
+        font: pg.font.Font,
+        text: str | None,
+        color: pg.Color,
+        antialias: True | False = True,
+    ) -> pg.Surface:
+        """
+        Аналог font.render, возвращающий изображение из кэша.
+        :param font: Шрифт.
+        :param text: Текст.
+        :param color: Цвет текста.
+        :param antialias: Сглаживание.
+        :return: Изображение текста.
+        """
+        key = (font, text, tuple(color), antialias)
+        with cls._lock:
+            if (surface := cls._surfaces.get(key)) is not None:
+                cls._surfaces.move_to_end(key)
+                cls.hits += 1
+                return surface
+
+        surface = font.render(text, antialias, color)
+        with cls._lock:
+            cls.misses += 1
+            if (old := cls._surfaces.pop(key, None)) is not None:
+                cls._size -= old.get_pitch() * old.get_height()
+            cls._surfaces[key] = surface
+            cls._size += surface.get_pitch() * surface.get_height()
+
+            budget = cls.budget()
+            while cls._size > budget and len(cls._surfaces) > 1:
+                _, old = cls._surfaces.popitem(last=False)
+                cls._size -= old.get_pitch() * old.get_height()
+                cls.evictions += 1
+        return surface
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._surfaces.clear()
+            cls._size = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int | float]:
+        """
+        :return: Метрики кэша.
+        """
+        requests = cls.hits + cls.misses
+        return {
+            "surfaces": len(cls._surfaces),
+            "bytes": cls._size,
+            "budget": cls.budget(),
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "evictions": cls.evictions,
+            "hit_rate": cls.hits / requests if requests else 0.0,
+        }
@@ -0,0 +1,143 @@
+"""
+
+Разбиение текста на строки заданной ширины.
+
+Ширина каждого слова (или символа) измеряется один раз для шрифта и
+запоминается, поэтому строка разбивается за один проход без повторных
+измерений растущего префикса. Готовые разбиения запоминаются
+по (шрифт, текст, ширина, soft_split).
+
+"""
+
+from __future__ import annotations
+
+import os
+import typing as ty
+from collections import OrderedDict
+
+import pygame as pg
+
+
+class TextLayout:
+    # Ширины слов и символов для каждого шрифта
+    _widths: dict[pg.font.Font, dict[str, int]] = {}
+    # Разбиения текста на строки
+    _layouts: OrderedDict[tuple, tuple[str, ...]] = OrderedDict()
+
+    # Метрики
+    hits = 0  # Кол-во разбиений, найденных в кэше
+    misses = 0  # Кол-во выполненных разбиений
+
+    @staticmethod
+    def capacity() -> int:
+        """
+        :return: Максимальное кол-во запоминаемых разбиений
+            (и слов для одного шрифта).
+        """
+        return int(os.environ.get("TEXT_LAYOUT_CACHE_SIZE", 1024))
+
+    @classmethod
+    def wrap(
+        cls,
+        font: pg.font.Font,
+        text: str,
+        width: int,
+        soft_split: True | False = False,
+    ) -> tuple[str, ...]:
+        """
+        Разбивает текст на строки, которые не выходят за заданную ширину.
+        :param font: Шрифт.
+        :param text: Текст.
+        :param width: Максимальная ширина строки.
+        :param soft_split: True - Переносит текст не разрывая слова.
+        :return: Строки.
+        """
+        key = (font, text, width, soft_split)
+        if (lines := cls._layouts.get(key)) is not None:
+            cls._layouts.move_to_end(key)
+            cls.hits += 1
+            return lines
+
+        lines = []
+        for line in text.splitlines():
+            if font.size(line)[0] <= width:
+                lines.append(line)
+            elif soft_split:
+                lines.extend(cls._wrap_words(font, line, width))
+            else:
+                lines.extend(cls._wrap_chars(font, line, width))
+        lines = tuple(lines)
+
+        cls.misses += 1
+        cls._layouts[key] = lines
+        if len(cls._layouts) > cls.capacity():
+            cls._layouts.popitem(last=False)
+        return lines
+
+    @classmethod
+    def width(cls, font: pg.font.Font, text: str) -> int:
+        """
+        :param font: Шрифт.
+        :param text: Слово или символ.
+        :return: Ширина текста.
+        """
+        if (widths := cls._widths.get(font)) is None:
+            widths = cls._widths[font] = {}
+        if (width := widths.get(text)) is None:
+            if len(widths) >= cls.capacity():
+                widths.clear()
+            width = widths[text] = font.size(text)[0]
+        return width
+
+    @classmethod
+    def _wrap_words(cls, font: pg.font.Font, line: str, width: int) -> ty.Iterator[str]:
+        """
+        Разбивает строку по словам.
+        Слово, которое не помещается в ширину целиком, занимает отдельную строку.
+        """
+        space = cls.width(font, " ")
+        words = []
+        line_width = 0
+        for word in line.split():
+            word_width = cls.width(font, word)
+            if words and line_width + space + word_width > width:
+                yield " ".join(words)
+                words.clear()
+            line_width = line_width + space + word_width if words else word_width
+            words.append(word)
+        if words:
+            yield " ".join(words)
+
+    @classmethod
+    def _wrap_chars(cls, font: pg.font.Font, line: str, width: int) -> ty.Iterator[str]:
+        """
+        Разбивает строку по символам.
+        """
+        start = 0
+        line_width = 0
+        for i, char in enumerate(line):
+            char_width = cls.width(font, char)
+            if i > start and line_width + char_width > width:
+                yield line[start:i]
+                start, line_width = i, 0
+            line_width += char_width
+        if start < len(line):
+            yield line[start:]
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._widths.clear()
+        cls._layouts.clear()
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """
+        :return: Метрики кэша.
+        """
+        return {
+            "layouts": len(cls._layouts),
+            "fonts": len(cls._widths),
+            "words": sum(len(widths) for widths in cls._widths.values()),
+            "hits": cls.hits,
+            "misses": cls.misses,
+        }
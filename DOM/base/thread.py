@@ -1,15 +1,23 @@
 """
 
-Менеджер дополнительного потока.
-Дает интерфейс для выполнения функций в отдельном потоке.
+Менеджер дополнительных потоков.
+Дает интерфейс для выполнения функций в отдельных потоках.
 
 Существует, для того, чтобы окно приложения не зависало,
 при выполнении ресурса затратных задач,
 
+Задания выполняются пулом из нескольких потоков.
+Готовые к выполнению задания хранятся в очереди с приоритетом,
+отложенные и повторяющиеся - в куче таймеров, упорядоченной по времени запуска.
+Потоки спят на условной переменной и просыпаются,
+когда появляется новое задание или подходит время таймера.
+
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import re
 import threading
 import time
@@ -17,6 +25,8 @@ import typing as ty
 
 from loguru import logger
 
+from .inbox import Inbox
+
 if ty.TYPE_CHECKING:
     from .types import Response
 
@@ -28,22 +38,45 @@ def _safe_text(text: str) -> str:
 
 
 class Thread:
-    _thread: threading.Thread = ...  # Объект потока
-    _workers: list[Thread] = []  # Список заданий
-    _running: True | False = False  # True - поток активен
-    _sleeping = 1  # Интервал проверки новых заданий (в секундах)
+    _threads: list[threading.Thread] = []  # Потоки пула
+    _pool_size: int = 4  # Кол-во потоков пула
+    _running: True | False = False  # True - пул запущен
+    _condition = threading.Condition()  # Пробуждение потоков пула
+
+    # Очередь готовых заданий: (-приоритет, номер, задание)
+    _queue: list[tuple[int, int, Thread]] = []
+    # Таймеры отложенных заданий: (время запуска, номер, задание)
+    _timers: list[tuple[float, int, Thread]] = []
+    _counter = itertools.count()  # Порядок добавления заданий с равным приоритетом
+
+    # Метрики
+    _submitted = 0  # Кол-во поставленных в очередь запусков
+    _completed = 0  # Кол-во выполненных запусков
+    _failed = 0  # Кол-во запусков, завершившихся исключением
+    _cancelled = 0  # Кол-во отмененных заданий
+    _max_queue = 0  # Максимальная длина очереди готовых заданий
+    _total_latency = 0.0  # Суммарная задержка запуска (в секундах)
+    _max_latency = 0.0  # Максимальная задержка запуска (в секундах)
+    _total_runtime = 0.0  # Суммарное время выполнения (в секундах)
 
     def __new__(cls, *args, **kwargs):
         """
         Создание нового экземпляра класса.
         """
-        if cls._thread is ...:  # Если поток не создан
-            cls._running = True
-            cls._thread = threading.Thread(target=cls._worker, name="ThreadWorker")
-            # Поток автоматически остановится при остановке основного потока
-            cls._thread.daemon = True
-            cls._thread.start()
-            logger.opt(colors=True).debug(f"Поток <c>{cls._thread.name}</c> запущен")
+        with cls._condition:
+            if not cls._running:  # Если пул не создан
+                cls._running = True
+                for i in range(cls._pool_size):
+                    thread = threading.Thread(
+                        target=cls._worker, name=f"ThreadWorker-{i}"
+                    )
+                    # Поток автоматически остановится при остановке основного потока
+                    thread.daemon = True
+                    thread.start()
+                    cls._threads.append(thread)
+                logger.opt(colors=True).debug(
+                    f"Пул из <c>{cls._pool_size}</c> потоков запущен"
+                )
 
         return super(Thread, cls).__new__(cls)
 
@@ -55,7 +88,9 @@ class Thread:
         kwargs: dict[str, ...] = None,
         callback: ty.Callable[[Response], ty.Any] = None,
         repetitive: True | False = False,
-        timeout: int = 1,
+        timeout: float = 1,
+        delay: float = 0,
+        priority: int = 0,
     ):
         """
         Менеджер дополнительного потока.
@@ -65,12 +100,16 @@ class Thread:
          и возвращающая любое значение.
         :param args: Позиционные аргументы, которые передадутся в выполняемую функцию.
         :param kwargs: Именованные аргументы, которые передадутся в выполняемую функцию.
-        :param callback: Функция, которая будет вызвана,
-         после завершения работы основной функции.
+        :param callback: Функция, которая будет вызвана в основном потоке
+         (при обработке Inbox), после завершения работы основной функции.
         :type callback: Функция принимающая строго 1 позиционный аргумент
          и возвращающая любое значение.
         :param repetitive: True - Задание будет повторяться каждые <timeout> секунд.
         :param timeout: Раз в сколько секунд будет выполняться задание.
+        :param delay: Через сколько секунд задание будет выполнено впервые.
+        :param priority: Приоритет задания.
+         Из готовых к выполнению заданий первым выполняется задание
+         с большим приоритетом.
         """
         logger.opt(colors=True).trace(
             "Создано новое задание "
@@ -91,40 +130,140 @@ class Thread:
         self.callback = callback
         self.repetitive = repetitive
         self.timeout = timeout
+        self.delay = delay
+        self.priority = priority
 
-        self._last_start = 0
+        self._due = 0.0  # Время, на которое запланирован запуск
+        self._is_cancelled = False
 
     @classmethod
     def _worker(cls) -> ty.NoReturn:
-        # Основной цикл потока.
+        # Основной цикл потока пула.
         while cls._running:
-            for worker in cls._workers.copy():
-                if worker.repetitive:
-                    if worker._last_start + worker.timeout > int(time.time()):
-                        continue
-                try:
-                    response = worker.worker(*worker.args, **worker.kwargs)
-                    if worker.callback:
-                        worker.callback(response)
-                except Exception:
-                    import traceback
-
-                    traceback.print_exc()
-
-                if not worker.repetitive:
-                    cls._workers.remove(worker)
-                    logger.opt(colors=True).trace(
-                        "Задание <c>{worker}</c> выполнено", worker=worker.worker
+            with cls._condition:
+                while True:
+                    now = time.monotonic()
+                    # Переносим задания, время которых подошло, в очередь
+                    while cls._timers and cls._timers[0][0] <= now:
+                        _, _, job = heapq.heappop(cls._timers)
+                        cls._push(job)
+                    if cls._queue:
+                        _, _, job = heapq.heappop(cls._queue)
+                        if job._is_cancelled:
+                            continue
+                        break
+                    cls._condition.wait(
+                        cls._timers[0][0] - now if cls._timers else None
                     )
-                else:
-                    worker._last_start = int(time.time())
-            time.sleep(cls._sleeping)
 
-    def run(self) -> None:
+            job._execute()
+
+    @classmethod
+    def _push(cls, job: Thread) -> None:
+        """
+        Добавляет задание в очередь готовых заданий.
+        Вызывается при захваченном cls._condition.
+        """
+        heapq.heappush(cls._queue, (-job.priority, next(cls._counter), job))
+        cls._max_queue = max(cls._max_queue, len(cls._queue))
+
+    def _schedule(self, delay: float) -> None:
+        """
+        Планирует запуск задания.
+        :param delay: Через сколько секунд запустить задание.
+        """
+        cls = self.__class__
+        with cls._condition:
+            if self._is_cancelled:
+                return
+            cls._submitted += 1
+            self._due = time.monotonic() + delay
+            if delay > 0:
+                heapq.heappush(cls._timers, (self._due, next(cls._counter), self))
+            else:
+                cls._push(self)
+            cls._condition.notify()
+
+    def _execute(self) -> None:
+        """
+        Выполняет задание в потоке пула.
+        """
+        cls = self.__class__
+        start = time.monotonic()
+        latency = max(start - self._due, 0)
+        failed = False
+        try:
+            response = self.worker(*self.args, **self.kwargs)
+            if self.callback:
+                Inbox.post(self.callback, response)
+        except Exception:
+            failed = True
+            import traceback
+
+            traceback.print_exc()
+
+        with cls._condition:
+            cls._completed += 1
+            cls._failed += failed
+            cls._total_latency += latency
+            cls._max_latency = max(cls._max_latency, latency)
+            cls._total_runtime += time.monotonic() - start
+
+        if self.repetitive:
+            self._schedule(self.timeout)
+        else:
+            logger.opt(colors=True).trace(
+                "Задание <c>{worker}</c> выполнено", worker=self.worker
+            )
+
+    def run(self) -> Thread:
         """
         Запускает задания.
+        :return: Экземпляр задания. Через него задание можно отменить.
         """
-        self.__class__._workers.append(self)
+        self._schedule(self.delay)
         logger.opt(colors=True).trace(
             "Задание <c>{worker}</c> добавлено в очередь", worker=self.worker
         )
+        return self
+
+    def cancel(self) -> None:
+        """
+        Отменяет задание.
+        Уже запущенное выполнение не прерывается,
+        но повторяющееся задание больше не будет запущено.
+        """
+        cls = self.__class__
+        with cls._condition:
+            if not self._is_cancelled:
+                self._is_cancelled = True
+                cls._cancelled += 1
+        logger.opt(colors=True).trace(
+            "Задание <c>{worker}</c> отменено", worker=self.worker
+        )
+
+    @property
+    def cancelled(self) -> True | False:
+        return self._is_cancelled
+
+    @classmethod
+    def stats(cls) -> dict[str, int | float]:
+        """
+        :return: Метрики пула: длина очередей, кол-во заданий,
+            задержка запуска и время выполнения (в миллисекундах).
+        """
+        with cls._condition:
+            completed = cls._completed or 1
+            return {
+                "threads": len(cls._threads),
+                "queue_depth": len(cls._queue),
+                "max_queue_depth": cls._max_queue,
+                "timers": len(cls._timers),
+                "submitted": cls._submitted,
+                "completed": cls._completed,
+                "failed": cls._failed,
+                "cancelled": cls._cancelled,
+                "avg_latency_ms": cls._total_latency / completed * 1000,
+                "max_latency_ms": cls._max_latency * 1000,
+                "avg_runtime_ms": cls._total_runtime / completed * 1000,
+            }
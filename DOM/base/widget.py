@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import typing as ty
+import weakref
 from abc import ABC, abstractmethod
 
 import pygame as pg
@@ -19,6 +20,19 @@ if ty.TYPE_CHECKING:
 
 
 class BaseWidget(Object, ABC):
+    pointer_target: True | False = False  # True - виджет обрабатывает нажатия мыши
+    event_types = ()
+    _global_rect: pg.Rect | None = None  # Положение виджета в окне (get_global_rect)
+    # Виджеты, изображение которых будет построено при первом обращении к нему
+    _unrendered: weakref.WeakSet[BaseWidget] = weakref.WeakSet()
+
+    # Метрики get_global_rect
+    global_rect_hits = 0  # Вызовы, обошедшиеся без обхода цепочки родителей
+    global_rect_misses = 0  # Вызовы, вычислившие положение заново
+    # Метрики _create_image
+    opaque_images = 0  # Построено изображений без альфа-канала
+    alpha_images = 0  # Построено изображений с альфа-каналом
+
     def __init__(
         self, parent: Group | None, name: str = None, *, hidden: True | False = False
     ):
@@ -31,7 +45,55 @@ class BaseWidget(Object, ABC):
         Object.__init__(self, parent, name, hidden=hidden)
 
         self.rect: pg.Rect = self._get_rect()
-        self.image: pg.Surface = self._render()
+        self._refresh_image()
+        if Object._batch_depth:
+            # Виджет только что построен: отложенное при добавлении в группу
+            # обновление больше не нужно, а родители могли быть пересчитаны
+            # по еще не построенному виджету
+            Object._pending.pop(self, None)
+            parent = self.parent
+            while parent is not None:
+                parent.invalidate(shallow=True)
+                parent = parent.parent
+        self.mark_dirty()
+
+    @property
+    def rect(self) -> pg.Rect:
+        if Object._pending:
+            self._resolve()
+        return self._rect
+
+    @rect.setter
+    def rect(self, value: pg.Rect):
+        self._rect = value
+        if self._global_rect is not None:
+            self.invalidate_global_rect()
+
+    @property
+    def image(self) -> pg.Surface:
+        if Object._pending:
+            self._resolve()
+        if BaseWidget._unrendered and self in BaseWidget._unrendered:
+            BaseWidget._unrendered.discard(self)
+            self._image = self._render()
+        return self._image
+
+    @image.setter
+    def image(self, value: pg.Surface):
+        if BaseWidget._unrendered:
+            BaseWidget._unrendered.discard(self)
+        self._image = value
+
+    def _refresh_image(self) -> None:
+        """
+        Перестраивает изображение виджета.
+        Внутри блока batch изображение строится при первом обращении к нему
+        (как правило - при отрисовке).
+        """
+        if Object._batch_depth:
+            BaseWidget._unrendered.add(self)
+        else:
+            self.image = self._render()
 
     @abstractmethod
     def _get_rect(self) -> pg.Rect:
@@ -40,6 +102,58 @@ class BaseWidget(Object, ABC):
         :return: Объект pg.Rect, описывающий геометрию виджета и его положение в группе.
         """
 
+    @property
+    def opaque(self) -> True | False:
+        """
+        Может быть определено в классе-наследнике.
+        :return: True - изображение виджета полностью непрозрачно.
+        """
+        return False
+
+    def alpha_reason(self) -> str:
+        """
+        Может быть определено в классе-наследнике.
+        :return: Причина, по которой изображение виджета имеет альфа-канал.
+        """
+        return f"{type(self).__name__}._render"
+
+    def _create_image(self, size: tuple[int, int]) -> pg.Surface:
+        """
+        Создает изображение виджета.
+        Непрозрачное изображение (opaque) создается без альфа-канала:
+        оно рисуется в окне без попиксельного смешивания цветов.
+        :param size: Размер изображения.
+        :return: Пустое изображение в формате окна.
+        """
+        if self.opaque:
+            BaseWidget.opaque_images += 1
+            return pg.Surface(size).convert()
+        BaseWidget.alpha_images += 1
+        return pg.Surface(size, pg.SRCALPHA, 32).convert_alpha()
+
+    def _background_alpha_reason(self) -> str | None:
+        """
+        Для виджетов, изображение которых залито фоном background
+        и обведено рамкой border_width цвета border_color.
+        :return: Причина, по которой фон или обводка не дают
+            непрозрачного изображения, или None, если они непрозрачны.
+        """
+        if self.background is None:
+            return "нет фона"
+        if not self.is_opaque_color(self.background):
+            return "полупрозрачный фон"
+        if self.border_width and not self.is_opaque_color(self.border_color):
+            return "полупрозрачная обводка"
+        return None
+
+    @staticmethod
+    def is_opaque_color(color: pg.Color | None) -> True | False:
+        """
+        :param color: Цвет.
+        :return: True - цвет задан и полностью непрозрачен.
+        """
+        return color is not None and pg.Color(color).a == 255
+
     @abstractmethod
     def _render(self) -> pg.Surface:
         """
@@ -52,8 +166,23 @@ class BaseWidget(Object, ABC):
         Обновляет виджет.
         """
         logger.opt(colors=True).trace(f"update {self}")
+        tracks_dirty = self.tracks_dirty
+        if tracks_dirty:
+            self.mark_dirty()  # Старое положение виджета
+        if (old_rect := self.__dict__.get("_rect")) is not None:
+            old_rect = old_rect.copy()
         self.rect = self._get_rect()
-        self.image = self._render()
+        if self._rect != old_rect:
+            Object._layout_version += 1
+        self._refresh_image()
+        if tracks_dirty:
+            self.mark_dirty()  # Новое положение виджета
+
+    def _update(self, shallow: True | False = False) -> None:
+        if shallow:
+            BaseWidget.update(self)
+        else:
+            self.update()
 
     def handle_event(self, event: pg.event.Event) -> None:
         """
@@ -70,10 +199,55 @@ class BaseWidget(Object, ABC):
         if not self.hidden:
             surface.blit(self.image, self.rect)
 
+    def collect_blits(self, blits: list[tuple[pg.Surface, pg.Rect]]) -> None:
+        """
+        Добавляет изображение виджета в список отрисовки.
+        Отрисовка списком должна совпадать с draw.
+        :param blits: Список пар (изображение, положение) для pg.Surface.blits.
+        """
+        if not self.hidden:
+            blits.append((self.image, self.rect))
+
+    def hit_test(self, pos: tuple[int, int]) -> True | False:
+        """
+        :param pos: Точка окна.
+        :return: True - виджет - верхний из обрабатывающих нажатия под точкой.
+        """
+        root = self.root
+        if root is not self and hasattr(root, "widget_at"):
+            return root.widget_at(pos) is self
+        return self.get_global_rect().collidepoint(pos)
+
+    def mark_dirty(self) -> None:
+        """
+        Помечает область окна, занимаемую виджетом, как требующую перерисовки.
+        """
+        if self.tracks_dirty and (rect := self._get_dirty_rect()) is not None:
+            self._add_dirty_rect(rect)
+
+    def _get_dirty_rect(self) -> pg.Rect | None:
+        """
+        :return: Положение виджета в окне или None,
+            если виджет или один из его родителей еще не инициализирован.
+        """
+        obj = self
+        while obj is not None:
+            if isinstance(obj, BaseWidget) and "_rect" not in obj.__dict__:
+                return None
+            obj = obj.parent
+        return self.get_global_rect()
+
     def get_global_rect(self) -> pg.Rect:
         """
+        Положение запоминается и сбрасывается при перемещении
+        или изменении размеров виджета или одного из его родителей.
         :return: Экземпляр pg.Rect описывающий положение виджета в окне.
         """
+        if self._global_rect is not None and not Object._pending:
+            BaseWidget.global_rect_hits += 1
+            return self._global_rect.copy()
+        BaseWidget.global_rect_misses += 1
+
         rect = self.rect.copy()
         if self.parent and hasattr(self.parent, "get_global_rect"):
             parent_rect: pg.Rect = self.parent.get_global_rect()
@@ -84,4 +258,28 @@ class BaseWidget(Object, ABC):
             rect.x += parent_rect.x + padding + border_width
             rect.y += parent_rect.y + padding + border_width
 
+        if not Object._pending:  # Внутри batch положение может быть устаревшим
+            self._global_rect = rect.copy()
         return rect
+
+    def invalidate_global_rect(self) -> None:
+        """
+        Сбрасывает запомненное положение в окне у виджета и вложенных виджетов.
+        """
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            # Если положение не запомнено, то не запомнено и у вложенных виджетов
+            if obj.__dict__.get("_global_rect") is not None:
+                obj._global_rect = None
+                stack.extend(obj.__dict__.get("_objects", ()))
+
+    @staticmethod
+    def global_rect_stats() -> dict[str, int]:
+        """
+        :return: Метрики get_global_rect.
+        """
+        return {
+            "hits": BaseWidget.global_rect_hits,
+            "misses": BaseWidget.global_rect_misses,
+        }
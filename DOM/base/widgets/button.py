@@ -15,6 +15,9 @@ if ty.TYPE_CHECKING:
 
 
 class Button(Label):
+    pointer_target = True
+    event_types = (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP)
+
     def __init__(
         self,
         parent: Group,
@@ -91,8 +94,7 @@ class Button(Label):
         if self.enabled:
             if event.type == pg.MOUSEBUTTONDOWN:
                 if event.button == pg.BUTTON_LEFT:
-                    rect = self.get_global_rect()
-                    if rect.collidepoint(event.pos):
+                    if self.hit_test(event.pos):
                         self.pressed = True
                         logger.opt(colors=True).trace(
                             f"Кнопка <y>{self.text}</y> нажата"
@@ -101,8 +103,7 @@ class Button(Label):
                 if event.button == pg.BUTTON_LEFT:
                     if self.pressed:
                         self.pressed = False
-                        rect = self.get_global_rect()
-                        if rect.collidepoint(event.pos):
+                        if self.hit_test(event.pos):
                             logger.opt(colors=True).debug(
                                 f"Кнопка <y>{self.text}</y> нажата"
                             )
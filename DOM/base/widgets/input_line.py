@@ -15,6 +15,9 @@ if ty.TYPE_CHECKING:
 
 
 class InputLine(Label):
+    pointer_target = True
+    event_types = (pg.MOUSEBUTTONDOWN, pg.KEYDOWN)
+
     def __init__(
         self,
         parent: Group,
@@ -90,7 +93,7 @@ class InputLine(Label):
         if self.enabled:
             # При нажатии на виджет, активируется ввод
             if event.type == pg.MOUSEBUTTONDOWN:
-                self.active = self.get_global_rect().collidepoint(event.pos)
+                self.active = self.hit_test(event.pos)
             elif event.type == pg.KEYDOWN and self.active:
                 if event.key == pg.K_BACKSPACE:
                     self.text = self._text[:-1]
@@ -6,6 +6,7 @@ from inspect import isfunction
 import pygame as pg
 
 from ..anchor import Anchor
+from ..text_cache import TextCache
 from ..widget import BaseWidget
 
 if ty.TYPE_CHECKING:
@@ -75,7 +76,8 @@ class Label(BaseWidget):
         self._border_color = border_color
         self._border_width = border_width
 
-        self._rendered_text = self._render_text()
+        self._rendered_key = None
+        self._refresh_text()
 
         super(Label, self).__init__(parent, name)
 
@@ -112,8 +114,18 @@ class Label(BaseWidget):
         self.rect.x, self.rect.y = self.x, self.y
         return self.rect
 
+    @property
+    def opaque(self) -> True | False:
+        """
+        :return: True - фон и обводка непрозрачны.
+        """
+        return self._background_alpha_reason() is None
+
+    def alpha_reason(self) -> str:
+        return self._background_alpha_reason() or BaseWidget.alpha_reason(self)
+
     def _render(self) -> pg.Surface:
-        image = pg.Surface(self.rect.size, pg.SRCALPHA, 32).convert_alpha()
+        image = self._create_image(self.rect.size)
         if self.background:
             pg.draw.rect(image, self.background, image.get_rect())
         if self.border_width:
@@ -137,11 +149,26 @@ class Label(BaseWidget):
         return image
 
     def update(self, *args, **kwargs) -> None:
-        self._rendered_text = self._render_text()
+        self._refresh_text()
         super(Label, self).update(*args, **kwargs)
 
+    def _refresh_text(self) -> None:
+        """
+        Перерисовывает текст, только если изменились параметры,
+        от которых зависит его изображение.
+        """
+        if (key := self._text_key()) != self._rendered_key:
+            self._rendered_text = self._render_text()
+            self._rendered_key = key
+
+    def _text_key(self) -> tuple:
+        """
+        :return: Параметры, от которых зависит изображение текста.
+        """
+        return self.text, self.font, tuple(self.color)
+
     def _render_text(self) -> pg.Surface:
-        return self.font.render(self.text, True, self.color)
+        return TextCache.render(self.font, self.text, self.color)
 
     @property
     def x(self) -> int:
@@ -51,8 +51,17 @@ class Line(BaseWidget):
         self.rect.x, self.rect.y = self.x, self.y
         return self.rect
 
+    @property
+    def opaque(self) -> True | False:
+        return self.is_opaque_color(self.color)
+
+    def alpha_reason(self) -> str:
+        if not self.opaque:
+            return "полупрозрачный цвет"
+        return super(Line, self).alpha_reason()
+
     def _render(self) -> pg.Surface:
-        image = pg.Surface(self.rect.size, pg.SRCALPHA, 32).convert_alpha()
+        image = self._create_image(self.rect.size)
         pg.draw.rect(image, self.color, image.get_rect())
         return image
 
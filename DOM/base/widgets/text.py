@@ -6,6 +6,8 @@ import pygame as pg
 
 from .label import Label
 from ..anchor import Anchor
+from ..text_cache import TextCache
+from ..text_layout import TextLayout
 
 if ty.TYPE_CHECKING:
     from ..types import CordFunction
@@ -30,7 +32,7 @@ class Text(Label):
         anchor: Anchor = Anchor.left,
         border_color: pg.Color = pg.Color(255, 255, 255),
         border_width: int = 0,
-        soft_split: True | False = False
+        soft_split: True | False = False,
     ):
         """
         Виджет многострочного текста.
@@ -74,54 +76,42 @@ class Text(Label):
             border_width=border_width,
         )
 
+    def _text_key(self) -> tuple:
+        return (
+            *super(Text, self)._text_key(),
+            self.width,
+            self.anchor,
+            self._soft_split,
+        )
+
     def _render_text(self) -> pg.Surface:
         # Разделяет текст на строки, которые не выходят за рамку родительского виджета
-        text = self.text.splitlines()
-        lines = []
-        for line in text:
-            if self.font.size(line)[0] <= self.width:
-                lines.append(self.font.render(line, True, self.color))
-            else:
-                if self._soft_split:
-                    words = line.split()
-                    _line = words[0]
-                    for word in words[1:]:
-                        if self.font.size(_line + " " + word)[0] > self.width:
-                            lines.append(self.font.render(_line, True, self.color))
-                            _line = ""
-                        _line += " " + word
-                        _line = _line.strip()
-                    if len(_line):
-                        lines.append(self.font.render(_line, True, self.color))
-                else:
-                    _line = line[0]
-                    for char in line:
-                        if self.font.size(_line + char)[0] > self.width:
-                            lines.append(self.font.render(_line, True, self.color))
-                            _line = ""
-                        _line += char
-                    if len(_line):
-                        lines.append(self.font.render(_line, True, self.color))
+        lines = [
+            TextCache.render(self.font, line, self.color)
+            for line in TextLayout.wrap(
+                self.font, self.text, self.width, self._soft_split
+            )
+        ]
 
         image = pg.Surface(
             (
-                max(line.get_width() for line in lines),
+                max((line.get_width() for line in lines), default=0),
                 sum(line.get_height() for line in lines),
             ),
             pg.SRCALPHA,
             32,
         ).convert_alpha()
+        container = image.get_rect()
+        blits = []
         y = 0
         for line in lines:
             x = Anchor.prepare(
                 obj=line.get_rect(),
-                container=image.get_rect(),
+                container=container,
                 anchor=self.anchor,
             )[0]
-            image.blit(
-                source=line,
-                dest=(x, y),
-            )
+            blits.append((line, (x, y)))
             y += line.get_height()
+        image.blits(blits, doreturn=False)
 
         return image
@@ -13,6 +13,8 @@ if ty.TYPE_CHECKING:
 
 
 class WidgetsGroup(Group, BaseWidget):
+    event_types = ()
+
     def __init__(
         self,
         parent: Group | None,
@@ -94,30 +96,58 @@ class WidgetsGroup(Group, BaseWidget):
         self.rect.x, self.rect.y = self.x, self.y
         return self.rect
 
+    @property
+    def opaque(self) -> True | False:
+        """
+        :return: True - фон и обводка непрозрачны.
+        """
+        return self._background_alpha_reason() is None
+
+    def alpha_reason(self) -> str:
+        return self._background_alpha_reason() or BaseWidget.alpha_reason(self)
+
     def _render(self) -> pg.Surface:
         size = tuple(
             n - self.padding * 2 - self.border_width * 2 for n in self.rect.size
         )
-        bg_image = pg.Surface(self.rect.size, pg.SRCALPHA, 32).convert_alpha()
-        content_image = pg.Surface(size, pg.SRCALPHA, 32).convert_alpha()
+        image = self._create_image(self.rect.size)
 
         if self.background:
-            pg.draw.rect(bg_image, self.background, bg_image.get_rect())
+            pg.draw.rect(image, self.background, image.get_rect())
         if self.border_width:
-            rect = bg_image.get_rect().copy()
+            rect = image.get_rect().copy()
             rect.width -= int(self.border_width / 2)
             rect.height -= int(self.border_width / 2)
-            pg.draw.rect(bg_image, self._border_color, rect, self.border_width)
+            pg.draw.rect(image, self._border_color, rect, self.border_width)
 
-        for widget in self.objects:
-            if not isinstance(widget, Group):
-                widget.draw(content_image)
+        widgets = [
+            widget
+            for widget in self.objects
+            if not isinstance(widget, Group)
+            and hasattr(widget, "image")
+            and not widget.hidden
+        ]
 
-        rect = bg_image.get_rect()
-        rect.x = rect.y = self.padding + self.border_width
-        bg_image.blit(content_image, rect)
+        content_rect = pg.Rect((self.padding + self.border_width,) * 2, size)
+        if self.opaque:
+            # Виджеты рисуются прямо на фоне, обрезанные по области содержимого
+            image.set_clip(content_rect)
+            image.blits(
+                [
+                    (widget.image, widget.rect.move(content_rect.topleft))
+                    for widget in widgets
+                ],
+                doreturn=False,
+            )
+            image.set_clip(None)
+        else:
+            content_image = pg.Surface(size, pg.SRCALPHA, 32).convert_alpha()
+            content_image.blits(
+                [(widget.image, widget.rect) for widget in widgets], doreturn=False
+            )
+            image.blit(content_image, content_rect)
 
-        return bg_image
+        return image
 
     def update(self, *args, **kwargs) -> None:
         if hasattr(self, "_objects"):
@@ -126,12 +156,15 @@ class WidgetsGroup(Group, BaseWidget):
             BaseWidget.update(self, *args, **kwargs)
 
     def draw(self, surface: pg.Surface) -> None:
+        Group.draw(self, surface)
+
+    def collect_blits(self, blits: list[tuple[pg.Surface, pg.Rect]]) -> None:
         if not self.hidden:
             if hasattr(self, "image"):
-                surface.blit(self.image, self.get_global_rect())
+                blits.append((self.image, self.get_global_rect()))
                 for obj in self.objects:
                     if isinstance(obj, Group):
-                        obj.draw(surface)
+                        obj.collect_blits(blits)
 
     def handle_event(self, event: pg.event.Event) -> None:
         if hasattr(self, "_objects"):
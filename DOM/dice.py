@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import math
+import os
 import typing as ty
+from collections import OrderedDict
 from dataclasses import dataclass
 from inspect import isfunction
 
 import pygame as pg
 
+from base.animation import Timeline, Tween
 from base.events import BaseEvent
 from base.group import Group
 from base.widget import BaseWidget
@@ -35,6 +38,254 @@ RIGHT = "right"
 BOTTOM = "bottom"
 
 
+# Направления вращения (номера команд сервера)
+RIGHT_MOVE, LEFT_MOVE, DOWN_MOVE, UP_MOVE = range(4)
+# Направление: (ось, знак смещения, точки уходящей грани со стороны движения)
+ROTATIONS = (
+    (0, 1, (2, 3)),
+    (0, -1, (0, 1)),
+    (1, 1, (1, 2)),
+    (1, -1, (0, 3)),
+)
+
+Polygon = list[list[float]]  # Углы грани: левый верхний, левый нижний, ...
+
+
+def rotation_corners(width: int, speed: float, direction: int) -> list[list[Polygon]]:
+    """
+    Положения граней на каждом кадре вращения кости.
+    :param width: Ширина кости.
+    :param speed: Скорость вращения (смещение грани за кадр).
+    :param direction: Направление вращения.
+    :return: Кадры вращения: [уходящая грань, появляющаяся грань].
+    """
+    ul, ur, dl, dr = (
+        [10, 10],
+        [width + 10, 10],
+        [10, width + 10],
+        [width + 10, width + 10],
+    )
+    outgoing = [ul, dl, dr, ur]
+    incoming = (
+        [ul, dl, dl, ul],
+        [ur, dr, dr, ur],
+        [ul, ul, ur, ur],
+        [dl, dl, dr, dr],
+    )[direction]
+    polygons = [
+        [point.copy() for point in outgoing],
+        [point.copy() for point in incoming],
+    ]
+    axis, sign, front = ROTATIONS[direction]
+    back = tuple(i for i in range(4) if i not in front)
+    shift = (math.sqrt(2) - 1) * speed
+
+    def step(half: int) -> None:
+        for i in front:
+            polygons[0][i][axis] += sign * half * shift
+            polygons[1][i][axis] += sign * speed
+        for i in back:
+            polygons[0][i][axis] += sign * speed
+            polygons[1][i][axis] -= sign * half * shift
+
+    frames = [[[point.copy() for point in polygon] for polygon in polygons]]
+    counter = 0
+    while speed > 0:
+        # Первую половину оборота грань уходит, вторую - появляется
+        if counter < width / 2:
+            step(1)
+            counter += speed
+        if width / 2 <= counter < width:
+            step(-1)
+            counter += speed
+        if counter >= width:
+            break
+        frames.append([[point.copy() for point in polygon] for polygon in polygons])
+    return frames
+
+
+def polygon_size(polygon: Polygon) -> tuple[int, int]:
+    """
+    :param polygon: Углы грани.
+    :return: Размер изображения грани.
+    """
+    return (
+        round(abs(polygon[0][0] - polygon[2][0])) + 1,
+        round(abs(polygon[0][1] - polygon[2][1])) + 1,
+    )
+
+
+class DiceFrames:
+    """
+    Кэш кадров вращения кости с вытеснением давно не использованных (LRU).
+    Кадры вращения с грани на грань строятся один раз для набора граней
+    и размера кости и переиспользуются всеми бросками. При смене размера
+    кости (разрешения) кадры прежнего размера удаляются.
+    Объем кэша ограничен переменной окружения DICE_FRAMES_CACHE_SIZE (в байтах).
+    Кадры из кэша нельзя изменять.
+    """
+
+    _widths: dict[str, int] = {}  # Окружение граней -> размер кости
+    _facets: dict[tuple[str, int], list[pg.Surface]] = {}
+    _rest: dict[tuple[str, int, int], pg.Surface] = {}
+    _rotations: OrderedDict[tuple, list[pg.Surface]] = OrderedDict()
+    _size = 0  # Объем кадров вращения в кэше (в байтах)
+
+    # Метрики
+    hits = 0  # Кол-во вращений, найденных в кэше
+    misses = 0  # Кол-во построенных вращений
+    evictions = 0  # Кол-во вытесненных вращений
+
+    @staticmethod
+    def budget() -> int:
+        """
+        :return: Максимальный объем кэша (в байтах).
+        """
+        return int(os.environ.get("DICE_FRAMES_CACHE_SIZE", 32 * 1024 * 1024))
+
+    @classmethod
+    def facets(cls, files_namespace: str, width: int) -> list[pg.Surface]:
+        """
+        :param files_namespace: Окружение, в котором находятся изображения граней.
+        :param width: Ширина кости.
+        :return: Изображения граней.
+        """
+        if cls._widths.get(files_namespace, width) != width:
+            cls._forget(files_namespace)
+        cls._widths[files_namespace] = width
+        if (facets := cls._facets.get((files_namespace, width))) is None:
+            facets = cls._facets[(files_namespace, width)] = [
+                load_image(f"{i}.png", namespace=files_namespace, size=(width, width))
+                for i in [1, 2, 3, 3, 2, 4]
+            ]
+        return facets
+
+    @classmethod
+    def rest(cls, files_namespace: str, width: int, facet: int) -> pg.Surface:
+        """
+        :param files_namespace: Окружение, в котором находятся изображения граней.
+        :param width: Ширина кости.
+        :param facet: Грань.
+        :return: Изображение неподвижной кости.
+        """
+        key = (files_namespace, width, facet)
+        if (image := cls._rest.get(key)) is None:
+            square = [
+                [10, 10],
+                [10, width + 10],
+                [width + 10, width + 10],
+                [width + 10, 10],
+            ]
+            image = cls._rest[key] = cls._render(
+                cls.facets(files_namespace, width), width, [(facet, square)]
+            )
+        return image
+
+    @classmethod
+    def rotation(
+        cls,
+        files_namespace: str,
+        width: int,
+        from_facet: int,
+        to_facet: int,
+        direction: int,
+        speed: float,
+    ) -> list[pg.Surface]:
+        """
+        :param files_namespace: Окружение, в котором находятся изображения граней.
+        :param width: Ширина кости.
+        :param from_facet: Уходящая грань.
+        :param to_facet: Появляющаяся грань.
+        :param direction: Направление вращения.
+        :param speed: Скорость вращения.
+        :return: Кадры вращения.
+        """
+        key = (files_namespace, width, from_facet, to_facet, direction, speed)
+        if (frames := cls._rotations.get(key)) is not None:
+            cls._rotations.move_to_end(key)
+            cls.hits += 1
+            return frames
+
+        facets = cls.facets(files_namespace, width)
+        frames = cls._rotations[key] = [
+            cls._render(facets, width, zip((from_facet, to_facet), polygons))
+            for polygons in rotation_corners(width, speed, direction)
+        ]
+        cls._size += cls._frames_size(frames)
+        cls.misses += 1
+
+        budget = cls.budget()
+        while cls._size > budget and len(cls._rotations) > 1:
+            _, old = cls._rotations.popitem(last=False)
+            cls._size -= cls._frames_size(old)
+            cls.evictions += 1
+        return frames
+
+    @staticmethod
+    def _render(
+        facets: list[pg.Surface],
+        width: int,
+        polygons: ty.Iterable[tuple[int, Polygon]],
+    ) -> pg.Surface:
+        """
+        :param facets: Изображения граней.
+        :param width: Ширина кости.
+        :param polygons: Грани и их углы.
+        :return: Кадр.
+        """
+        image = pg.Surface((width + 20, width + 20), pg.SRCALPHA, 32).convert_alpha()
+        image.blits(
+            [
+                (pg.transform.scale(facets[facet], polygon_size(polygon)), polygon[0])
+                for facet, polygon in polygons
+            ],
+            doreturn=False,
+        )
+        return image
+
+    @staticmethod
+    def _frames_size(frames: list[pg.Surface]) -> int:
+        """
+        :return: Объем кадров (в байтах).
+        """
+        return sum(frame.get_pitch() * frame.get_height() for frame in frames)
+
+    @classmethod
+    def _forget(cls, files_namespace: str) -> None:
+        """
+        Удаляет кадры набора граней.
+        :param files_namespace: Окружение, в котором находятся изображения граней.
+        """
+        for cache in (cls._facets, cls._rest, cls._rotations):
+            for key in [key for key in cache if key[0] == files_namespace]:
+                if cache is cls._rotations:
+                    cls._size -= cls._frames_size(cache[key])
+                del cache[key]
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._widths.clear()
+        cls._facets.clear()
+        cls._rest.clear()
+        cls._rotations.clear()
+        cls._size = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """
+        :return: Метрики кэша.
+        """
+        return {
+            "rotations": len(cls._rotations),
+            "frames": sum(len(frames) for frames in cls._rotations.values()),
+            "bytes": cls._size,
+            "budget": cls.budget(),
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "evictions": cls.evictions,
+        }
+
+
 class Dice(BaseWidget):
     def __init__(
         self,
@@ -46,13 +297,15 @@ class Dice(BaseWidget):
         y: int | CordFunction,
         width: int,
         files_namespace: str,
+        rotation_time: float = 0.15,
     ):
         """
         Виджет кости.
         Реализует визуализацию вращения кости.
+        Кадры вращения берутся из DiceFrames.
         :param parent: Объект к которому принадлежит виджет.
         :param name: Название объекта.
-        :param speed: Скорость вращения.
+        :param speed: Смещение грани между кадрами вращения.
         :param x: Координата x.
         :type x: Число или функция вычисляющая координату.
         :param y: Координата y.
@@ -60,23 +313,13 @@ class Dice(BaseWidget):
         :param width: Ширина виджета.
         :type width: Число или функция вычисляющая ширину.
         :param files_namespace: Окружение, в котором находятся изображения граней.
+        :param rotation_time: Длительность поворота на одну грань (в секундах).
         """
         self._x = x
         self._y = y
         self._width = width
         self._speed = speed
-
-        self.facets = [
-            load_image(f"{i}.png", namespace=files_namespace, size=(width, width))
-            for i in [1, 2, 3, 3, 2, 4]
-        ]  # Изображения граней
-        # Триггер движения
-        # [True, False, False, False] - right move
-        # [False, True, False, False] - left move
-        # [False, False, True, False] - down move
-        # [False, False, False, Top] - up move
-        self.rotations_triggers = [False, False, False, False]
-        self.counters = [0, 0]  # Показатели поворота
+        self.files_namespace = files_namespace
 
         self.graph = [
             [4, 1, 3, 2],
@@ -86,214 +329,112 @@ class Dice(BaseWidget):
             [5, 0, 3, 2],
             [1, 4, 3, 2],
         ]
-        self.visible_images = [0]
-        self.move_stack = []  # Хранилище движений
+        self.rotation_time = rotation_time
+        self.facet = 0  # Видимая грань
+        self.target_facet = 0  # Грань после вращения
+        self.rotation: list[pg.Surface] | None = None  # Кадры текущего броска
+        self.frame = 0  # Номер кадра текущего броска
+        self.tween: Tween | None = None  # Анимация текущего броска
+        self.changed = False  # True - изображение нужно перерисовать
 
         self.rect = self._get_rect()
-        self._re_corners()
-        self.visible_corners = [self.all_corners[0].copy()]
         self.image = self._render()
 
         self.in_move = False
 
         super(Dice, self).__init__(parent, name)
 
-    def _restart(self) -> None:
-        self.visible_images = [0]
-        self.rotations_triggers = [False, False, False, False]
-        self._re_corners()
-        self.visible_corners = [self.all_corners[0].copy()]
-        self.counters = [0, 0]
-        self.move_stack.clear()
-
-    def _re_corners(self) -> None:
-        ul, ur, dl, dr = (
-            [10, 10],
-            [self.width + 10, 10],
-            [10, self.width + 10],
-            [self.width + 10, self.width + 10],
+    def _rotation(
+        self, from_facet: int, to_facet: int, direction: int
+    ) -> list[pg.Surface]:
+        """
+        :param from_facet: Уходящая грань.
+        :param to_facet: Появляющаяся грань.
+        :param direction: Направление вращения.
+        :return: Кадры вращения.
+        """
+        return DiceFrames.rotation(
+            self.files_namespace,
+            self.width,
+            from_facet,
+            to_facet,
+            direction,
+            self.speed,
         )
-        self.all_corners = [
-            [ul.copy(), dl.copy(), dr.copy(), ur.copy()],
-            [ul.copy(), dl.copy(), dl.copy(), ul.copy()],
-            [ur.copy(), dr.copy(), dr.copy(), ur.copy()],
-            [ul.copy(), ul.copy(), ur.copy(), ur.copy()],
-            [dl.copy(), dl.copy(), dr.copy(), dr.copy()],
-        ]
 
-    def move_left(self) -> None:
-        self.visible_corners.append(self.all_corners[2].copy())
-        self.rotations_triggers[1] = True
-
-    def move_right(self) -> None:
-        self.visible_corners.append(self.all_corners[1].copy())
-        self.rotations_triggers[0] = True
-
-    def move_up(self) -> None:
-        self.visible_corners.append(self.all_corners[4].copy())
-        self.rotations_triggers[3] = True
-
-    def move_down(self) -> None:
-        self.visible_corners.append(self.all_corners[3].copy())
-        self.rotations_triggers[2] = True
+    def _restart(self) -> None:
+        if self.tween is not None:
+            Timeline.cancel(self.tween)
+            self.tween = None
+        self.facet = 0
+        self.rotation = None
+        self.frame = 0
 
     def update(self) -> ty.Optional[True]:
-        if not hasattr(self, "rotations_triggers"):
+        if not self.__dict__.get("changed"):
             return
+        self.changed = False
+        super(Dice, self).update()
+        return True
 
-        if self.rotations_triggers[0]:
-            if self.counters[0] < self.width / 2:
-                self.visible_corners[0][2][0] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][3][0] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][0][0] += 1 * self.speed
-                self.visible_corners[0][1][0] += 1 * self.speed
-                self.visible_corners[1][0][0] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][1][0] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][2][0] += 1 * self.speed
-                self.visible_corners[1][3][0] += 1 * self.speed
-                self.counters[0] += 1 * self.speed
-            if self.width / 2 <= self.counters[0] < self.width:
-                self.visible_corners[0][2][0] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][3][0] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][0][0] += 1 * self.speed
-                self.visible_corners[0][1][0] += 1 * self.speed
-                self.visible_corners[1][0][0] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][1][0] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][2][0] += 1 * self.speed
-                self.visible_corners[1][3][0] += 1 * self.speed
-                self.counters[0] += 1 * self.speed
-            if self.counters[0] >= self.width:
-                self.rotations_triggers[0] = False
-                self.visible_corners = self.visible_corners[1::]
-                self.visible_images = self.visible_images[1::]
-                self.counters[0] = 0
-                self._re_corners()
-        elif self.rotations_triggers[1]:
-            if self.counters[0] < self.width / 2:
-                self.visible_corners[0][0][0] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][1][0] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][2][0] -= 1 * self.speed
-                self.visible_corners[0][3][0] -= 1 * self.speed
-                self.visible_corners[1][2][0] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][3][0] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][0][0] -= 1 * self.speed
-                self.visible_corners[1][1][0] -= 1 * self.speed
-                self.counters[0] += 1 * self.speed
-            if self.width / 2 <= self.counters[0] < self.width:
-                self.visible_corners[0][0][0] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][1][0] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][2][0] -= 1 * self.speed
-                self.visible_corners[0][3][0] -= 1 * self.speed
-                self.visible_corners[1][2][0] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][3][0] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][0][0] -= 1 * self.speed
-                self.visible_corners[1][1][0] -= 1 * self.speed
-                self.counters[0] += 1 * self.speed
-            if self.counters[0] >= self.width:
-                self.rotations_triggers[1] = False
-                self.visible_corners = self.visible_corners[1::]
-                self.visible_images = self.visible_images[1::]
-                self.counters[0] = 0
-                self._re_corners()
-        elif self.rotations_triggers[2]:
-            if self.counters[0] < self.width / 2:
-                self.visible_corners[0][1][1] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][2][1] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][0][1] += 1 * self.speed
-                self.visible_corners[0][3][1] += 1 * self.speed
-                self.visible_corners[1][0][1] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][3][1] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][1][1] += 1 * self.speed
-                self.visible_corners[1][2][1] += 1 * self.speed
-                self.counters[0] += 1 * self.speed
-            if self.width / 2 <= self.counters[0] < self.width:
-                self.visible_corners[0][1][1] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][2][1] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][0][1] += 1 * self.speed
-                self.visible_corners[0][3][1] += 1 * self.speed
-                self.visible_corners[1][0][1] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][3][1] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][1][1] += 1 * self.speed
-                self.visible_corners[1][2][1] += 1 * self.speed
-                self.counters[0] += 1 * self.speed
-            if self.counters[0] >= self.width:
-                self.rotations_triggers[2] = False
-                self.visible_corners = self.visible_corners[1::]
-                self.visible_images = self.visible_images[1::]
-                self.counters[0] = 0
-                self._re_corners()
-        elif self.rotations_triggers[3]:
-            if self.counters[0] < self.width / 2:
-                self.visible_corners[0][0][1] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][3][1] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][1][1] -= 1 * self.speed
-                self.visible_corners[0][2][1] -= 1 * self.speed
-                self.visible_corners[1][1][1] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][2][1] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][0][1] -= 1 * self.speed
-                self.visible_corners[1][3][1] -= 1 * self.speed
-                self.counters[0] += 1 * self.speed
-            if self.width / 2 <= self.counters[0] < self.width:
-                self.visible_corners[0][0][1] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][3][1] += (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[0][1][1] -= 1 * self.speed
-                self.visible_corners[0][2][1] -= 1 * self.speed
-                self.visible_corners[1][1][1] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][2][1] -= (math.sqrt(2) - 1) * self.speed
-                self.visible_corners[1][0][1] -= 1 * self.speed
-                self.visible_corners[1][3][1] -= 1 * self.speed
-                self.counters[0] += 1 * self.speed
-            if self.counters[0] >= self.width:
-                self.rotations_triggers[3] = False
-                self.visible_corners = self.visible_corners[1::]
-                self.visible_images = self.visible_images[1::]
-                self.counters[0] = 0
-                self._re_corners()
-        elif (
-            self.rotations_triggers == [False, False, False, False]
-            and len(self.move_stack) > 0
-        ):
-            self.next_moving()
-
-        if any(self.rotations_triggers):
-            self.in_move = True
-            super(Dice, self).update()
-            return True
-
-        if not len(self.move_stack):
-            if self.in_move:
-                self.in_move = False
-                super(Dice, self).update()
-                DiceMovingStop(self).post()
-                return True
+    @property
+    def animating(self) -> True | False:
+        """
+        :return: True - кость вращается.
+        """
+        return self.tween is not None
 
     def move_from_list(self, data: list[tuple[int, int]]) -> None:
         """
         Вращение кости по данным с сервера.
-        :param data: Список команд.
+        Кадры всех вращений строятся заранее и показываются по времени:
+        каждое вращение длится rotation_time секунд при любой частоте кадров.
+        :param data: Список команд: (направление, грань с 1).
         """
         self._restart()
-        stacks = [
-            [True, False, False, False],
-            [False, True, False, False],
-            [False, False, True, False],
-            [False, False, False, True],
-        ]
+        frames = []
+        facet = self.facet
+        for direction, number in data:
+            frames += self._rotation(facet, number - 1, direction)
+            facet = number - 1
+        self.target_facet = facet
+
+        if not frames:
+            if self.in_move:
+                self._stop()
+            return
+        self.rotation = frames
+        self.in_move = True
+        self.changed = True
+        self.tween = Timeline.add(
+            Tween(
+                self.rotation_time * len(data),
+                self._show_frame,
+                end=len(frames),
+                on_finish=self._stop,
+            )
+        )
 
-        self.move_stack = [[stacks[i[0]], i[1]] for i in data]
-
-    def next_moving(self) -> None:
-        current = self.move_stack.pop(0)
-        self.visible_images.append(current[-1] - 1)
-        current = current[0]
-        if current[0]:
-            self.move_right()
-        if current[1]:
-            self.move_left()
-        if current[2]:
-            self.move_down()
-        if current[3]:
-            self.move_up()
+    def _show_frame(self, value: float) -> None:
+        """
+        :param value: Номер кадра вращения.
+        """
+        frame = min(int(value), len(self.rotation) - 1)
+        if frame != self.frame:
+            self.frame = frame
+            self.changed = True
+
+    def _stop(self) -> None:
+        """
+        Завершает вращение.
+        """
+        self.facet = self.target_facet
+        self.rotation = None
+        self.frame = 0
+        self.tween = None
+        self.in_move = False
+        self.changed = True
+        DiceMovingStop(self).post()
 
     def _get_rect(self) -> pg.Rect:
         self.rect = pg.Rect(0, 0, self.width + 20, self.width + 20)
@@ -301,25 +442,9 @@ class Dice(BaseWidget):
         return self.rect
 
     def _render(self) -> pg.Surface:
-        def get_size(polygon_: list[list[int]]) -> tuple[int, int]:
-            return (
-                round(abs(polygon_[0][0] - polygon_[2][0])) + 1,
-                round(abs(polygon_[0][1] - polygon_[2][1])) + 1,
-            )
-
-        image = pg.Surface(self.rect.size, pg.SRCALPHA, 32).convert_alpha()
-        corners = (
-            self.visible_corners
-            if self.__dict__.get("in_move")
-            else [max(self.visible_corners, key=lambda poly: get_size(poly))]
-        )
-        for i, polygon in enumerate(corners):
-            dsize = get_size(polygon)
-            image.blit(
-                pg.transform.scale(self.facets[self.visible_images[i]], dsize),
-                polygon[0],
-            )
-        return image
+        if self.__dict__.get("in_move") and self.rotation is not None:
+            return self.rotation[self.frame]
+        return DiceFrames.rest(self.files_namespace, self.width, self.facet)
 
     @property
     def speed(self) -> float:
@@ -0,0 +1,71 @@
+"""
+
+Индекс игрового поля.
+Строится один раз при инициализации уровня.
+
+"""
+
+from __future__ import annotations
+
+import typing as ty
+
+if ty.TYPE_CHECKING:
+    from .tools import Cord, Field
+
+
+class GridIndex:
+    def __init__(self, field: Field):
+        """
+        Компактное представление поля.
+        :param field: Поле: список строк, True - клетка пола, False - стена.
+        """
+        self.height = len(field)
+        self.width = len(field[0])
+
+        # 1 - клетка пола, 0 - стена. Клетке (y, x) соответствует байт y * width + x
+        self.cells = bytearray(cell is True for line in field for cell in line)
+        # Строки поля в виде битовых масок. Клетке x соответствует бит x
+        self.rows: list[int] = [
+            sum(1 << x for x, cell in enumerate(line) if cell is True) for line in field
+        ]
+        # Выход с уровня - первая клетка пола в последней строке
+        self.finish: Cord | None = next(
+            ((self.height - 1, x) for x in range(self.width) if self.rows[-1] >> x & 1),
+            None,
+        )
+
+    def is_walkable(self, y: int, x: int) -> True | False:
+        """
+        :param y: y координата клетки.
+        :param x: x координата клетки.
+        :return: True - клетка существует и является клеткой пола.
+        """
+        return (
+            0 <= y < self.height
+            and 0 <= x < self.width
+            and self.cells[y * self.width + x] == 1
+        )
+
+    def get_mask(
+        self, top: int = 0, left: int = 0, bottom: int = None, right: int = None
+    ) -> tuple[int, int]:
+        """
+        Переводит прямоугольную часть поля в битовую маску клеток пола.
+        Клетке (top + y, left + x) соответствует бит y * stride + x.
+        Каждая строка дополнена одной непроходимой клеткой справа,
+        поэтому сдвиг маски на 1 бит не переносит клетки между строками.
+        :param top: Первая строка.
+        :param left: Первый столбец.
+        :param bottom: Строка, следующая за последней.
+        :param right: Столбец, следующий за последним.
+        :return: Маска и длина строки в битах (stride).
+        """
+        top, left = max(top, 0), max(left, 0)
+        bottom = self.height if bottom is None else min(bottom, self.height)
+        right = self.width if right is None else min(right, self.width)
+        stride = right - left + 1
+        row_mask = (1 << (right - left)) - 1
+        mask = 0
+        for y, row in enumerate(self.rows[top:bottom]):
+            mask |= (row >> left & row_mask) << (y * stride)
+        return mask, stride
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 
 from .boss import Boss
 from .enemy import Enemy
+from .grid import GridIndex
 from .item import Item
 from .player import Player
 
@@ -33,6 +34,7 @@ class Room:
         self.move_data: Move = ...
 
         self.field: list[list[True | False]] = ...
+        self.grid: GridIndex = ...  # Индекс поля, строится вместе с уровнем
         self.location_name: str = ...
         self.location: list[list[int]] = ...
         self.shop: list[Item | None] = ...
@@ -84,6 +86,7 @@ class Room:
     ) -> None:
         self.lvl = lvl
         self.field = field
+        self.grid = GridIndex(field)
         self.location_name = location_name
         self.location = location
         self.shop = [Item(**item) if item else None for item in shop]
@@ -3,10 +3,13 @@ from __future__ import annotations
 import typing as ty
 
 if ty.TYPE_CHECKING:
+    from .grid import GridIndex
+
     Cord = tuple[int, int]  # y, x
     Cords = list[Cord, ...]
     Line = list[True | False]
     Field = list[Line]
+    Predecessors = dict[Cord, Cord | None]
 
 
 def get_all_neighboring_cords(y: int, x: int) -> Cords:
@@ -41,26 +44,19 @@ def get_neighboring_cords(y: int, x: int) -> Cords:
 
 
 def get_neighboring(
-    field_: Field,
+    grid: GridIndex,
     cords: Cords,
 ) -> Line:
     """
-    :param field_: Поле, с которым нужно работать.
+    :param grid: Индекс поля, с которым нужно работать.
     :param cords: Список координат клеток.
     :return: Возвращает список со значениями клеток.
     """
-    w, h = len(field_[0]), len(field_) - 1
-    neighboring = []
-    for c in cords:
-        if 0 <= c[0] <= h and 0 <= c[1] < w:
-            neighboring.append(field_[c[0]][c[1]])
-        else:
-            neighboring.append(False)
-    return neighboring
+    return [grid.is_walkable(*c) for c in cords]
 
 
 def get_ways(
-    branch: Cord, length: int, field: Field, way: set[Cord] = ()
+    branch: Cord, length: int, field: GridIndex, way: set[Cord] = ()
 ) -> list[Cords]:
     ways: list[Cords] = []
     way = [] if isinstance(way, tuple) else way
@@ -92,3 +88,97 @@ def get_ways(
     ways.append(way)
 
     return ways
+
+
+def get_reachable(
+    start: Cord,
+    steps: int,
+    grid: GridIndex,
+    *,
+    predecessors: True | False = False,
+) -> set[Cord] | Predecessors:
+    """
+    Поиск клеток, до которых можно дойти не более чем за steps шагов.
+    Поиск в ширину по битовой маске: за один шаг фронт сдвигается
+    во все 4 стороны сразу. Маска строится только для квадрата
+    со стороной 2 * steps + 1 вокруг start, поэтому время работы
+    не зависит от размера поля.
+    :param start: Клетка, с которой начинается движение.
+    :param steps: Максимальное кол-во шагов.
+    :param grid: Индекс поля.
+    :param predecessors: True - вернуть словарь предшественников.
+    :return: Множество достижимых клеток (включая start) или, при predecessors=True,
+        словарь: клетка -> клетка, из которой в нее пришли (None для start).
+        Путь до клетки восстанавливается функцией get_path.
+    """
+    top, left = max(start[0] - steps, 0), max(start[1] - steps, 0)
+    walkable, stride = grid.get_mask(
+        top, left, start[0] + steps + 1, start[1] + steps + 1
+    )
+
+    def to_cord(index: int) -> Cord:
+        y, x = divmod(index, stride)
+        return top + y, left + x
+
+    start_index = (start[0] - top) * stride + start[1] - left
+    frontier = visited = 1 << start_index
+
+    layers = [frontier]
+    for _ in range(steps):
+        frontier = (
+            (
+                (frontier << 1)
+                | (frontier >> 1)
+                | (frontier << stride)
+                | (frontier >> stride)
+            )
+            & walkable
+            & ~visited
+        )
+        if not frontier:
+            break
+        visited |= frontier
+        layers.append(frontier)
+
+    if not predecessors:
+        return {to_cord(index) for index in _iter_bits(visited)}
+
+    result: Predecessors = {tuple(start): None}
+    previous = {start_index}
+    for layer in layers[1:]:
+        current = set(_iter_bits(layer))
+        for index in current:
+            for neighbor in (index - stride, index - 1, index + 1, index + stride):
+                if neighbor in previous:
+                    result[to_cord(index)] = to_cord(neighbor)
+                    break
+        previous = current
+    return result
+
+
+def get_path(predecessors: Predecessors, cord: Cord) -> Cords:
+    """
+    :param predecessors: Словарь предшественников из get_reachable.
+    :param cord: Конечная клетка пути.
+    :return: Кратчайший путь от начальной клетки до cord включительно
+        или пустой список, если клетка недостижима.
+    """
+    cord = tuple(cord)
+    if cord not in predecessors:
+        return []
+    path = []
+    while cord is not None:
+        path.append(cord)
+        cord = predecessors[cord]
+    return path[::-1]
+
+
+def _iter_bits(mask: int) -> ty.Iterator[int]:
+    """
+    :param mask: Битовая маска.
+    :return: Номера установленных битов.
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
@@ -8,23 +8,47 @@ from __future__ import annotations
 
 import math
 import os
-import time
 import typing as ty
 from dataclasses import dataclass
 
 import pygame as pg
 
-from base import WidgetsGroup, Group, Label, Alert, Button, Anchor, Line, Text, Thread
+from base import (
+    FontRegistry,
+    HitGrid,
+    WidgetsGroup,
+    Group,
+    Label,
+    Alert,
+    Button,
+    Anchor,
+    Line,
+    Text,
+    Inbox,
+    RunLoop,
+    Timeline,
+    Tween,
+    Expiry,
+)
+from base.animation import ease_out
 from base.events import ButtonClickEvent
 from base.widget import BaseWidget
 from database.field_types import Resolution
+from atlas import TextureAtlas
 from dice import Dice, DiceMovingStop
-from game.tools import get_ways
+from game.tools import get_reachable
 from settings_alert import Settings
-from utils import load_image, FinishStatus, InfoAlert, DropMenu, LoadingScreen
+from utils import (
+    load_image,
+    FinishStatus,
+    InfoAlert,
+    DropMenu,
+    LoadingScreen,
+    ImageCache,
+)
 
 if ty.TYPE_CHECKING:
-    from game.tools import Cords, Cord
+    from game.tools import Cord
     from network import NetworkClient
     from game.player import Player
     from game.item import Item
@@ -37,6 +61,8 @@ if ty.TYPE_CHECKING:
 
 
 class MyQueueAlert(DropMenu):
+    event_types = (pg.MOUSEBUTTONDOWN,)
+
     def __init__(self, parent: WidgetsGroup):
         resolution = Resolution.converter(os.environ["resolution"])
         font_size = int(os.environ["font_size"])
@@ -61,7 +87,7 @@ class MyQueueAlert(DropMenu):
             ),
             y=0,
             text="Ваш ход",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         self.pos = (
@@ -128,7 +154,7 @@ class GameOverStatistic(WidgetsGroup):
             y=0,
             width=self.rect.width - self.padding * 2,
             text=username,
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             anchor=Anchor.center,
         )
 
@@ -144,7 +170,7 @@ class GameOverStatistic(WidgetsGroup):
                     y=y,
                     width=self.rect.width - self.padding * 2,
                     text=f"{self.eng_rus[key]}:  {value}",
-                    font=pg.font.Font(font, round(font_size * 0.8)),
+                    font=FontRegistry.get(font, round(font_size * 0.8)),
                     anchor=Anchor.center,
                 )
             )
@@ -182,7 +208,7 @@ class GameOverAlert(Alert):
             y=0,
             width=self.rect.width - self.padding * 2,
             text="Игра окончена",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             anchor=Anchor.center,
         )
 
@@ -204,7 +230,7 @@ class GameOverAlert(Alert):
             text="Выйти",
             padding=5,
             active_background=pg.Color("gray"),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             anchor=Anchor.center,
             border_width=2,
             callback=lambda event: (
@@ -262,7 +288,7 @@ class EscMenu(Alert):
             y=0,
             width=self.rect.width,
             text="Меню",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             anchor=Anchor.center,
         )
 
@@ -275,7 +301,7 @@ class EscMenu(Alert):
             text="Продолжить",
             padding=5,
             active_background=pg.Color("gray"),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             anchor=Anchor.center,
             border_width=2,
             callback=lambda event: self.hide(),
@@ -290,7 +316,7 @@ class EscMenu(Alert):
             text="Настройки",
             padding=5,
             active_background=pg.Color("gray"),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             anchor=Anchor.center,
             border_width=2,
             callback=lambda event: self.settings.show(),
@@ -305,7 +331,7 @@ class EscMenu(Alert):
             text="Выйти",
             padding=5,
             active_background=pg.Color("gray"),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             anchor=Anchor.center,
             border_width=2,
             callback=lambda event: (
@@ -319,6 +345,8 @@ class EscMenu(Alert):
 
 
 class ItemDropMenu(DropMenu):
+    event_types = (pg.MOUSEBUTTONDOWN,)
+
     def __init__(self, parent: PlayerWidget, can_remove: True | False):
         """
         Выпадающее меню для предметов.
@@ -355,7 +383,7 @@ class ItemDropMenu(DropMenu):
                 text="Продать",
                 padding=5,
                 active_background=pg.Color("gray"),
-                font=pg.font.Font(font, font_size),
+                font=FontRegistry.get(font, font_size),
                 anchor=Anchor.center,
                 border_width=2,
                 callback=lambda event: (
@@ -399,14 +427,18 @@ class ItemDropMenu(DropMenu):
 
 # ==== FIELD ====
 
+# Клавиши прокрутки поля: клавиша -> направление (в клетках)
+SCROLL_KEYS = {
+    pg.K_LEFT: (-1, 0),
+    pg.K_RIGHT: (1, 0),
+    pg.K_UP: (0, -1),
+    pg.K_DOWN: (0, 1),
+}
+
 
 @dataclass
 class Ping:
-    # TODO: Пинги перестают исчезать.
-    #  Возможно это связано с тем, что при изменении разрешения создается новый
-    #  Thread Filed._manage_pings
     rect: pg.Rect
-    spawn_time: int
 
 
 @dataclass
@@ -416,13 +448,20 @@ class EntityWidget:
     data: ...
     indicator: pg.Surface | None
 
+    def get_blits(self) -> tuple[tuple[pg.Surface, pg.Rect], ...]:
+        """
+        :return: Картинки сущности и их положение на поле.
+        """
+        if self.indicator is None:
+            return ((self.icon, self.rect.copy()),)
+        rect = self.rect.copy()
+        rect.x = round(rect.x + rect.w / 2 - self.indicator.get_width() / 2)
+        rect.y = rect.top - self.indicator.get_height() - 3
+        return (self.icon, self.rect.copy()), (self.indicator, rect)
+
     def blit(self, surface: pg.Surface) -> None:
-        surface.blit(self.icon, self.rect)
-        if self.indicator is not None:
-            rect = self.rect.copy()
-            rect.x = round(rect.x + rect.w / 2 - self.indicator.get_width() / 2)
-            rect.y = rect.top - self.indicator.get_height() - 3
-            surface.blit(self.indicator, rect)
+        for image, rect in self.get_blits():
+            surface.blit(image, rect)
 
 
 @dataclass
@@ -444,19 +483,38 @@ class CharacterWidget(EntityWidget):
 
 
 class Field(WidgetsGroup):
+    event_types = (pg.MOUSEWHEEL, pg.KEYDOWN)
+    min_block_size: int = 40  # Минимальный размер клетки (в пикселях)
+
     def __init__(self, parent: GameClientScreen):
         """
         Виджет поля.
+        Если поле не помещается в окно при минимальном размере клетки,
+        отображается его видимая область (камера), которую можно прокручивать
+        колесом мыши и стрелками. Камера следует за персонажем игрока,
+        пока поле не прокручено вручную (клавиша C возвращает слежение).
         :param parent: ...
         """
         font = os.environ["FONT"]
         resolution = Resolution.converter(os.environ["resolution"])
 
-        height = width = min(resolution)  # Размеры поля
+        height = width = min(resolution)  # Размеры области просмотра поля
 
         self.network_client = parent.network_client
 
-        self._field_image = pg.Surface((width, height))
+        # Итоговое изображение видимой области поля
+        self._field_image = pg.Surface((width, height)).convert()
+        # Видимая область поля (в координатах поля)
+        self._camera = pg.Rect(0, 0, width, height)
+        self._camera_target: tuple[int, int] = (0, 0)  # Конечное положение камеры
+        self._camera_tween: Tween | None = None
+        self.follow = True  # True - камера следует за персонажем игрока
+        # Отрисованные элементы поля: ключ -> (порядок отрисовки, картинки)
+        self._layers: dict[
+            tuple, tuple[tuple, tuple[tuple[pg.Surface, pg.Rect], ...]]
+        ] = {}
+        self._expired: list[pg.Rect] = []  # Области исчезнувших элементов
+        self._update_requested = False  # True - update_field ждет выполнения
 
         super(Field, self).__init__(
             parent,
@@ -469,52 +527,41 @@ class Field(WidgetsGroup):
 
         self._generate_location_map()
 
-        self._label = Label(
-            self,
-            f"{self.name}-Label",
-            x=0,
-            y=0,
-            width=width,
-            height=height,
-            sprite=self._field_image,
+        # Иконки, известные на начало уровня, упаковываются в атлас вместе
+        room = self.network_client.room
+        self.atlas.add_many(
+            dict(
+                self._load_sprite(kind, file_name)
+                for kind, file_name in (
+                    ("boss", room.boss.icon),
+                    ("ui", "indicator.png"),
+                    ("ui", "damage.png"),
+                    ("ui", "ping.png"),
+                    *(("enemy", enemy.icon) for enemy in room.enemies),
+                    *(("character", player.character.icon) for player in room.players),
+                )
+            )
         )
 
-        self._boss_image = load_image(
-            self.network_client.room.boss.icon,
-            namespace=os.environ["BOSSES_PATH"],
-            size=(None, round(self.block_height * 2)),
-            save_ratio=True,
-        )
-        if self._boss_image.get_width() == 1:
-            # TODO: remove this
-            self._boss_image = load_image(
-                "diablo.png",
-                namespace=os.environ["BOSSES_PATH"],
-                size=(None, round(self.block_height * 2)),
-                save_ratio=True,
-            )
+        self._boss_image = self.get_sprite("boss", room.boss.icon)
 
         self.boss: BossWidget = ...
         self.enemies: dict[Cord, EnemyWidget] = {}
         self.characters: dict[Cord, CharacterWidget] = {}
         self.ways: dict[Cord, pg.Rect] = {}
-        self._way_image = load_image(
-            "indicator.png",
-            namespace=os.environ["UI_ICONS_PATH"],
-            size=(round(self.block_width), round(self.block_height)),
-        )
+        self._way_image = self.get_sprite("ui", "indicator.png")
         self.hit: dict[Cord, pg.Rect] = {}
-        self._hit_image = load_image(
-            "damage.png",
-            namespace=os.environ["UI_ICONS_PATH"],
-            size=(round(self.block_width), round(self.block_height)),
+        self._hit_image = self.get_sprite("ui", "damage.png")
+        self._finish_image = self.get_sprite("ui", "indicator.png")
+        self.finish: pg.Rect = ...
+        # Сетка клеток поля: ячейка -> сущности и отметки, которые ее занимают
+        self._hits: HitGrid[tuple[str, ty.Any]] = HitGrid(
+            self.block_width, self.block_height
         )
-        self._finish_image = load_image(
-            "indicator.png",
-            namespace=os.environ["UI_ICONS_PATH"],
-            size=(round(self.block_width), round(self.block_height)),
+        # Сетка динамических элементов поля: ключи слоев по областям поля
+        self._layers_grid: HitGrid[tuple] = HitGrid(
+            self.block_width * 8, self.block_height * 8
         )
-        self.finish: pg.Rect = ...
 
         self.lvl_label = Label(
             None,
@@ -527,33 +574,29 @@ class Field(WidgetsGroup):
             border_color=pg.Color("#b9a66d"),
             border_width=3,
             padding=3,
-            font=pg.font.Font(font, round(self.block_height - 12)),
+            font=FontRegistry.get(font, round(self.block_height - 12)),
         )
 
-        self._ping_image = load_image(
-            "ping.png",
-            namespace=os.environ["UI_ICONS_PATH"],
-            size=(round(self.block_width), round(self.block_height)),
-        )
+        self._ping_image = self.get_sprite("ui", "ping.png")
         self.pings: dict[Cord, Ping] = {}
 
         self.update_field()
 
-        Thread(self._manage_pings, repetitive=True).run()
-
-    def init_ways(self, ways: list[Cords]) -> None:
+    def init_ways(self, cords: ty.Iterable[Cord]) -> None:
+        """
+        Отображает клетки, на которые может пойти игрок.
+        :param cords: Координаты клеток.
+        """
         self.ways.clear()
-        for way in ways:
-            for cord in way:
-                cord = tuple(cord)
-                if cord not in self.ways:
-                    self.ways[cord] = pg.Rect(
-                        self.block_width * cord[1],
-                        self.block_height * cord[0],
-                        self.block_width,
-                        self.block_height,
-                    )
-        self.update_field()
+        for cord in cords:
+            cord = tuple(cord)
+            self.ways[cord] = pg.Rect(
+                self.block_width * cord[1],
+                self.block_height * cord[0],
+                self.block_width,
+                self.block_height,
+            )
+        self.request_update()
 
     def init_hit(self, cords: list[Cord]) -> None:
         for cord in cords:
@@ -565,92 +608,175 @@ class Field(WidgetsGroup):
                     self.block_width,
                     self.block_height,
                 )
-        self.update_field()
-        Thread(self._delete_hit).run()
-
-    def _delete_hit(self) -> None:
-        time.sleep(2)
-        self.hit.clear()
-        self.update_field()
+            # Каждая отметка исчезает через 2 секунды после последнего попадания
+            Expiry.add(
+                (self, "hit", cord),
+                2,
+                lambda cord=cord: self._expire(self.hit, "hit", cord),
+            )
+        self.request_update()
 
     def _generate_location_map(self) -> None:
         """
-        Создает картинку поля.
+        Вычисляет размеры клеток и загружает плитки локации.
         """
-        self.floors: list[tuple[pg.Surface, pg.Rect]] = []  # Элементы пола
-        self.walls: list[list[tuple[pg.Surface, pg.Rect] | None]] = []  # Элементы стен
-
+        room = self.network_client.room
         self.block_width, self.block_height = (
-            self.width / len(self.network_client.room.field[0]),
-            self.height / len(self.network_client.room.field),
+            max(self.width / room.grid.width, self.min_block_size),
+            max(self.height / room.grid.height, self.min_block_size),
         )  # Размеры одного блока
+        # Все поле (в координатах поля)
+        self._world = pg.Rect(
+            0,
+            0,
+            math.ceil(self.block_width * room.grid.width),
+            math.ceil(self.block_height * room.grid.height),
+        )
 
-        for i, (board_line, location_line) in enumerate(
-            zip(self.network_client.room.field, self.network_client.room.location)
+        tile_size = (round(self.block_width) + 1, round(self.block_height * 1.3))
+        ImageCache.prewarm_location(room.location_name, tile_size)
+
+        # Плитки локации загружаются по одной копии каждой плитки и не упаковываются
+        # в атлас: непрозрачные плитки рисуются без смешивания цветов
+        self.atlas = TextureAtlas()
+        tiles = {}
+        for walkable, location_block in dict.fromkeys(
+            (room.grid.cells[i * room.grid.width + j], location_block)
+            for i, location_line in enumerate(room.location)
+            for j, location_block in enumerate(location_line)
         ):
-            walls_line: list[tuple[pg.Surface, pg.Rect] | None] = []
-            y = self.block_height * i
-            for j, (board_block, location_block) in enumerate(
-                zip(board_line, location_line)
-            ):
-                x = self.block_width * j
-                if board_block is True:  # Если блок - элемента пола
-                    rect = pg.Rect(x, y, self.block_width, self.block_height)
-                    self.floors.append(
-                        (
-                            load_image(
-                                f"floor{location_block}.png",
-                                namespace=os.path.join(
-                                    os.environ["LOCATIONS_PATH"],
-                                    self.network_client.room.location_name,
-                                    "floors",
-                                ),
-                                size=(
-                                    round(self.block_width) + 1,
-                                    round(self.block_height * 1.3),
-                                ),
-                            ),
-                            rect,
-                        )
-                    )
-                    walls_line.append(None)
-                else:  # Если блок - элемент стены
-                    rect = pg.Rect(
-                        x,
-                        y - self.block_height * 0.3,
-                        self.block_width,
-                        self.block_height * 1.3,
-                    )
-                    walls_line.append(
-                        (
-                            load_image(
-                                f"wall{location_block}.png",
-                                namespace=os.path.join(
-                                    os.environ["LOCATIONS_PATH"],
-                                    self.network_client.room.location_name,
-                                    "walls",
-                                ),
-                                size=(
-                                    round(self.block_width) + 1,
-                                    round(self.block_height * 1.3),
-                                ),
-                            ),
-                            rect,
-                        )
-                    )
-            self.walls.append(walls_line)
+            kind = "floor" if walkable else "wall"
+            tiles[kind, location_block] = load_image(
+                f"{kind}{location_block}.png",
+                namespace=os.path.join(
+                    os.environ["LOCATIONS_PATH"], room.location_name, f"{kind}s"
+                ),
+                size=tile_size,
+            )
+        # Плитки по номеру элемента локации
+        self._floor_tiles: dict[int, pg.Surface] = {
+            location_block: tile
+            for (kind, location_block), tile in tiles.items()
+            if kind == "floor"
+        }
+        self._wall_tiles: dict[int, pg.Surface] = {
+            location_block: tile
+            for (kind, location_block), tile in tiles.items()
+            if kind == "wall"
+        }
+        # True - плитки непрозрачны и закрывают все поле
+        self._opaque_tiles = not any(
+            tile.get_flags() & pg.SRCALPHA for tile in tiles.values()
+        )
+
+    def _load_sprite(self, kind: str, file_name: str) -> tuple[tuple, pg.Surface]:
+        """
+        Загружает изображение сущности или иконку интерфейса в размере поля.
+        :param kind: Вид изображения: "enemy", "boss", "character" или "ui".
+        :param file_name: Название файла.
+        :return: Ключ изображения в атласе и изображение.
+        """
+        namespace, size, save_ratio, default = {
+            "enemy": (
+                "ENEMIES_PATH",
+                (None, round(self.block_height * 1.25)),
+                True,
+                "mogus.png",
+            ),
+            # TODO: remove default boss icon
+            "boss": (
+                "BOSSES_PATH",
+                (None, round(self.block_height * 2)),
+                True,
+                "diablo.png",
+            ),
+            "character": (
+                "CHARACTERS_PATH",
+                (None, round(self.block_height * 1.5)),
+                True,
+                None,
+            ),
+            "ui": (
+                "UI_ICONS_PATH",
+                (round(self.block_width), round(self.block_height)),
+                False,
+                None,
+            ),
+        }[kind]
+        image = load_image(
+            file_name,
+            namespace=os.environ[namespace],
+            size=size,
+            save_ratio=save_ratio,
+        )
+        if image.get_width() == 1 and default is not None:
+            image = load_image(
+                default,
+                namespace=os.environ[namespace],
+                size=size,
+                save_ratio=save_ratio,
+            )
+        return (kind, file_name), image
+
+    def get_sprite(self, kind: str, file_name: str) -> pg.Surface:
+        """
+        :param kind: Вид изображения: "enemy", "boss", "character" или "ui".
+        :param file_name: Название файла.
+        :return: Изображение из атласа поля.
+        """
+        if (sprite := self.atlas.get((kind, file_name))) is not None:
+            return sprite
+        return self.atlas.add(*self._load_sprite(kind, file_name))
+
+    def request_update(self) -> None:
+        """
+        Запрашивает перерисовку поля.
+        Несколько запросов за один кадр объединяются в один вызов update_field.
+        """
+        self._update_requested = True
+        Inbox.defer(self.update_field)
 
     def update_field(self) -> None:
         """
         Отображение игры.
         """
+        self._update_requested = False
         if self.network_client.room is ...:
             return
 
-        image = pg.Surface(self._field_image.get_size())
-        for floor_image, floor_rect in self.floors:
-            image.blit(floor_image, floor_rect)
-
+        self._update_entities()
+        layers = self._get_layers()
+        self._index_hits()
+        target = self._follow_target()
+        if self._layers:
+            regions = self.merge_rects(
+                [
+                    rect
+                    for key in self._layers.keys() | layers.keys()
+                    if self._layers.get(key) != layers.get(key)
+                    for layer in (self._layers.get(key), layers.get(key))
+                    if layer is not None
+                    for _, rect in layer[1]
+                ]
+                + self._expired,
+                self._camera,
+            )
+        else:  # Первая отрисовка
+            if target is not None:
+                self._camera.topleft = self._camera_target = target
+                target = None
+            regions = [self._camera.copy()]
+        self._expired.clear()
+        self._layers = layers
+        self._index_layers()
+        self._redraw(regions)
+        if target is not None and target != self._camera_target:
+            self.scroll_to(*target, duration=0.3)
+
+    def _update_entities(self) -> None:
+        """
+        Синхронизирует виджеты сущностей с данными комнаты.
+        """
         rect = pg.Rect(
             self.block_width * self.network_client.room.boss.pos[1]
             - self.block_width * 0.5,
@@ -669,19 +795,7 @@ class Field(WidgetsGroup):
         enemies = {enemy.data.eid: enemy for enemy in self.enemies.values()}
         self.enemies.clear()
         for enemy in self.network_client.room.enemies:
-            enemy_image = load_image(
-                enemy.icon,
-                namespace=os.environ["ENEMIES_PATH"],
-                size=(None, round(self.block_height * 1.25)),
-                save_ratio=True,
-            )
-            if enemy_image.get_width() == 1:
-                enemy_image = load_image(
-                    "mogus.png",
-                    namespace=os.environ["ENEMIES_PATH"],
-                    size=(None, round(self.block_height * 1.25)),
-                    save_ratio=True,
-                )
+            enemy_image = self.get_sprite("enemy", enemy.icon)
             rect = pg.Rect(
                 self.block_width * enemy.pos[1]
                 - ((enemy_image.get_width() - self.block_width) / 2),
@@ -703,12 +817,7 @@ class Field(WidgetsGroup):
         }
         self.characters.clear()
         for player in self.network_client.room.players:
-            player_image = load_image(
-                player.character.icon,
-                namespace=os.environ["CHARACTERS_PATH"],
-                size=(None, round(self.block_height * 1.5)),
-                save_ratio=True,
-            )
+            player_image = self.get_sprite("character", player.character.icon)
             rect = pg.Rect(
                 self.block_width * player.character.pos[1]
                 - ((player_image.get_width() - self.block_width) / 2),
@@ -725,74 +834,375 @@ class Field(WidgetsGroup):
 
             self.characters[tuple(player.character.pos)] = character
 
-        for i, walls_line in enumerate(self.walls):
-            for j, wall in enumerate(walls_line):
-                if wall:
-                    image.blit(*wall)
-                j -= 1
-                if way := self.ways.get((i, j)):
-                    image.blit(self._way_image, way)
-                if enemy := self.enemies.get((i, j)):
-                    enemy.blit(image)
-                if character := self.characters.get((i, j)):
-                    character.blit(image)
-                if hit := self.hit.get((i, j)):
-                    image.blit(self._hit_image, hit)
-                if tuple(self.boss.data.pos) == (i, j):
-                    if self.boss.data.hp > 0:
-                        self.boss.blit(image)
-                if ping := self.pings.get((i, j)):
-                    image.blit(self._ping_image, ping)
+    def _index_hits(self) -> None:
+        """
+        Перестраивает сетку элементов поля, на которые можно нажать.
+        Сущности добавляются в порядке отрисовки.
+        """
+        self._hits.clear()
+        for cord, way in self.ways.items():
+            self._hits.add(way, ("way", cord))
+        for cord, enemy in sorted(self.enemies.items()):
+            self._hits.add(enemy.rect, ("enemy", enemy))
+        for cord, character in sorted(self.characters.items()):
+            self._hits.add(character.rect, ("character", character))
+        if self.boss is not ...:
+            self._hits.add(self.boss.rect, ("boss", self.boss))
+        if self.finish is not ...:
+            self._hits.add(self.finish, ("finish", self.finish))
+
+    def items_at(self, pos: tuple[int, int], kind: str) -> list:
+        """
+        :param pos: Точка окна.
+        :param kind: Вид элемента: "way", "enemy", "character", "boss" или "finish".
+        :return: Элементы поля этого вида под точкой, сверху вниз.
+            Для "way" - координаты клеток. Вне области просмотра - пустой список.
+        """
+        if not self.in_viewport(pos):
+            return []
+        rect = self.get_global_rect_of(pg.Rect(0, 0, 0, 0))
+        return [
+            item
+            for item_kind, item in self._hits.items_at(
+                (pos[0] - rect.x, pos[1] - rect.y)
+            )
+            if item_kind == kind
+        ]
+
+    def _get_layers(
+        self,
+    ) -> dict[tuple, tuple[tuple, tuple[tuple[pg.Surface, pg.Rect], ...]]]:
+        """
+        Собирает динамические элементы поля.
+        Порядок отрисовки элемента в клетке (i, j) - (i, 1, j, <тип>),
+        строки стен - (i, 0). Так стены строки перекрывают сущности предыдущих
+        строк, но не сущности своей строки.
+        :return: Словарь: ключ элемента -> (порядок отрисовки, картинки).
+        """
+        layers = {}
+        for cord, way in self.ways.items():
+            layers["way", cord] = (cord[0], 1, cord[1], 0), ((self._way_image, way),)
+        for cord, enemy in self.enemies.items():
+            layers["enemy", enemy.data.eid] = (
+                (cord[0], 1, cord[1], 1),
+                enemy.get_blits(),
+            )
+        for cord, character in self.characters.items():
+            layers["character", character.data.uid] = (
+                (cord[0], 1, cord[1], 2),
+                character.get_blits(),
+            )
+        for cord, hit in self.hit.items():
+            layers["hit", cord] = (cord[0], 1, cord[1], 3), ((self._hit_image, hit),)
+        if self.boss.data.hp > 0:
+            y, x = self.boss.data.pos
+            layers[("boss",)] = (y, 1, x, 4), self.boss.get_blits()
+        for cord, ping in self.pings.copy().items():
+            layers["ping", cord] = (
+                (cord[0], 1, cord[1], 5),
+                ((self._ping_image, ping.rect),),
+            )
 
         if self.network_client.room.boss.hp == 0:
+            finish_y, finish_x = self.network_client.room.grid.finish
             self.finish = pg.Rect(
-                self.block_width * self.network_client.room.field[-1].index(True),
-                self.block_height * (len(self.network_client.room.field) - 1),
+                self.block_width * finish_x,
+                self.block_height * finish_y,
                 self._finish_image.get_width(),
                 self._finish_image.get_height(),
             )
-            image.blit(self._finish_image, self.finish)
-
-        image.blit(self.lvl_label.image, self.lvl_label.rect)
-
-        self.field_image = image
-
-    def _manage_pings(self) -> ty.NoReturn:
-        while True:
-            upd = False
-            for pos, ping in self.pings.copy().items():
-                if time.time() - ping.spawn_time > 3:
-                    del self.pings[pos]
-                    upd = True
-            if upd:
-                self.update_field()
+            layers[("finish",)] = (math.inf, 0), ((self._finish_image, self.finish),)
+
+        return layers
+
+    def _index_layers(self) -> None:
+        """
+        Перестраивает сетку динамических элементов поля.
+        """
+        self._layers_grid.clear()
+        for key, (_, blits) in self._layers.items():
+            for _, rect in blits:
+                self._layers_grid.add(rect, key)
+
+    def _redraw(self, regions: list[pg.Rect]) -> None:
+        """
+        Перерисовывает области поля.
+        Рисуются только клетки и элементы, попадающие в видимую часть областей,
+        поэтому время перерисовки не зависит от размеров поля.
+        :param regions: Области поля (в координатах поля).
+        """
+        room = self.network_client.room
+        grid = room.grid
+        camera = self._camera
+        for region in regions:
+            region = region.clip(camera)
+            if not region.width or not region.height:
+                continue
+            view_region = region.move(-camera.x, -camera.y)
+            self._field_image.set_clip(view_region)
+            if not (self._opaque_tiles and self._world.contains(region)):
+                self._field_image.fill((0, 0, 0), view_region)
+
+            # Плитки выше и левее области выступают в нее
+            rows = range(
+                max(int(region.top // self.block_height) - 1, 0),
+                min(int(region.bottom // self.block_height) + 2, grid.height),
+            )
+            columns = range(
+                max(int(region.left // self.block_width) - 1, 0),
+                min(int(region.right // self.block_width) + 1, grid.width),
+            )
+            floors = []
+            items = []
+            for i in rows:
+                location_line = room.location[i]
+                cells = grid.cells[i * grid.width : (i + 1) * grid.width]
+                y = self.block_height * i
+                walls = []
+                for j in columns:
+                    x = self.block_width * j
+                    if cells[j]:  # Если блок - элемент пола
+                        floors.append(
+                            (
+                                self._floor_tiles[location_line[j]],
+                                pg.Rect(x, y, self.block_width, self.block_height),
+                            )
+                        )
+                    else:  # Если блок - элемент стены
+                        walls.append(
+                            (
+                                self._wall_tiles[location_line[j]],
+                                pg.Rect(
+                                    x,
+                                    y - self.block_height * 0.3,
+                                    self.block_width,
+                                    self.block_height * 1.3,
+                                ),
+                            )
+                        )
+                if walls:
+                    items.append(((i, 0), walls))
+            items.extend(
+                layer
+                for key in self._layers_grid.items_in(region)
+                if (layer := self._layers.get(key)) is not None
+            )
+            items.sort(key=lambda item: item[0])
+            self._field_image.blits(
+                [
+                    (image, rect.move(-camera.x, -camera.y))
+                    for image, rect in floors
+                    + [blit for _, blits in items for blit in blits]
+                ],
+                doreturn=False,
+            )
+            # Надпись уровня закреплена в области просмотра
+            self._field_image.blit(self.lvl_label.image, self.lvl_label.rect)
+        self._field_image.set_clip(None)
+
+        if self.tracks_dirty:
+            for region in regions:
+                self._add_dirty_rect(self.get_global_rect_of(region.clip(camera)))
+
+    def _expire(self, overlay: dict[Cord, ...], kind: str, cord: Cord) -> None:
+        """
+        Убирает с поля исчезнувший временный элемент (пинг или попадание).
+        Клетки элемента перерисовываются в конце кадра вместе с клетками
+        других исчезнувших элементов, без пересборки слоев поля.
+        Если в этом кадре поле обновляется (update_field), клетки
+        перерисовываются вместе с ним.
+        :param overlay: Элементы этого вида.
+        :param kind: Вид элемента (ключ слоя поля).
+        :param cord: Координаты клетки.
+        """
+        overlay.pop(cord, None)
+        if (layer := self._layers.pop((kind, cord), None)) is not None:
+            self._expired.extend(rect for _, rect in layer[1])
+            if not self._update_requested:
+                # Под ключом update_field: запрос обновления поля в этом кадре
+                # заменит перерисовку клеток
+                Inbox.defer(self._redraw_expired, key=self.update_field)
+
+    def _redraw_expired(self) -> None:
+        """
+        Перерисовывает клетки исчезнувших элементов.
+        """
+        if self._expired:
+            regions = self.merge_rects(self._expired, self._camera)
+            self._expired.clear()
+            self._redraw(regions)
 
     def spawn_ping(self, y: int, x: int) -> None:
+        """
+        Показывает пинг на 3 секунды. Повторный пинг клетки продлевает его.
+        :param y: Строка клетки.
+        :param x: Столбец клетки.
+        """
         pos = (y, x)
-        if pos in self.pings:
-            self.pings[pos].spawn_time = int(time.time())
-        else:
+        Expiry.add(
+            (self, "ping", pos), 3, lambda: self._expire(self.pings, "ping", pos)
+        )
+        if pos not in self.pings:
             rect = pg.Rect(
                 self.block_width * x,
                 self.block_height * y,
                 round(self.block_width),
                 round(self.block_height),
             )
-            self.pings[pos] = Ping(rect, int(time.time()))
-            self.update_field()
+            self.pings[pos] = Ping(rect)
+            self.request_update()
+
+    def _render(self) -> pg.Surface:
+        return self._field_image
 
     @property
     def field_image(self) -> pg.Surface:
         return self._field_image
 
-    @field_image.setter
-    def field_image(self, value: pg.Surface):
-        self._field_image = value
-        if hasattr(self, "_label"):
-            self._label.sprite = self._field_image
+    @property
+    def scrollable(self) -> True | False:
+        """
+        :return: True - поле не помещается в область просмотра.
+        """
+        return not self._camera.contains(self._world)
+
+    def scroll_to(self, x: float, y: float, duration: float = 0) -> None:
+        """
+        Перемещает камеру.
+        :param x: Координата x левого верхнего угла видимой области.
+        :param y: Координата y левого верхнего угла видимой области.
+        :param duration: Длительность плавного перемещения (в секундах).
+        """
+        if self._camera_tween is not None:
+            Timeline.cancel(self._camera_tween)
+            self._camera_tween = None
+        self._camera_target = self._clamp_camera(x, y)
+        if not duration:
+            self._move_camera(*self._camera_target)
+            return
+
+        (start_x, start_y), (end_x, end_y) = self._camera.topleft, self._camera_target
+        self._camera_tween = Timeline.add(
+            Tween(
+                duration,
+                lambda t: self._move_camera(
+                    start_x + (end_x - start_x) * t, start_y + (end_y - start_y) * t
+                ),
+                easing=ease_out,
+                on_finish=lambda: setattr(self, "_camera_tween", None),
+            )
+        )
+
+    def scroll_by(self, dx: float, dy: float) -> None:
+        """
+        Прокручивает поле вручную. Камера перестает следовать за персонажем.
+        :param dx: Сдвиг по горизонтали.
+        :param dy: Сдвиг по вертикали.
+        """
+        self.follow = False
+        x, y = self._camera_target
+        self.scroll_to(x + dx, y + dy)
+
+    def _clamp_camera(self, x: float, y: float) -> tuple[int, int]:
+        """
+        :return: Ближайшее к (x, y) положение камеры в пределах поля.
+        """
+        return (
+            min(max(round(x), 0), max(self._world.width - self._camera.width, 0)),
+            min(max(round(y), 0), max(self._world.height - self._camera.height, 0)),
+        )
+
+    def _move_camera(self, x: float, y: float) -> None:
+        """
+        Сдвигает изображение поля вслед за камерой
+        и перерисовывает только открывшиеся полосы.
+        :param x: Координата x левого верхнего угла видимой области.
+        :param y: Координата y левого верхнего угла видимой области.
+        """
+        camera = self._camera
+        x, y = self._clamp_camera(x, y)
+        dx, dy = camera.x - x, camera.y - y
+        if not dx and not dy:
+            return
+        camera.topleft = (x, y)
+        if abs(dx) >= camera.width or abs(dy) >= camera.height:
+            regions = [camera.copy()]
+        else:
+            self._field_image.scroll(dx, dy)
+            regions = [
+                # Надпись уровня сдвинулась вместе с полем
+                self.lvl_label.rect.move(x + dx, y + dy),
+                self.lvl_label.rect.move(x, y),
+            ]
+            if dx:
+                left = camera.left if dx > 0 else camera.right + dx
+                regions.append(pg.Rect(left, camera.top, abs(dx), camera.height))
+            if dy:
+                top = camera.top if dy > 0 else camera.bottom + dy
+                regions.append(pg.Rect(camera.left, top, camera.width, abs(dy)))
+        self._redraw(self.merge_rects(regions, camera))
+        self.mark_dirty()
+
+    def _follow_target(self) -> tuple[int, int] | None:
+        """
+        :return: Положение камеры, при котором персонаж игрока в центре
+            области просмотра, или None, если камера не следует за персонажем.
+        """
+        if not (self.follow and self.scrollable):
+            return None
+        for character in self.characters.values():
+            if character.data.uid == self.network_client.user.uid:
+                return self._clamp_camera(
+                    character.rect.centerx - self._camera.width / 2,
+                    character.rect.centery - self._camera.height / 2,
+                )
+        return None
+
+    def handle_event(self, event: pg.event.Event) -> None:
+        if not (self.enabled and self.scrollable):
+            return
+        if event.type == pg.MOUSEWHEEL:
+            if self.get_global_rect().collidepoint(pg.mouse.get_pos()):
+                dx, dy = event.x, -event.y
+                if pg.key.get_mods() & pg.KMOD_SHIFT:
+                    dx, dy = dy, dx
+                self.scroll_by(dx * self.block_width, dy * self.block_height)
+        elif event.type == pg.KEYDOWN:
+            if event.key in SCROLL_KEYS:
+                dx, dy = SCROLL_KEYS[event.key]
+                self.scroll_by(dx * self.block_width, dy * self.block_height)
+            elif event.key == pg.K_c:
+                self.follow = True
+                if (target := self._follow_target()) is not None:
+                    self.scroll_to(*target, duration=0.3)
+
+    def cell_at(self, pos: tuple[int, int]) -> Cord | None:
+        """
+        :param pos: Точка окна.
+        :return: Координаты клетки поля под точкой
+            или None, если точка вне области просмотра.
+        """
+        if not self.in_viewport(pos):
+            return None
+        rect = self.get_global_rect_of(pg.Rect(0, 0, 0, 0))
+        return (
+            int((pos[1] - rect.y) // self.block_height),
+            int((pos[0] - rect.x) // self.block_width),
+        )
+
+    def in_viewport(self, pos: tuple[int, int]) -> True | False:
+        """
+        :param pos: Точка окна.
+        :return: True - точка в видимой части поля.
+        """
+        return self.get_global_rect_of(self._camera).collidepoint(pos)
 
     def get_global_rect_of(self, rect: pg.Rect) -> pg.Rect:
-        rect = rect.copy()
+        """
+        :param rect: Область поля (в координатах поля).
+        :return: Положение области в окне.
+        """
+        rect = rect.move(-self._camera.x, -self._camera.y)
 
         self_rect: pg.Rect = self.get_global_rect()
         rect.x += self_rect.x + self.padding + self.border_width
@@ -840,7 +1250,7 @@ class StatWidget(WidgetsGroup):
             x=self.icon.rect.right + 5,
             y=lambda obj: self.icon.height / 2 - obj.rect.height / 2,
             text=value,
-            font=pg.font.Font(font, icon_size),
+            font=FontRegistry.get(font, icon_size),
         )
 
 
@@ -926,6 +1336,8 @@ class StatsWidget(WidgetsGroup):
 
 
 class ItemWidget(WidgetsGroup):
+    pointer_target = True
+
     def __init__(self, name: str, x: int, y: int, item: Item | None):
         """
         Виджет предмета в инвентаре.
@@ -1044,6 +1456,8 @@ class ItemsWidget(WidgetsGroup):
 
 
 class ItemStand(WidgetsGroup):
+    pointer_target = True
+
     def __init__(
         self,
         name: str,
@@ -1163,7 +1577,7 @@ class ItemDescription(WidgetsGroup):
                 else None
             ),
             text=item.name,
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             **dict(soft_split=True) if parent.width else {},
         )
 
@@ -1173,7 +1587,7 @@ class ItemDescription(WidgetsGroup):
             x=0,
             y=self.icon.rect.bottom + 5,
             text=f"Цена: {item.price}",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
         self.price_icon_label = Label(
             self,
@@ -1276,11 +1690,13 @@ class ShortPlayerWidget(WidgetsGroup):
                 if f"p{player.uid}" == parent.network_client.room.queue
                 else pg.Color("white")
             ),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
 
 class PlayerWidget(WidgetsGroup):
+    event_types = (pg.MOUSEBUTTONDOWN,)
+
     def __init__(
         self,
         parent: Group,
@@ -1304,7 +1720,6 @@ class PlayerWidget(WidgetsGroup):
         icon_size = int(os.environ["icon_size"])
         font = os.environ.get("font")
 
-        self.lock = False
         self.player = player
         self.network_client = network_client
 
@@ -1329,7 +1744,7 @@ class PlayerWidget(WidgetsGroup):
             x=lambda obj: self.icon.rect.right + 5,
             y=lambda obj: self.icon.rect.height / 2 - obj.rect.height / 2,
             text="",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         self.line = Line(
@@ -1352,17 +1767,6 @@ class PlayerWidget(WidgetsGroup):
         Обновляет данные об игроке.
         :param player: Новый экземпляр игрока.
         """
-
-        def wait_unlock():
-            while self.lock:
-                time.sleep(0.1)
-            self.update_data(player)
-
-        if self.lock:
-            return Thread(wait_unlock).run()
-
-        self.lock = True
-
         icon_size = int(os.environ["icon_size"])
 
         self.player = player
@@ -1391,8 +1795,6 @@ class PlayerWidget(WidgetsGroup):
             self.remove(self.stats)
         self.stats = StatsWidget(self)
 
-        self.lock = False
-
     def handle_event(self, event: pg.event.Event) -> None:
         super(PlayerWidget, self).handle_event(event)
         if self.enabled:
@@ -1400,20 +1802,17 @@ class PlayerWidget(WidgetsGroup):
                 if event.button == pg.BUTTON_RIGHT:
                     if self.items is not ...:
                         # Открытие выпадающего меню предмета
+                        # Открытие при нажатии на предмет
+                        item_widget = self.root.widget_at(event.pos)
                         if (
-                            self.items.get_global_rect().collidepoint(event.pos)
+                            item_widget in self.items.items
+                            and item_widget.item
                             and self.drop_menu is not ...
                         ):
-                            for i, item_widget in enumerate(self.items.items):
-                                if item_widget.item:
-                                    # Открытие при нажатии на предмет
-                                    if item_widget.get_global_rect().collidepoint(
-                                        event.pos
-                                    ):
-                                        self.drop_menu.init(item_widget.item, i)
-                                        self.drop_menu.open(event.pos)
-                                        self.drop_menu.update()
-                                        break
+                            i = self.items.items.index(item_widget)
+                            self.drop_menu.init(item_widget.item, i)
+                            self.drop_menu.open(event.pos)
+                            self.drop_menu.update()
 
 
 class PlayersMenu(WidgetsGroup):
@@ -1517,7 +1916,7 @@ class EnemyMenu(WidgetsGroup):
             x=lambda obj: self.icon.rect.right + 5,
             y=lambda obj: round(self.icon.rect.height / 2 - obj.rect.height / 2),
             text="...",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         self.stats_widget = WidgetsGroup(
@@ -1589,7 +1988,7 @@ class BossSkill(WidgetsGroup):
             y=0,
             width=round(width * 0.8),
             text=f"{index}. " + (skill.get("desc") or ""),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             soft_split=True,
         )
 
@@ -1668,7 +2067,7 @@ class BossMenu(WidgetsGroup):
             y=lambda obj: round(self.icon.rect.height / 2 - obj.rect.height / 2),
             width=round(self.rect.width - icon_size * 1.5),
             text="...",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         self.hp = StatWidget(
@@ -1731,6 +2130,8 @@ class BossMenu(WidgetsGroup):
 
 
 class ShopMenu(WidgetsGroup):
+    event_types = (pg.MOUSEBUTTONDOWN,)
+
     def __init__(self, parent: GameClientScreen):
         """
         Магазин.
@@ -1773,7 +2174,7 @@ class ShopMenu(WidgetsGroup):
             text="Купить",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             anchor=Anchor.center,
         )
         self.buy_button.disable()
@@ -1849,32 +2250,31 @@ class ShopMenu(WidgetsGroup):
         if self.enabled:
             if event.type == pg.MOUSEBUTTONDOWN:
                 if event.button == pg.BUTTON_LEFT:
-                    if self.get_global_rect().collidepoint(event.pos):
-                        for i, item in enumerate(self.items):
-                            # Выбор предмета
-                            if item.get_global_rect().collidepoint(event.pos):
-                                if item.item:  # Если предмет еще не продан
-                                    # Удаляем старое описание предмета
-                                    if self.item_desc is not ...:
-                                        self.item_preview.remove(self.item_desc)
-                                    # Создаем новое описание предмета
-                                    self.item_desc = ItemDescription(
-                                        self.item_preview,
-                                        f"{self.item_preview.name}-{i}-ItemDescription",
-                                        x=0,
-                                        y=0,
-                                        item=item.item,
-                                        item_index=i,
-                                    )
-                                    self.item_preview.enable()
-                                    self.item_preview.show()
-                                    self.buy_button.enable()
-                                else:
-                                    self.item_preview.disable()
-                                    self.item_preview.hide()
-                                    self.buy_button.disable()
-                                self.item_preview.update()
-                                break
+                    # Выбор предмета
+                    item = self.root.widget_at(event.pos)
+                    if item in self.items:
+                        i = self.items.index(item)
+                        if item.item:  # Если предмет еще не продан
+                            # Удаляем старое описание предмета
+                            if self.item_desc is not ...:
+                                self.item_preview.remove(self.item_desc)
+                            # Создаем новое описание предмета
+                            self.item_desc = ItemDescription(
+                                self.item_preview,
+                                f"{self.item_preview.name}-{i}-ItemDescription",
+                                x=0,
+                                y=0,
+                                item=item.item,
+                                item_index=i,
+                            )
+                            self.item_preview.enable()
+                            self.item_preview.show()
+                            self.buy_button.enable()
+                        else:
+                            self.item_preview.disable()
+                            self.item_preview.hide()
+                            self.buy_button.disable()
+                        self.item_preview.update()
 
 
 class DicesWidget(WidgetsGroup):
@@ -1893,8 +2293,9 @@ class DicesWidget(WidgetsGroup):
         self.dice = Dice(
             self,
             f"{self.name}-DefaultDice",
-            # Оборот на 180 градусов за пол секунды
-            speed=lambda obj: obj.rect.width / parent.clock.get_fps() * 6,
+            # Кадров вращения примерно столько же, сколько кадров окна
+            # за время поворота (rotation_time)
+            speed=lambda obj: obj.rect.width / parent.loop.fps * 6,
             x=lambda obj: round(
                 self.rect.w / 70 * 3
                 + (self.rect.width - self.rect.w / 70 * 3) / 2
@@ -1909,7 +2310,7 @@ class DicesWidget(WidgetsGroup):
         self.dice2 = Dice(
             self,
             f"{self.name}-AttackDice",
-            speed=lambda obj: obj.rect.width / parent.clock.get_fps() * 6,
+            speed=lambda obj: obj.rect.width / parent.loop.fps * 6,
             x=lambda obj: self.dice.rect.right + 30,
             y=0,
             width=round(parent.field.rect.left / 3),
@@ -1924,18 +2325,32 @@ class DicesWidget(WidgetsGroup):
             if upd:
                 BaseWidget.update(self, *args, **kwargs)
 
+    @property
+    def animating(self) -> True | False:
+        """
+        :return: True - одна из костей вращается.
+        """
+        return self.dice.animating or self.dice2.animating
+
 
 class GameClientScreen(Group):
+    event_types = (pg.KEYDOWN, pg.MOUSEBUTTONDOWN, ButtonClickEvent, DiceMovingStop)
+
     def __init__(self, network_client: NetworkClient = None):
         resolution = Resolution.converter(os.environ["resolution"])
         font_size = int(os.environ["font_size"])
         font = os.environ.get("font")
 
-        self.clock = pg.time.Clock()
+        self.loop = RunLoop(
+            self,
+            animating=lambda: self.dices_widget.animating,
+            on_frame=self._on_frame,
+        )
         self.running = True
         self.finish_status = FinishStatus.close
 
         super(GameClientScreen, self).__init__(name="GameClientScreen")
+        self.track_dirty_rects()  # Перерисовываем только измененные области окна
         self.network_client = (
             self.network_client if hasattr(self, "network_client") else network_client
         )
@@ -1970,7 +2385,7 @@ class GameClientScreen(Group):
             text="Пропустить ход",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             anchor=Anchor.center,
             callback=lambda ev: self.network_client.pass_move(
                 self.info_alert.show_message
@@ -2010,7 +2425,7 @@ class GameClientScreen(Group):
             callback=lambda msg: (
                 self.info_alert.show_message(msg),
                 self.players_menu.update_players(),
-                self.field.update_field(),
+                self.field.request_update(),
             )
         )
         self.network_client.on_loading_game(
@@ -2046,12 +2461,12 @@ class GameClientScreen(Group):
         self.network_client.on_player_moving(
             callback=lambda: (
                 self.field.ways.clear(),
-                self.field.update_field(),
+                self.field.request_update(),
                 self.network_client.next(),
             )
         )
-        self.network_client.on_enemy_moving(callback=self.field.update_field)
-        self.network_client.on_boss_moving(callback=self.field.update_field)
+        self.network_client.on_enemy_moving(callback=self.field.request_update)
+        self.network_client.on_boss_moving(callback=self.field.request_update)
 
         # UPDATES
         self.network_client.on_update_players(
@@ -2060,7 +2475,7 @@ class GameClientScreen(Group):
                 for player in self.network_client.room.players
             )
         )
-        self.network_client.on_update_enemies(callback=self.field.update_field)
+        self.network_client.on_update_enemies(callback=self.field.request_update)
         self.network_client.on_boss_heal(callback=self.on_boss_heal)
         self.network_client.on_set_queue(callback=self.on_set_queue)
 
@@ -2072,7 +2487,7 @@ class GameClientScreen(Group):
         self.network_client.on_kill_player(callback=self.on_kill_player)
         self.network_client.on_hit_enemy(
             callback=lambda enemy: (
-                self.field.update_field(),
+                self.field.request_update(),
                 (
                     self.enemy_menu.update_data(enemy)
                     if not self.enemy_menu.hidden
@@ -2084,7 +2499,7 @@ class GameClientScreen(Group):
         )
         self.network_client.on_kill_enemy(
             callback=lambda eid: (
-                self.field.update_field(),
+                self.field.request_update(),
                 (
                     (self.enemy_menu.disable(), self.enemy_menu.hide())
                     if not self.enemy_menu.hidden
@@ -2101,7 +2516,7 @@ class GameClientScreen(Group):
                 else ...
             )
         )
-        self.network_client.on_kill_boss(callback=self.field.update_field)
+        self.network_client.on_kill_boss(callback=self.field.request_update)
         self.network_client.on_hit(callback=self.on_hit)
 
         # CHOICE ENEMY
@@ -2151,12 +2566,12 @@ class GameClientScreen(Group):
     def on_set_queue(self, queue: str) -> None:
         if len(self.field.ways):
             self.field.ways.clear()
-            self.field.update_field()
+            self.field.request_update()
         if eids := self.__dict__.get("eids"):
             for enemy in self.field.enemies.values():
                 if enemy.data.eid in eids:
                     enemy.indicator = None
-            self.field.update_field()
+            self.field.request_update()
 
         if queue.startswith("p"):
             uid = int(queue[1:])
@@ -2196,7 +2611,7 @@ class GameClientScreen(Group):
                     if enemy.data.eid in eids:
                         enemy.indicator = None
                 del self.__dict__["eids"]
-                self.field.update_field()
+                self.field.request_update()
             self.pass_move_button.show()
             self.pass_move_button.enable()
         else:
@@ -2225,9 +2640,8 @@ class GameClientScreen(Group):
 
     def on_boss_heal(self) -> None:
         def _remove_indicator():
-            time.sleep(2)
             self.field.boss.indicator = None
-            self.field.update_field()
+            self.field.request_update()
 
         self.field.boss.indicator = load_image(
             "hp.png",
@@ -2235,14 +2649,14 @@ class GameClientScreen(Group):
             size=(round(self.field.block_width), None),
             save_ratio=True,
         )
-        self.field.update_field()
+        self.field.request_update()
 
         if not self.boss_menu.hidden:
             self.boss_menu.hp.value.__setattr__(
                 "text", str(self.network_client.room.boss.hp)
             )
 
-        Thread(_remove_indicator).run()
+        Expiry.add((self.field, "boss_indicator"), 2, _remove_indicator)
 
     def on_need_choice_enemy(self, uid: int, eids: list[int]) -> None:
         icon_size = int(int(os.environ["icon_size"]) * 0.5)
@@ -2256,7 +2670,7 @@ class GameClientScreen(Group):
                         namespace=os.environ["UI_ICONS_PATH"],
                         size=(icon_size, icon_size),
                     )
-            self.field.update_field()
+            self.field.request_update()
 
     def rolling_the_dice(self, movement: list[tuple[int, int]]):
         self.dices_widget.dice.move_from_list(movement)
@@ -2265,26 +2679,30 @@ class GameClientScreen(Group):
         self.dices_widget.dice2.move_from_list(movement)
 
     def exec(self) -> str:
-        while self.running:
-            for event in pg.event.get():
-                if event.type == pg.QUIT:
-                    self.terminate()
-                self.handle_event(event)
-                self.loading_screen.update()
-            self.dices_widget.update()
-            self.render()
-            self.clock.tick()
+        self.loop.run()
         return self.finish_status
 
-    def render(self) -> None:
-        self.screen.fill("#f0f0f0")
+    def _on_frame(self) -> None:
+        """
+        Обновления, выполняемые каждый кадр.
+        """
+        if not self.loading_screen.parent.hidden:
+            self.loading_screen.update()  # Экран загрузки должен быть поверх окна
+        self.dices_widget.update()
 
-        self.screen.blit(self._left_menu_image, self._left_menu_rect)
-        self.screen.blit(self._right_menu_image, self._right_menu_rect)
+    def render(self) -> None:
+        if rects := self.draw_dirty(self.screen, self._draw_background):
+            pg.display.update(rects)
 
-        self.draw(self.screen)
+    def _draw_background(self, surface: pg.Surface) -> None:
+        """
+        Отрисовывает фон окна.
+        :param surface: Поверхность.
+        """
+        surface.fill("#f0f0f0")
 
-        pg.display.flip()
+        surface.blit(self._left_menu_image, self._left_menu_rect)
+        surface.blit(self._right_menu_image, self._right_menu_rect)
 
     def terminate(self) -> None:
         self.running = False
@@ -2303,6 +2721,9 @@ class GameClientScreen(Group):
                     else:
                         self.esc_menu.settings.hide()
                         self.esc_menu.hide()
+                elif event.key == pg.K_SPACE:
+                    # Пропуск анимаций: кости сразу показывают результат
+                    Timeline.finish_all()
             elif event.type == ButtonClickEvent.type:
                 # Кнопка покупки предмета
                 if event.obj == self.shop.buy_button:
@@ -2323,19 +2744,19 @@ class GameClientScreen(Group):
                         if not self.pass_move_button.hidden:
                             self.pass_move_button.enable()
                         self.field.init_ways(
-                            get_ways(
-                                player.character.pos,
+                            get_reachable(
+                                tuple(player.character.pos),
                                 self.network_client.room.move_data.num
                                 + player.character.move_speed,
-                                self.network_client.room.field,
+                                self.network_client.room.grid,
                             )
                         )
                     else:
-                        self.field.update_field()
+                        self.field.request_update()
                 elif event.obj == self.dices_widget.dice2:
                     if not self.pass_move_button.hidden:
                         self.pass_move_button.enable()
-                    self.field.update_field()
+                    self.field.request_update()
                     for player in self.network_client.room.players:
                         self.update_player(player)
                 self.network_client.next("stop rolling")
@@ -2343,28 +2764,21 @@ class GameClientScreen(Group):
                 if event.button == pg.BUTTON_LEFT:
                     if self.field.enabled:
                         if pg.key.get_mods() & pg.KMOD_ALT:
-                            pos = (
-                                event.pos[1] // round(self.field.block_height),
-                                (event.pos[0] - self.field.rect.left)
-                                // round(self.field.block_width),
-                            )
-                            if self.network_client.room.field[pos[0]][pos[1]]:
+                            pos = self.field.cell_at(event.pos)
+                            if pos is not None and (
+                                self.network_client.room.grid.is_walkable(*pos)
+                            ):
                                 self.network_client.ping(*pos)
                                 return
 
-                        for pos, rect in self.field.ways.items():
-                            if self.field.get_global_rect_of(rect).collidepoint(
-                                event.pos
-                            ):
-                                self.network_client.move(
-                                    *pos, fail_callback=self.info_alert.show_message
-                                )
+                        for pos in self.field.items_at(event.pos, "way"):
+                            self.network_client.move(
+                                *pos, fail_callback=self.info_alert.show_message
+                            )
 
                         if self.field.boss is not ...:
                             if self.field.boss.data.hp > 0:
-                                if self.field.get_global_rect_of(
-                                    self.field.boss.rect
-                                ).collidepoint(event.pos):
+                                if self.field.items_at(event.pos, "boss"):
                                     if self.__dict__.get("eids"):
                                         self.network_client.choice_enemy(
                                             -1,
@@ -2375,45 +2789,35 @@ class GameClientScreen(Group):
                                     self.player_nemu.disable()
                                     self.boss_menu.init(self.field.boss)
                                     return
-                        for enemy in self.field.enemies.values():
-                            if self.field.get_global_rect_of(enemy.rect).collidepoint(
-                                event.pos
-                            ):
-                                if self.__dict__.get("eids"):
-                                    self.network_client.choice_enemy(
-                                        enemy.data.eid,
-                                        fail_callback=self.info_alert.show_message,
-                                    )
-                                self.boss_menu.hide()
-                                self.player_nemu.hide()
-                                self.player_nemu.disable()
-                                self.enemy_menu.init(enemy)
-                                return
-                        for player in self.field.characters.values():
+                        if enemies := self.field.items_at(event.pos, "enemy"):
+                            enemy = enemies[0]
+                            if self.__dict__.get("eids"):
+                                self.network_client.choice_enemy(
+                                    enemy.data.eid,
+                                    fail_callback=self.info_alert.show_message,
+                                )
+                            self.boss_menu.hide()
+                            self.player_nemu.hide()
+                            self.player_nemu.disable()
+                            self.enemy_menu.init(enemy)
+                            return
+                        for player in self.field.items_at(event.pos, "character"):
                             if (
                                 player.data.uid
                                 != self.players_menu.client_player.player.uid
                             ):
-                                if self.field.get_global_rect_of(
-                                    player.rect
-                                ).collidepoint(event.pos):
-                                    self.boss_menu.hide()
-                                    self.enemy_menu.hide()
-                                    self.player_nemu.update_data(player.data)
-                                    self.player_nemu.show()
-                                    self.player_nemu.enable()
-                                    return
+                                self.boss_menu.hide()
+                                self.enemy_menu.hide()
+                                self.player_nemu.update_data(player.data)
+                                self.player_nemu.show()
+                                self.player_nemu.enable()
+                                return
 
-                        if self.field.finish is not ...:
-                            if self.field.get_global_rect_of(
-                                self.field.finish
-                            ).collidepoint(event.pos):
-                                self.loading_screen.show_message(
-                                    "Переход на новый уровень"
-                                )
-                                self.network_client.start_game(
-                                    fail_callback=self.info_alert.show_message
-                                )
+                        if self.field.items_at(event.pos, "finish"):
+                            self.loading_screen.show_message("Переход на новый уровень")
+                            self.network_client.start_game(
+                                fail_callback=self.info_alert.show_message
+                            )
                     if self.dices_widget.enabled:
                         if self.dices_widget.dice.get_global_rect().collidepoint(
                             event.pos
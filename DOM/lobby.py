@@ -12,7 +12,7 @@ import typing as ty
 import pygame as pg
 from loguru import logger
 
-from base import Button, WidgetsGroup, Group, Label, Anchor, Text
+from base import Button, WidgetsGroup, Group, Label, Anchor, Text, FontRegistry
 from base.events import ButtonClickEvent
 from database.field_types import Resolution
 from game.character import characters
@@ -25,6 +25,8 @@ if ty.TYPE_CHECKING:
 
 
 class LobbyInvite(DropMenu):
+    event_types = ()
+
     def __init__(self, parent: WidgetsGroup, msg: str, room_id: int):
         """
         Приглашение в лобби.
@@ -56,7 +58,7 @@ class LobbyInvite(DropMenu):
             y=0,
             width=self.width - self.padding * 2,
             text=msg,
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             soft_split=True,
         )
 
@@ -67,7 +69,7 @@ class LobbyInvite(DropMenu):
             y=self.msg.rect.bottom + 20,
             text="Принять",
             padding=3,
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             active_background=pg.Color(222, 222, 222, 100),
             border_width=3,
         )
@@ -79,7 +81,7 @@ class LobbyInvite(DropMenu):
             y=self.msg.rect.bottom + 20,
             text=" Х ",
             padding=3,
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             active_background=pg.Color(222, 222, 222, 100),
             border_width=3,
         )
@@ -137,7 +139,7 @@ class PlayerWidget(WidgetsGroup):
             y=lambda obj: round(self.rect.height / 2 - obj.rect.height - 2),
             text=player.username,
             color=pg.Color("#f0ce69"),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         self.status = Label(
@@ -150,7 +152,7 @@ class PlayerWidget(WidgetsGroup):
                 if player.is_owner
                 else ("Готов" if player.ready else "Не готов...")
             ),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         if player.character is not ...:
@@ -190,7 +192,7 @@ class Buttons(WidgetsGroup):
             y=0,
             text=" Х ",
             padding=3,
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             active_background=pg.Color(222, 222, 222, 100),
             border_width=3,
         )
@@ -215,13 +217,16 @@ class Buttons(WidgetsGroup):
                 )
             ),
             padding=3,
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             active_background=pg.Color(222, 222, 222, 100),
             border_width=3,
         )
 
 
 class CharacterButton(WidgetsGroup):
+    pointer_target = True
+    event_types = (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP)
+
     def __init__(
         self, parent: CharactersMenu, y: int, character: Character, character_id: int
     ):
@@ -257,7 +262,7 @@ class CharacterButton(WidgetsGroup):
             x=self.icon.rect.right + 10,
             y=lambda obj: round(self.rect.height / 2 - obj.rect.height / 2),
             text=character.name,
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
     def handle_event(self, event: pg.event.Event) -> None:
@@ -265,15 +270,13 @@ class CharacterButton(WidgetsGroup):
         if self.enabled:
             if event.type == pg.MOUSEBUTTONDOWN:
                 if event.button == pg.BUTTON_LEFT:
-                    rect = self.get_global_rect()
-                    if rect.collidepoint(event.pos):
+                    if self.hit_test(event.pos):
                         self.pressed = True
             elif event.type == pg.MOUSEBUTTONUP:
                 if event.button == pg.BUTTON_LEFT:
                     if self.pressed:
                         self.pressed = False
-                        rect = self.get_global_rect()
-                        if rect.collidepoint(event.pos):
+                        if self.hit_test(event.pos):
                             event = ButtonClickEvent(self)  # noqa
                             event.post()
 
@@ -293,7 +296,7 @@ class CharactersMenu(WidgetsGroup):
             x=0,
             y=0,
             text="Выбор персонажа",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         self.characters = []
@@ -317,6 +320,8 @@ class CharactersMenu(WidgetsGroup):
 
 
 class Lobby(WidgetsGroup):
+    event_types = (ButtonClickEvent,)
+
     def __init__(self, parent: Group, network_client: NetworkClient):
         """
         Интерфейс лобби.
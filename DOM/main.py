@@ -1,4 +1,5 @@
 from auth import AuthScreen
+from base import Group
 from game_client import GameClientScreen
 from logger import logger
 from menu import MenuScreen
@@ -8,12 +9,16 @@ from utils import FinishStatus
 
 
 def menu_screen(network_client: NetworkClient) -> None:
-    if MenuScreen(network_client).exec() == FinishStatus.enter_game:
+    with Group.batch():  # Виджеты окна обновляются один раз после построения
+        screen = MenuScreen(network_client)
+    if screen.exec() == FinishStatus.enter_game:
         game_client_screen(network_client)
 
 
 def game_client_screen(network_client: NetworkClient) -> None:
-    if GameClientScreen(network_client).exec() == FinishStatus.exit_game:
+    with Group.batch():
+        screen = GameClientScreen(network_client)
+    if screen.exec() == FinishStatus.exit_game:
         menu_screen(network_client)
 
 
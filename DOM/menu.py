@@ -12,7 +12,7 @@ import typing as ty
 import pygame as pg
 
 from app_info_alert import AppInfoAlert
-from base import Button, WidgetsGroup, Group, Alert, Label
+from base import Button, WidgetsGroup, Group, Alert, Label, RunLoop, FontRegistry
 from base.events import ButtonClickEvent
 from database.field_types import Resolution
 from lobby import Lobby, LobbyInvite
@@ -48,7 +48,7 @@ class ExitAlert(Alert):
             ),
             y=0,
             text="Выход",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         self.cancel_button = Button(
@@ -59,7 +59,7 @@ class ExitAlert(Alert):
             text=" X ",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=FontRegistry.get(font, int(font_size * 0.7)),
             border_width=2,
             callback=lambda event: self.hide(),
         )
@@ -71,7 +71,7 @@ class ExitAlert(Alert):
             text="Выйти из аккаунта",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             border_width=2,
             callback=lambda event: (
                 parent.terminate(),
@@ -89,7 +89,7 @@ class ExitAlert(Alert):
             text="Выйти из игры",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             border_width=2,
             callback=lambda event: parent.terminate(),
         )
@@ -165,6 +165,8 @@ class MenuButtons(WidgetsGroup):
 
 
 class MenuScreen(Group):
+    event_types = (ButtonClickEvent,)
+
     def __init__(self, network_client: NetworkClient = None):
         resolution = Resolution.converter(os.environ["resolution"])
         Settings.init_interface_size()
@@ -193,7 +195,7 @@ class MenuScreen(Group):
             text=" i",
             padding=5,
             active_background=pg.Color("#171717"),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             border_width=2,
             callback=lambda event: self.app_info_alert.show(),
         )
@@ -270,43 +272,39 @@ class MenuScreen(Group):
         self.lobby.enable(),
 
     def exec(self) -> str:
-        while self.running:
-            for event in pg.event.get():
-                if event.type == pg.QUIT:
-                    self.terminate()
-                elif event.type == ButtonClickEvent.type:
-                    # Обработка нажатий на кнопки
-                    if self.lobby_invite is not ...:
-                        # Обработка взаимодействия с приглашением в лобби
-                        if event.obj == self.lobby_invite.cancel:
-                            self.remove(self.lobby_invite)  # Удаляем приглашение
-                            self.lobby_invite: LobbyInvite = ...
-                            self.app_info_button.enable()
-                        elif event.obj == self.lobby_invite.accept:
-                            self.remove(self.lobby_invite)  # Удаляем приглашение
-                            self.network_client.join_lobby(
-                                self.lobby_invite.room_id,
-                                success_callback=self.open_lobby,
-                                fail_callback=lambda msg: self.info_alert.show_message(
-                                    msg
-                                ),
-                            )  # Присоединяемся к лобби
-                            self.lobby_invite: LobbyInvite = ...
-                    if self.lobby.buttons is not ...:
-                        # Обработка кнопок в лобби
-                        if event.obj == self.lobby.buttons.leave_lobby_button:
-                            self.network_client.leave_lobby()
-                            self.lobby.disable()
-                            self.lobby.hide()
-                            self.buttons.show()
-                            self.buttons.enable()
-                            self.app_info_button.enable()
-                            self.app_info_button.show()
-
-                self.handle_event(event)
-            self.render()
+        RunLoop(self).run()
         return self.finish_status
 
+    def handle_event(self, event: pg.event.Event) -> None:
+        if event.type == ButtonClickEvent.type:
+            # Обработка нажатий на кнопки
+            if self.lobby_invite is not ...:
+                # Обработка взаимодействия с приглашением в лобби
+                if event.obj == self.lobby_invite.cancel:
+                    self.remove(self.lobby_invite)  # Удаляем приглашение
+                    self.lobby_invite: LobbyInvite = ...
+                    self.app_info_button.enable()
+                elif event.obj == self.lobby_invite.accept:
+                    self.remove(self.lobby_invite)  # Удаляем приглашение
+                    self.network_client.join_lobby(
+                        self.lobby_invite.room_id,
+                        success_callback=self.open_lobby,
+                        fail_callback=lambda msg: self.info_alert.show_message(msg),
+                    )  # Присоединяемся к лобби
+                    self.lobby_invite: LobbyInvite = ...
+            if self.lobby.buttons is not ...:
+                # Обработка кнопок в лобби
+                if event.obj == self.lobby.buttons.leave_lobby_button:
+                    self.network_client.leave_lobby()
+                    self.lobby.disable()
+                    self.lobby.hide()
+                    self.buttons.show()
+                    self.buttons.enable()
+                    self.app_info_button.enable()
+                    self.app_info_button.show()
+
+        super(MenuScreen, self).handle_event(event)
+
     def render(self) -> None:
         self.screen.blit(self.back_art, self.back_art.get_rect())
         self.draw(self.screen)
@@ -9,51 +9,31 @@ from __future__ import annotations
 import atexit
 import os
 import typing as ty
-from dataclasses import dataclass
+from concurrent.futures import Future
 
-import requests
 import socketio  # noqa
 from loguru import logger
 
+from base import Inbox
 from game import Room, Player
-from game.room import Move
+from network_http import HttpClient
+from network_protocol import (  # noqa
+    NEXT_EVENTS,
+    SNAPSHOT_EVENTS,
+    User,
+    UserStatus,
+    update_room,
+)
+from network_requests import RequestLayer, RequestTimeout
 
 if ty.TYPE_CHECKING:
     from game.enemy import Enemy
     from game.boss import Boss
 
 
-class UserStatus(ty.NamedTuple):
-    text: str
-    color: str
-
-
-@dataclass
-class User:
-    """
-    Модель пользователя.
-    """
-
-    uid: int
-    username: str
-    icon: int  # ID иконки
-    friends: list[int]
-    friend_requests: list[int]
-    status: UserStatus
-
-    def __post_init__(self):
-        if self.status == 0:
-            self.status = UserStatus("Не в сети", "gray")
-        elif self.status == 1:
-            self.status = UserStatus("В сети", "green")
-        elif self.status == 2:
-            self.status = UserStatus("В лобби", "#0ACBE6")
-        elif self.status == 3:
-            self.status = UserStatus("Играет", "#0ACBE6")
-
-
 class NetworkClient:
     sio = socketio.Client()
+    request_layer = RequestLayer(sio)
 
     def __init__(self):
         self.user: User = ...
@@ -68,6 +48,130 @@ class NetworkClient:
         self.connect_handlers()
         atexit.register(self.disconnect)
 
+    def _on(
+        self,
+        event: str,
+        handler: ty.Callable[..., ty.Any],
+        log: ty.Callable[..., ty.Any] | None = None,
+    ) -> None:
+        """
+        Подключает обработчик события сервера.
+        Обработчик выполняется в основном потоке, при обработке Inbox,
+        после обновления комнаты по событию (network_protocol.update_room).
+        Из необработанных снимков состояния (network_protocol.SNAPSHOT_EVENTS)
+        с одним ключом обрабатывается только последний.
+        :param event: Название события.
+        :param handler: Обработчик.
+        :param log: Запись события в лог. Выполняется до обновления комнаты.
+        """
+        if (snapshot_key := SNAPSHOT_EVENTS.get(event)) is None:
+            self.sio.on(
+                event,
+                lambda *args: Inbox.post(self._on_event, event, handler, log, *args),
+            )
+        else:
+            self.sio.on(
+                event,
+                lambda *args: Inbox.post_update(
+                    (self, event, snapshot_key(*args)),
+                    self._on_event,
+                    event,
+                    handler,
+                    log,
+                    *args,
+                ),
+            )
+
+    def _on_event(
+        self,
+        event: str,
+        handler: ty.Callable[..., ty.Any],
+        log: ty.Callable[..., ty.Any] | None,
+        *args,
+    ) -> None:
+        if log is not None:
+            log(*args)
+        update_room(self, event, *args)
+        handler(*args)
+        if event in NEXT_EVENTS:
+            self.next()
+
+    def request(
+        self,
+        event: str,
+        data: dict[str, ...] | None = None,
+        *,
+        reply: str | None = None,
+        expects_reply: True | False | None = None,
+        timeout: float | None = None,
+    ) -> Future:
+        """
+        Отправляет запрос к серверу.
+        Запросы можно отправлять, не дожидаясь ответов на предыдущие.
+        :param event: Название запроса.
+        :param data: Данные запроса.
+        :param reply: Событие сервера, которым приходит ответ.
+            По умолчанию - по network_protocol.REQUESTS.
+        :param expects_reply: True - сервер всегда отвечает на запрос,
+            False - отвечает только при ошибке.
+            По умолчанию - по network_protocol.REQUESTS.
+        :param timeout: Время ожидания ответа (в секундах).
+        :return: Future ответа сервера. None - сервер подтвердил запрос без ответа.
+            Если сервер не ответил вовремя, future завершается
+            исключением RequestTimeout.
+        """
+        return self.request_layer.request(
+            event, data, reply=reply, expects_reply=expects_reply, timeout=timeout
+        )
+
+    def _request(
+        self,
+        event: str,
+        data: dict[str, ...] | None = None,
+        *,
+        on_response: ty.Callable[[dict[str, ...]], ...] | None = None,
+        on_ack: ty.Callable[[], ...] | None = None,
+        fail_callback: ty.Callable[[str], ...] | None = None,
+    ) -> Future:
+        """
+        Отправляет запрос к серверу и подключает обработчики к его ответу.
+        Обработчики выполняются в основном потоке, при обработке Inbox.
+        :param event: Название запроса.
+        :param data: Данные запроса.
+        :param on_response: Обработчик ответа сервера.
+        :param on_ack: Обработчик подтверждения запроса без ответа.
+        :param fail_callback: Обработчик ошибки: сервер не ответил вовремя.
+        :return: Future ответа сервера.
+        """
+        future = self.request(event, data)
+        future.add_done_callback(
+            lambda _: Inbox.post(
+                self._on_response, future, on_response, on_ack, fail_callback
+            )
+        )
+        return future
+
+    @staticmethod
+    def _on_response(
+        future: Future,
+        on_response: ty.Callable[[dict[str, ...]], ...] | None,
+        on_ack: ty.Callable[[], ...] | None,
+        fail_callback: ty.Callable[[str], ...] | None,
+    ) -> None:
+        if future.cancelled():
+            return
+        try:
+            response = future.result()
+        except RequestTimeout:
+            if fail_callback is not None:
+                fail_callback("Сервер не отвечает")
+            return
+        if response is None:
+            if on_ack is not None:
+                on_ack()
+        elif on_response is not None:
+            on_response(response)
+
     # ===== LOGIN =====
 
     def login(
@@ -76,7 +180,7 @@ class NetworkClient:
         password: str,
         success_callback: ty.Callable[[], ...],
         fail_callback: ty.Callable[[str], ...],
-    ) -> None:
+    ) -> Future:
         """
         Метод для авторизации пользователя.
         :param username: Имя пользователя.
@@ -84,18 +188,17 @@ class NetworkClient:
         :param success_callback: Обработчик успешной авторизации.
         :param fail_callback: Обработчик ошибки авторизации.
         """
-        # Подключаем обработчик
-        self.sio.on(
+        logger.opt(colors=True).debug(f"Авторизация - <g>{username}</g>")
+        return self._request(
             "login",
-            lambda response: self._on_auth(
+            dict(username=username, password=password),
+            on_response=lambda response: self._on_auth(
                 response,
                 success_callback,
                 fail_callback,
             ),
+            fail_callback=fail_callback,
         )
-        # Отправляем запрос к серверу
-        logger.opt(colors=True).debug(f"Авторизация - <g>{username}</g>")
-        self.sio.emit("login", dict(username=username, password=password))
 
     def signup(
         self,
@@ -103,7 +206,7 @@ class NetworkClient:
         password: str,
         success_callback: ty.Callable[[], ...],
         fail_callback: ty.Callable[[str], ...],
-    ) -> None:
+    ) -> Future:
         """
         Метод для регистрации пользователя.
         :param username: Имя пользователя.
@@ -111,16 +214,17 @@ class NetworkClient:
         :param success_callback: Обработчик успешной авторизации.
         :param fail_callback: Обработчик ошибки регистрации.
         """
-        self.sio.on(
+        logger.opt(colors=True).debug(f"Регистрация - <g>{username}</g>")
+        return self._request(
             "signup",
-            lambda response: self._on_auth(
+            dict(username=username, password=password),
+            on_response=lambda response: self._on_auth(
                 response,
                 success_callback,
                 fail_callback,
             ),
+            fail_callback=fail_callback,
         )
-        logger.opt(colors=True).debug(f"Регистрация - <g>{username}</g>")
-        self.sio.emit("signup", dict(username=username, password=password))
 
     def _on_auth(
         self,
@@ -146,10 +250,12 @@ class NetworkClient:
 
     # ===== FRIENDS =====
 
-    def get_social(self, callback: ty.Callable[[list[User], list[User]], ...]) -> None:
-        self.sio.on(
+    def get_social(
+        self, callback: ty.Callable[[list[User], list[User]], ...]
+    ) -> Future:
+        return self._request(
             "get social",
-            lambda response: (
+            on_response=lambda response: (
                 self.__setattr__("user", User(**response["me"])),
                 callback(
                     [User(**user) for user in response["friends"]],
@@ -157,17 +263,17 @@ class NetworkClient:
                 ),
             ),
         )
-        self.sio.emit("get social")
 
     def send_friend_request(
         self,
         username: str,
         success_callback: ty.Callable[[], ...],
         fail_callback: ty.Callable[[str], ...],
-    ) -> None:
-        self.sio.on(
+    ) -> Future:
+        return self._request(
             "send friend request",
-            lambda response: (
+            dict(username=username),
+            on_response=lambda response: (
                 (
                     lambda: (
                         logger.opt(colors=True).info(
@@ -179,11 +285,11 @@ class NetworkClient:
                 if response.get("status") == "ok"
                 else (lambda: fail_callback(response.get("msg", "Ошибка")))
             )(),
+            fail_callback=fail_callback,
         )
-        self.sio.emit("send friend request", dict(username=username))
 
     def on_friend_request(self, callback: ty.Callable[[list[User]], ...]) -> None:
-        self.sio.on(
+        self._on(
             "friend request",
             lambda response: (
                 logger.opt(colors=True).info(
@@ -203,7 +309,7 @@ class NetworkClient:
         self.sio.emit("add friend", dict(uid=uid))
 
     def on_add_friend(self, callback: ty.Callable[[User], ...]) -> None:
-        self.sio.on(
+        self._on(
             "add friend",
             lambda response: (
                 logger.opt(colors=True).info(
@@ -217,7 +323,7 @@ class NetworkClient:
         self.sio.emit("delete friend", dict(uid=uid))
 
     def on_delete_friend(self, callback: ty.Callable[[User], ...]) -> None:
-        self.sio.on(
+        self._on(
             "delete friend",
             lambda response: (
                 logger.opt(colors=True).info(
@@ -228,7 +334,7 @@ class NetworkClient:
         )
 
     def on_change_user_status(self, callback: ty.Callable[[User], ...]) -> None:
-        self.sio.on(
+        self._on(
             "change user status", lambda response: callback(User(**response["user"]))
         )
 
@@ -236,11 +342,11 @@ class NetworkClient:
 
     # === CREATE LOBBY ===
 
-    def create_lobby(self, callback: ty.Callable[[], ...]) -> None:
-        self.sio.on(
-            "create lobby", lambda response: self._on_create_lobby(response, callback)
+    def create_lobby(self, callback: ty.Callable[[], ...]) -> Future:
+        return self._request(
+            "create lobby",
+            on_response=lambda response: self._on_create_lobby(response, callback),
         )
-        self.sio.emit("create lobby")
 
     def _on_create_lobby(
         self, response: dict[str, int], callback: ty.Callable[[], ...]
@@ -252,22 +358,23 @@ class NetworkClient:
 
     # === LOBBY INVITES ===
 
-    def send_invite(self, user: User, fail_callback: ty.Callable[[str], ...]) -> None:
+    def send_invite(
+        self, user: User, fail_callback: ty.Callable[[str], ...]
+    ) -> Future | None:
         if self.room is not ...:
-            self.sio.on(
-                "send invite",
-                lambda response: fail_callback(response.get("msg", "Ошибка")),
-            )
-            self.sio.emit(
+            return self._request(
                 "send invite",
                 dict(uid=user.uid, room_id=self.room.room_id),
-                callback=lambda: logger.opt(colors=True).info(
+                on_response=lambda response: fail_callback(
+                    response.get("msg", "Ошибка")
+                ),
+                on_ack=lambda: logger.opt(colors=True).info(
                     f"Пользователю {user.username} отправлено приглашение в группу"
                 ),
             )
 
     def on_lobby_invite(self, callback: ty.Callable[[str, int], ...]) -> None:
-        self.sio.on(
+        self._on(
             "lobby invite",
             lambda response: (
                 logger.opt(colors=True).info(
@@ -285,14 +392,15 @@ class NetworkClient:
         room_id: int,
         success_callback: ty.Callable[[], ...],
         fail_callback: ty.Callable[[str], ...],
-    ) -> None:
-        self.sio.on(
+    ) -> Future:
+        return self._request(
             "join lobby",
-            lambda response: self._on_join_lobby(
+            dict(room_id=room_id),
+            on_response=lambda response: self._on_join_lobby(
                 response, success_callback, fail_callback
             ),
+            fail_callback=fail_callback,
         )
-        self.sio.emit("join lobby", dict(room_id=room_id))
 
     def _on_join_lobby(
         self,
@@ -312,16 +420,9 @@ class NetworkClient:
             fail_callback(response.get("msg", "Ошибка"))
 
     def on_joining_the_lobby(self, callback: ty.Callable[[], ...]) -> None:
-        self.sio.on(
+        self._on(
             "joining the lobby",
             lambda response: (
-                (
-                    self.room.join(User(**response["user"]))
-                    if not self.room.get_by_uid(response["user"]["uid"])
-                    else ...
-                )
-                if self.room is not ...
-                else ...,
                 logger.opt(colors=True).info(
                     f"<y>{response['user']['username']}</y> "
                     "присоединился к вашей группе"
@@ -340,13 +441,7 @@ class NetworkClient:
         self.room: Room = ...
 
     def on_leaving_the_lobby(self, callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
-            "leaving the lobby",
-            lambda response: (
-                self.room.leave(response["uid"]),
-                callback(response["msg"]),
-            ),
-        )
+        self._on("leaving the lobby", lambda response: callback(response["msg"]))
 
     # === SELECT CHARACTER ===
 
@@ -357,7 +452,7 @@ class NetworkClient:
         )
 
     def on_character_selection(self, callback: ty.Callable[[int, int], ...]) -> None:
-        self.sio.on(
+        self._on(
             "character selection",
             lambda response: (
                 logger.opt(colors=True).info(
@@ -374,7 +469,7 @@ class NetworkClient:
         self.sio.emit("ready", dict(room_id=self.room.room_id))
 
     def on_ready(self, callback: ty.Callable[[int], ...]) -> None:
-        self.sio.on(
+        self._on(
             "ready",
             lambda response: (
                 logger.opt(colors=True).info(f"Игрок <y>{response['uid']}</y> готов"),
@@ -386,7 +481,7 @@ class NetworkClient:
         self.sio.emit("no ready", dict(room_id=self.room.room_id))
 
     def on_no_ready(self, callback: ty.Callable[[int], ...]) -> None:
-        self.sio.on(
+        self._on(
             "no ready",
             lambda response: (
                 logger.opt(colors=True).info(
@@ -400,108 +495,89 @@ class NetworkClient:
 
     # === START GAME ===
 
-    def start_game(self, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
-            "start game fail",
-            lambda response: fail_callback(response.get("msg", "err")),
+    def start_game(self, fail_callback: ty.Callable[[str], ...]) -> Future:
+        return self._request(
+            "start game",
+            dict(room_id=self.room.room_id),
+            on_response=lambda response: fail_callback(response.get("msg", "err")),
         )
-        self.sio.emit("start game", dict(room_id=self.room.room_id))
 
     def on_loading_game(self, callback: ty.Callable[[], ...]) -> None:
-        self.sio.on(
+        self._on(
             "loading game",
             lambda *response: (logger.info("Загрузка уровня"), callback()),
         )
 
     def on_start_game(self, callback: ty.Callable[[], ...]) -> None:
-        self.sio.on(
+        self._on(
             "start game",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"Уровень <y>{response['lvl']}</y> загружен"
-                ),
-                self.room.init_lvl(**response),
-                callback(),
+            lambda response: callback(),
+            log=lambda response: logger.opt(colors=True).info(
+                f"Уровень <y>{response['lvl']}</y> загружен"
             ),
         )
 
     # === GAME UPDATES ===
 
     def on_update_players(self, callback: ty.Callable[[], ...]) -> None:
-        self.sio.on(
+        self._on(
             "update players",
-            lambda response: (
-                logger.info("Обновление списка игроков"),
-                [self.room.update_player(player) for player in response["players"]],
-                callback(),
-                logger.debug("Игроки обновлены"),
-            ),
+            lambda response: (callback(), logger.debug("Игроки обновлены")),
+            log=lambda response: logger.info("Обновление списка игроков"),
         )
 
     def on_update_enemies(self, callback: ty.Callable[[], ...]) -> None:
-        self.sio.on(
+        self._on(
             "update enemies",
-            lambda response: (
-                logger.info("Обновление списка врагов"),
-                self.room.update_enemies(response["enemies"]),
-                callback(),
-            ),
+            lambda response: callback(),
+            log=lambda response: logger.info("Обновление списка врагов"),
         )
 
     def on_boss_heal(self, callback: ty.Callable[[], ...]) -> None:
-        self.sio.on(
+        self._on(
             "boss heal",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    "<y>Босс</y> восстановил здоровье "
-                    f"<c>{response['last']}</c> -> <c>{response['boss']['hp']}</c>"
-                ),
-                self.room.update_boss(response["boss"]),
-                callback(),
+            lambda response: callback(),
+            log=lambda response: logger.opt(colors=True).info(
+                "<y>Босс</y> восстановил здоровье "
+                f"<c>{response['last']}</c> -> <c>{response['boss']['hp']}</c>"
             ),
         )
 
     def on_game_over(
         self, callback: ty.Callable[[dict[str, dict[str, int]]], ...]
     ) -> None:
-        self.sio.on(
+        self._on(
             "game over",
-            lambda response: (
-                logger.info("Игра окончена"),
-                self.sio.handlers.clear(),
-                self.__setattr__("room", ...),
-                callback(response),
-            ),
+            lambda response: (self.sio.handlers.clear(), callback(response)),
+            log=lambda response: logger.info("Игра окончена"),
         )
 
     def ping(self, y: int, x: int) -> None:
         self.sio.emit("ping", dict(room_id=self.room.room_id, y=y, x=x))
 
     def on_ping(self, callback: ty.Callable[[int, int], ...]) -> None:
-        self.sio.on("ping", lambda response: callback(response["y"], response["x"]))
+        self._on("ping", lambda response: callback(response["y"], response["x"]))
 
     # === ITEMS ===
 
-    def buy_item(self, item_index: int, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on("buy item", lambda response: fail_callback(response.get("msg")))
-        self.sio.emit(
-            "buy item", dict(room_id=self.room.room_id, item_index=item_index)
+    def buy_item(
+        self, item_index: int, fail_callback: ty.Callable[[str], ...]
+    ) -> Future:
+        return self._request(
+            "buy item",
+            dict(room_id=self.room.room_id, item_index=item_index),
+            on_response=lambda response: fail_callback(response.get("msg")),
         )
 
     def on_buying_an_item(self, callback: ty.Callable[[int, Player], ...]) -> None:
-        self.sio.on(
+        self._on(
             "buying an item",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"Игрок <y>{response['player']['username']}</y> купил предмет "
-                    f"<y>{self.room.shop[response['item_index']].name}</y>"
-                ),
-                self.room.shop.__setitem__(response["item_index"], None),
-                self.room.update_player(response["player"]),
-                callback(
-                    response["item_index"],
-                    self.room.get_by_uid(response["player"]["uid"]),
-                ),
+            lambda response: callback(
+                response["item_index"], self.room.get_by_uid(response["player"]["uid"])
+            ),
+            log=lambda response: logger.opt(colors=True).info(
+                f"Игрок <y>{response['player']['username']}</y> купил предмет "
+                f"<y>{self.room.shop[response['item_index']].name}</y>"
             ),
         )
 
@@ -511,86 +587,70 @@ class NetworkClient:
         )
 
     def on_removing_an_item(self, callback: ty.Callable[[Player], ...]) -> None:
-        self.sio.on(
+        self._on(
             "removing an item",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"Игрок <y>{response['player']['username']}</y> продал предмет "
-                    f"<y>{response['item']['name']}</y>"
-                ),
-                self.room.update_player(response["player"]),
-                callback(self.room.get_by_uid(response["player"]["uid"])),
+            lambda response: callback(self.room.get_by_uid(response["player"]["uid"])),
+            log=lambda response: logger.opt(colors=True).info(
+                f"Игрок <y>{response['player']['username']}</y> продал предмет "
+                f"<y>{response['item']['name']}</y>"
             ),
         )
 
     # === MOVING ===
 
-    def move(self, y: int, x: int, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on("move", lambda response: fail_callback(response.get("msg", "Err")))
-        self.sio.emit("move", dict(room_id=self.room.room_id, y=y, x=x))
+    def move(self, y: int, x: int, fail_callback: ty.Callable[[str], ...]) -> Future:
+        return self._request(
+            "move",
+            dict(room_id=self.room.room_id, y=y, x=x),
+            on_response=lambda response: fail_callback(response.get("msg", "Err")),
+        )
 
     def on_player_moving(self, callback: ty.Callable[[], ...]) -> None:
-        self.sio.on(
+        self._on(
             "player moving",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"<y>{response['player']['username']}</y> "
-                    f"move to <c>{response['pos']}</c>"
-                ),
-                self.room.update_player(response["player"]),
-                callback(),
+            lambda response: callback(),
+            log=lambda response: logger.opt(colors=True).info(
+                f"<y>{response['player']['username']}</y> "
+                f"move to <c>{response['pos']}</c>"
             ),
         )
 
     def on_enemy_moving(self, callback: ty.Callable[[], ...]) -> None:
-        self.sio.on(
+        self._on(
             "enemy moving",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"Enemy <y>{response['eid']}</y> move to <c>{response['pos']}</c>"
-                ),
-                self.room.update_enemy(response["enemy"]),
-                callback(),
-                self.next(),
+            lambda response: callback(),
+            log=lambda response: logger.opt(colors=True).info(
+                f"Enemy <y>{response['eid']}</y> move to <c>{response['pos']}</c>"
             ),
         )
 
     def on_boss_moving(self, callback: ty.Callable[[], ...]) -> None:
-        self.sio.on(
+        self._on(
             "boss moving",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"<y>Boss</y> move to <c>{response['pos']}</c>"
-                ),
-                self.room.update_boss(response["boss"]),
-                callback(),
-                self.next(),
+            lambda response: callback(),
+            log=lambda response: logger.opt(colors=True).info(
+                f"<y>Boss</y> move to <c>{response['pos']}</c>"
             ),
         )
 
     # == ROLL THE DICE ==
 
-    def roll_the_dice(self, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
-            "roll the dice", lambda response: fail_callback(response.get("msg"))
+    def roll_the_dice(self, fail_callback: ty.Callable[[str], ...]) -> Future:
+        return self._request(
+            "roll the dice",
+            dict(room_id=self.room.room_id),
+            on_response=lambda response: fail_callback(response.get("msg")),
         )
-        self.sio.emit("roll the dice", dict(room_id=self.room.room_id))
 
     def on_rolling_the_dice(
         self, callback: ty.Callable[[list[tuple[int, int]]], ...]
     ) -> None:
-        self.sio.on(
+        self._on(
             "rolling the dice",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"Игрок <y>{response['uid']}</y> кинул кость: "
-                    f"<c>{response['movement']}</c> -> <c>{response['result']}</c>"
-                ),
-                self.room.__setattr__(
-                    "move_data",
-                    Move(response["uid"], response["result"], response["movement"]),
-                ),
-                callback(self.room.move_data.movement),
+            lambda response: callback(self.room.move_data.movement),
+            log=lambda response: logger.opt(colors=True).info(
+                f"Игрок <y>{response['uid']}</y> кинул кость: "
+                f"<c>{response['movement']}</c> -> <c>{response['result']}</c>"
             ),
         )
 
@@ -599,26 +659,26 @@ class NetworkClient:
     def next(self, command: str = "") -> None:
         self.sio.emit("next", dict(room_id=self.room.room_id, command=command))
 
-    def pass_move(self, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
-            "pass move", lambda response: fail_callback(response.get("msg", "Err"))
+    def pass_move(self, fail_callback: ty.Callable[[str], ...]) -> Future:
+        return self._request(
+            "pass move",
+            dict(room_id=self.room.room_id),
+            on_response=lambda response: fail_callback(response.get("msg", "Err")),
         )
-        self.sio.emit("pass move", dict(room_id=self.room.room_id))
 
     def on_set_queue(self, callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
+        self._on(
             "set queue",
-            lambda response: (
-                logger.opt(colors=True).info(f"Ход передан <y>{response['queue']}</y>"),
-                self.room.__setattr__("queue", response["queue"]),
-                callback(response["queue"]),
+            lambda response: callback(response["queue"]),
+            log=lambda response: logger.opt(colors=True).info(
+                f"Ход передан <y>{response['queue']}</y>"
             ),
         )
 
     # === FIGHT ===
 
     def on_fight(self, callback: ty.Callable[[int], ...]) -> None:
-        self.sio.on(
+        self._on(
             "fight",
             lambda response: (
                 logger.opt(colors=True).info(
@@ -631,16 +691,17 @@ class NetworkClient:
 
     # == FIGHT DICE ==
 
-    def roll_the_fight_dice(self, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
-            "roll the fight dice", lambda response: fail_callback(response.get("msg"))
+    def roll_the_fight_dice(self, fail_callback: ty.Callable[[str], ...]) -> Future:
+        return self._request(
+            "roll the fight dice",
+            dict(room_id=self.room.room_id),
+            on_response=lambda response: fail_callback(response.get("msg")),
         )
-        self.sio.emit("roll the fight dice", dict(room_id=self.room.room_id))
 
     def on_rolling_the_fight_dice(
         self, callback: ty.Callable[[list[tuple[int, int]]], ...]
     ) -> None:
-        self.sio.on(
+        self._on(
             "rolling the fight dice",
             lambda response: (
                 logger.opt(colors=True).info(
@@ -654,7 +715,7 @@ class NetworkClient:
     def on_boss_rolling_the_dice(
         self, callback: ty.Callable[[list[tuple[int, int]]], ...]
     ) -> None:
-        self.sio.on(
+        self._on(
             "boss rolling the dice",
             lambda response: (
                 logger.opt(colors=True).info(
@@ -668,90 +729,67 @@ class NetworkClient:
     # == HITS ==
 
     def on_hit_player(self, callback: ty.Callable[[Player], ...]) -> None:
-        self.sio.on(
+        self._on(
             "hit player",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"Игрок <y>{response['player']['username']}</y> ранен "
-                    f"<y>hp</y>=<c>{response['player']['character']['hp']}</c>"
-                ),
-                self.room.update_player(response["player"]),
-                callback(self.room.get_by_uid(response["uid"])),
+            lambda response: callback(self.room.get_by_uid(response["uid"])),
+            log=lambda response: logger.opt(colors=True).info(
+                f"Игрок <y>{response['player']['username']}</y> ранен "
+                f"<y>hp</y>=<c>{response['player']['character']['hp']}</c>"
             ),
         )
 
     def on_kill_player(self, callback: ty.Callable[[Player], ...]) -> None:
-        self.sio.on(
+        self._on(
             "kill player",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"Игрок <y>{response['player']['username']}</y> погиб"
-                ),
-                self.room.update_player(response["player"]),
-                callback(self.room.get_by_uid(response["uid"])),
-                self.next(),
+            lambda response: callback(self.room.get_by_uid(response["uid"])),
+            log=lambda response: logger.opt(colors=True).info(
+                f"Игрок <y>{response['player']['username']}</y> погиб"
             ),
         )
 
     def on_hit_enemy(self, callback: ty.Callable[[Enemy], ...]) -> None:
-        self.sio.on(
+        self._on(
             "hit enemy",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"Игрок <y>{self.room.get_by_uid(response['uid']).username}</y> "
-                    f"ранил врага <y>{response['eid']}</y> "
-                    f"<y>hp</y>=<c>{response['enemy']['hp']}</c>"
-                ),
-                self.room.update_enemy(response["enemy"]),
-                callback(self.room.get_by_eid(response["eid"])),
-                self.next(),
+            lambda response: callback(self.room.get_by_eid(response["eid"])),
+            log=lambda response: logger.opt(colors=True).info(
+                f"Игрок <y>{self.room.get_by_uid(response['uid']).username}</y> "
+                f"ранил врага <y>{response['eid']}</y> "
+                f"<y>hp</y>=<c>{response['enemy']['hp']}</c>"
             ),
         )
 
     def on_kill_enemy(self, callback: ty.Callable[[int], ...]) -> None:
-        self.sio.on(
+        self._on(
             "kill enemy",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"Игрок <y>{self.room.get_by_uid(response['uid']).username}</y> "
-                    f"убил врага <y>{response['eid']}</y> "
-                ),
-                self.room.enemies.remove(self.room.get_by_eid(response["eid"])),
-                callback(response["eid"]),
-                self.next(),
+            lambda response: callback(response["eid"]),
+            log=lambda response: logger.opt(colors=True).info(
+                f"Игрок <y>{self.room.get_by_uid(response['uid']).username}</y> "
+                f"убил врага <y>{response['eid']}</y> "
             ),
         )
 
     def on_hit_boss(self, callback: ty.Callable[[Boss], ...]) -> None:
-        self.sio.on(
+        self._on(
             "hit boss",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"Игрок <y>{self.room.get_by_uid(response['uid']).username}</y> "
-                    f"ранил босса <y>hp</y>=<c>{response['boss']['hp']}</c>"
-                ),
-                self.room.update_boss(response["boss"]),
-                callback(self.room.boss),
-                self.next(),
+            lambda response: callback(self.room.boss),
+            log=lambda response: logger.opt(colors=True).info(
+                f"Игрок <y>{self.room.get_by_uid(response['uid']).username}</y> "
+                f"ранил босса <y>hp</y>=<c>{response['boss']['hp']}</c>"
             ),
         )
 
     def on_kill_boss(self, callback: ty.Callable[[], ...]) -> None:
-        self.sio.on(
+        self._on(
             "kill boss",
-            lambda response: (
-                logger.opt(colors=True).info(
-                    f"Игрок <y>{self.room.get_by_uid(response['uid']).username}</y> "
-                    f"убил босса"
-                ),
-                self.room.update_boss(response["boss"]),
-                callback(),
-                self.next(),
+            lambda response: callback(),
+            log=lambda response: logger.opt(colors=True).info(
+                f"Игрок <y>{self.room.get_by_uid(response['uid']).username}</y> "
+                f"убил босса"
             ),
         )
 
     def on_hit(self, callback: ty.Callable[[list[tuple[int, int]]], ...]) -> None:
-        self.sio.on(
+        self._on(
             "hit",
             lambda response: (
                 logger.opt(colors=True).info(
@@ -764,16 +802,17 @@ class NetworkClient:
 
     # == CHOICE ENEMY ==
 
-    def choice_enemy(self, eid: int, fail_callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
-            "choice enemy", lambda response: fail_callback(response.get("msg", "Err"))
+    def choice_enemy(self, eid: int, fail_callback: ty.Callable[[str], ...]) -> Future:
+        return self._request(
+            "choice enemy",
+            dict(room_id=self.room.room_id, eid=eid),
+            on_response=lambda response: fail_callback(response.get("msg", "Err")),
         )
-        self.sio.emit("choice enemy", dict(room_id=self.room.room_id, eid=eid))
 
     def on_need_choice_enemy(
         self, callback: ty.Callable[[int, list[int]], ...]
     ) -> None:
-        self.sio.on(
+        self._on(
             "need choice enemy",
             lambda response: (
                 logger.opt(colors=True).info(
@@ -797,9 +836,12 @@ class NetworkClient:
             _disconnect()
 
         self.sio.wait()
+        logger.opt(colors=True).debug(
+            f"Запросы к серверу: <c>{self.request_layer.stats()}</c>"
+        )
 
     def on_error(self, callback: ty.Callable[[str], ...]) -> None:
-        self.sio.on(
+        self._on(
             "error",
             lambda response: (logger.error(response["msg"]), callback(response["msg"])),
         )
@@ -815,10 +857,7 @@ class NetworkClient:
 
     @staticmethod
     def _send_request(namespace, **kwargs) -> dict:
-        return requests.get(
-            f"{os.environ['HOST']}/{namespace}?"
-            + "&".join(f"{k}={v}" for k, v in kwargs.items())
-        ).json()
+        return HttpClient.get_json(f"{os.environ['HOST']}/{namespace}", kwargs)
 
     def connect_handlers(self) -> None:
-        self.sio.on("need next", lambda *_: self.next())
+        self._on("need next", lambda *_: ...)
@@ -0,0 +1,429 @@
+"""
+
+Асинхронный клиент сервера DOM на socketio.AsyncClient.
+
+Нужен ботам и интеграционным тестам: сотни клиентов работают
+в одном процессе, в одном цикле событий asyncio:
+
+    async def bot(username: str) -> None:
+        client = AsyncNetworkClient()
+        await client.connect()
+        await client.login(username, "password")
+        room = await client.join_lobby(room_id)
+        async for event in client.events("set queue"):
+            ...
+
+    async def main() -> None:
+        await asyncio.gather(*(bot(name) for name in names))
+
+    asyncio.run(main())
+
+Каждый клиент хранит свою комнату (Room) и обновляет ее по событиям сервера
+так же, как NetworkClient. Запросы - корутины: ответ сервера возвращается,
+ошибка сервера поднимается исключением ServerError, отсутствие ответа -
+исключением RequestTimeout. Запросы сопоставляются с ответами
+и комната обновляется по правилам протокола, общим с NetworkClient
+(см. network_protocol).
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import typing as ty
+
+import socketio  # noqa
+from loguru import logger
+
+from game import Room, Player
+from network_protocol import (
+    EVENTS,
+    NEXT_EVENTS,
+    REPLIES,
+    PendingRequest,
+    RequestMatcher,
+    User,
+    update_room,
+)
+from network_requests import LatencyHistogram, RequestTimeout
+
+
+class ServerEvent(ty.NamedTuple):
+    name: str  # Название события
+    data: ty.Any  # Данные события
+
+
+class ServerError(Exception):
+    """
+    Сервер отклонил запрос.
+    """
+
+
+class AsyncNetworkClient:
+    timeout: float = 10  # Время ожидания ответа по умолчанию (в секундах)
+
+    def __init__(self):
+        """
+        Асинхронный клиент сервера.
+        Создается и используется внутри цикла событий asyncio.
+        """
+        self.sio = socketio.AsyncClient()
+        self.user: User = ...
+        self.room: Room = ...
+
+        self._matcher = RequestMatcher()
+        # Подписчики на события: (названия событий, очередь событий)
+        self._subscribers: list[tuple[frozenset[str], asyncio.Queue]] = []
+        self.latency: dict[str, LatencyHistogram] = {}  # Задержки по запросам
+        self._queued = 0  # Кол-во запросов, ожидавших ответа на предыдущий
+        self._timeouts = 0  # Кол-во запросов без ответа
+        self._late = 0  # Кол-во ответов на отмененные запросы
+
+        for event in EVENTS:
+            self.sio.on(event, self._event_handler(event))
+        for reply in REPLIES:
+            self.sio.on(reply, self._reply_handler(reply))
+
+    async def connect(self, host: str | None = None) -> None:
+        """
+        Устанавливает соединение с сервером.
+        :param host: Адрес сервера. По умолчанию - переменная окружения HOST.
+        """
+        host = host or os.environ["HOST"]
+        logger.debug(f"Подключение к серверу: {host}")
+        await self.sio.connect(host, wait_timeout=10)
+
+    async def disconnect(self) -> None:
+        """
+        Выходит из лобби и аккаунта и закрывает соединение.
+        """
+        if self.room is not ...:
+            await self.leave_lobby()
+        if self.user is not ...:
+            await self.sio.call("logout", timeout=self.timeout)
+        await self.sio.disconnect()
+
+    # ===== REQUESTS =====
+
+    async def request(
+        self,
+        event: str,
+        data: dict[str, ...] | None = None,
+        *,
+        reply: str | None = None,
+        expects_reply: True | False | None = None,
+        timeout: float | None = None,
+    ) -> ty.Any:
+        """
+        Отправляет запрос к серверу и ждет ответа.
+        :param event: Название запроса.
+        :param data: Данные запроса.
+        :param reply: Событие сервера, которым приходит ответ.
+            По умолчанию - по network_protocol.REQUESTS.
+        :param expects_reply: True - сервер всегда отвечает на запрос,
+            False - отвечает только при ошибке.
+            По умолчанию - по network_protocol.REQUESTS.
+        :param timeout: Время ожидания ответа (в секундах).
+        :return: Ответ сервера. None - сервер подтвердил запрос без ответа.
+        """
+        request = PendingRequest(
+            event,
+            data,
+            asyncio.get_running_loop().create_future(),
+            reply=reply,
+            expects_reply=expects_reply,
+        )
+        try:
+            if self._matcher.add(request):
+                await self._emit(request)
+            else:
+                self._queued += 1
+            response = await asyncio.wait_for(
+                request.future, self.timeout if timeout is None else timeout
+            )
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            logger.opt(colors=True).debug(f"Нет ответа на запрос <y>{event}</y>")
+            raise RequestTimeout(event) from None
+        finally:
+            if request.timer is not None:
+                request.timer.cancel()
+            # Ответ не получен: запрос просрочен, отменен или не отправлен
+            request.future.cancel()
+            if request.future.cancelled():
+                for next_request in self._matcher.remove(request):
+                    await self._emit(next_request)
+        answered = request.acked_at if response is None else None
+        self.latency.setdefault(event, LatencyHistogram()).add(
+            ((answered or time.perf_counter()) - request.start) * 1000
+        )
+        return response
+
+    async def _emit(self, request: PendingRequest) -> None:
+        async def on_ack(*response) -> None:
+            matched, following = self._matcher.on_ack(request, response)
+            if matched:
+                self._resolve(request, response)
+            elif not response and not request.expects_reply:
+                # Событие ошибки может прийти после подтверждения:
+                # запрос ждет его вместо ответа
+                request.timer = asyncio.ensure_future(self._settle(request))
+            for next_request in following:
+                await self._emit(next_request)
+
+        await self.sio.emit(request.event, request.data, callback=on_ack)
+
+    async def _settle(self, request: PendingRequest) -> None:
+        """
+        Завершает без ответа подтвержденный запрос, если событие ошибки не пришло.
+        """
+        await asyncio.sleep(self._matcher.grace)
+        request.timer = None
+        matched, following = self._matcher.settle(request)
+        if matched:
+            self._resolve(request, ())
+        for next_request in following:
+            await self._emit(next_request)
+
+    def _reply_handler(self, reply: str) -> ty.Callable[..., ty.Awaitable[None]]:
+        async def handler(*response) -> None:
+            request, following = self._matcher.on_reply(reply)
+            if request is None:
+                logger.opt(colors=True).debug(
+                    f"Ответ <y>{reply}</y> без ожидающего запроса"
+                )
+                return
+            self._resolve(request, response)
+            for next_request in following:
+                await self._emit(next_request)
+
+        return handler
+
+    def _resolve(self, request: PendingRequest, response: tuple) -> None:
+        if request.future.cancelled():
+            self._late += 1
+        else:
+            request.future.set_result(response[0] if response else None)
+
+    @staticmethod
+    def _check(response: dict[str, ...] | None, default: str = "Ошибка") -> None:
+        """
+        Поднимает ServerError, если сервер ответил на запрос,
+        на который отвечает только при ошибке.
+        """
+        if response is not None:
+            raise ServerError(response.get("msg", default))
+
+    def stats(self) -> dict[str, ...]:
+        """
+        :return: Метрики запросов и гистограммы задержек по запросам.
+        """
+        return {
+            "in_flight": self._matcher.in_flight(),
+            "queued": self._queued,
+            "timeouts": self._timeouts,
+            "late": self._late,
+            "latency": {
+                event: histogram.stats() for event, histogram in self.latency.items()
+            },
+        }
+
+    # ===== EVENTS =====
+
+    def _event_handler(self, name: str) -> ty.Callable[..., ty.Awaitable[None]]:
+        async def handler(*response) -> None:
+            update_room(self, name, *response)
+            if name in NEXT_EVENTS:
+                await self.next()
+            event = ServerEvent(name, response[0] if response else None)
+            for names, queue in self._subscribers:
+                if not names or name in names:
+                    queue.put_nowait(event)
+
+        return handler
+
+    async def events(self, *names: str) -> ty.AsyncIterator[ServerEvent]:
+        """
+        События сервера, полученные после начала перебора.
+        Комната клиента обновлена к моменту получения события.
+        :param names: Названия событий. По умолчанию - все события.
+        """
+        subscriber = (frozenset(names), asyncio.Queue())
+        self._subscribers.append(subscriber)
+        try:
+            while True:
+                yield await subscriber[1].get()
+        finally:
+            self._subscribers.remove(subscriber)
+
+    async def wait_event(
+        self, *names: str, timeout: float | None = None
+    ) -> ServerEvent:
+        """
+        Ждет событие сервера.
+        :param names: Названия событий. По умолчанию - любое событие.
+        :param timeout: Время ожидания (в секундах).
+        """
+        subscriber = (frozenset(names), asyncio.Queue())
+        self._subscribers.append(subscriber)
+        try:
+            return await asyncio.wait_for(subscriber[1].get(), timeout)
+        finally:
+            self._subscribers.remove(subscriber)
+
+    # ===== LOGIN =====
+
+    async def login(self, username: str, password: str) -> User:
+        logger.opt(colors=True).debug(f"Авторизация - <g>{username}</g>")
+        return self._on_auth(
+            await self.request("login", dict(username=username, password=password))
+        )
+
+    async def signup(self, username: str, password: str) -> User:
+        logger.opt(colors=True).debug(f"Регистрация - <g>{username}</g>")
+        return self._on_auth(
+            await self.request("signup", dict(username=username, password=password))
+        )
+
+    def _on_auth(self, response: dict[str, ...]) -> User:
+        if response.get("status") != "ok":
+            raise ServerError(response.get("msg", "Ошибка"))
+        self.user = User(**response["user"])
+        logger.opt(colors=True).debug(f"Авторизован - <g>{self.user.username}</g>")
+        return self.user
+
+    # ===== FRIENDS =====
+
+    async def get_social(self) -> tuple[list[User], list[User]]:
+        """
+        :return: Друзья и запросы дружбы.
+        """
+        response = await self.request("get social")
+        self.user = User(**response["me"])
+        return (
+            [User(**user) for user in response["friends"]],
+            [User(**user) for user in response["friend_requests"]],
+        )
+
+    async def send_friend_request(self, username: str) -> None:
+        response = await self.request("send friend request", dict(username=username))
+        if response.get("status") != "ok":
+            raise ServerError(response.get("msg", "Ошибка"))
+
+    async def delete_friend_request(self, user: User) -> None:
+        await self.sio.emit("delete friend request", dict(uid=user.uid))
+
+    async def add_friend(self, uid: int) -> None:
+        await self.sio.emit("add friend", dict(uid=uid))
+
+    async def delete_friend(self, uid: int) -> None:
+        await self.sio.emit("delete friend", dict(uid=uid))
+
+    # ===== LOBBY =====
+
+    async def create_lobby(self) -> Room:
+        response = await self.request("create lobby")
+        self.room = Room(response["room_id"])
+        self.room.join(self.user, is_owner=True)
+        logger.opt(colors=True).debug(f"Создана комната <y>{self.room.room_id}</y>")
+        return self.room
+
+    async def send_invite(self, user: User) -> None:
+        self._check(
+            await self.request(
+                "send invite", dict(uid=user.uid, room_id=self.room.room_id)
+            )
+        )
+
+    async def join_lobby(self, room_id: int) -> Room:
+        response = await self.request("join lobby", dict(room_id=room_id))
+        if response.get("status") != "ok":
+            raise ServerError(response.get("msg", "Ошибка"))
+        self.room = Room(response["room_id"])
+        for i, player in enumerate(response["users"]):
+            self.room.join(Player(**player, is_owner=i == 0))
+        logger.opt(colors=True).debug(
+            f"Вы присоединились в лобби <y>{self.room.room_id}</y>"
+        )
+        return self.room
+
+    async def leave_lobby(self) -> None:
+        await self.sio.emit("leave lobby", dict(room_id=self.room.room_id))
+        self.room: Room = ...
+
+    async def select_character(self, character_id: int) -> None:
+        await self.sio.emit(
+            "select character",
+            dict(room_id=self.room.room_id, character_id=character_id),
+        )
+
+    async def ready(self) -> None:
+        await self.sio.emit("ready", dict(room_id=self.room.room_id))
+
+    async def no_ready(self) -> None:
+        await self.sio.emit("no ready", dict(room_id=self.room.room_id))
+
+    # ==== GAME =====
+
+    async def start_game(self) -> None:
+        self._check(
+            await self.request("start game", dict(room_id=self.room.room_id)),
+            "err",
+        )
+
+    async def ping(self, y: int, x: int) -> None:
+        await self.sio.emit("ping", dict(room_id=self.room.room_id, y=y, x=x))
+
+    # === ITEMS ===
+
+    async def buy_item(self, item_index: int) -> None:
+        self._check(
+            await self.request(
+                "buy item", dict(room_id=self.room.room_id, item_index=item_index)
+            )
+        )
+
+    async def remove_item(self, item_index: int) -> None:
+        await self.sio.emit(
+            "remove item", dict(room_id=self.room.room_id, item_index=item_index)
+        )
+
+    # === MOVING ===
+
+    async def move(self, y: int, x: int) -> None:
+        self._check(
+            await self.request("move", dict(room_id=self.room.room_id, y=y, x=x)),
+            "Err",
+        )
+
+    async def roll_the_dice(self) -> None:
+        self._check(
+            await self.request("roll the dice", dict(room_id=self.room.room_id))
+        )
+
+    # === QUEUE ===
+
+    async def next(self, command: str = "") -> None:
+        await self.sio.emit("next", dict(room_id=self.room.room_id, command=command))
+
+    async def pass_move(self) -> None:
+        self._check(
+            await self.request("pass move", dict(room_id=self.room.room_id)), "Err"
+        )
+
+    # === FIGHT ===
+
+    async def roll_the_fight_dice(self) -> None:
+        self._check(
+            await self.request("roll the fight dice", dict(room_id=self.room.room_id))
+        )
+
+    async def choice_enemy(self, eid: int) -> None:
+        self._check(
+            await self.request(
+                "choice enemy", dict(room_id=self.room.room_id, eid=eid)
+            ),
+            "Err",
+        )
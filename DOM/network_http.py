@@ -0,0 +1,195 @@
+"""
+
+HTTP запросы к серверу DOM.
+
+Запросы идут через общую сессию requests: соединение с сервером
+переиспользуется (keep-alive), у запросов есть время ожидания,
+неудачные запросы повторяются.
+Ответы хранятся в файле HTTP_CACHE_PATH. Ответ, полученный не раньше
+HTTP_CACHE_TTL секунд назад, возвращается без запроса к серверу.
+Более старый ответ проверяется условным запросом (If-None-Match /
+If-Modified-Since): если он не изменился, сервер отвечает 304 без тела.
+Если сервер недоступен, возвращается последний сохраненный ответ.
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import typing as ty
+
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HttpClient:
+    timeout: tuple[float, float] = (3.05, 10)  # Время ожидания: соединения, ответа
+    # Повтор запросов при ошибках соединения и ответах 5xx
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+
+    _session: requests.Session | None = None
+    # URL -> (время получения, ETag, Last-Modified, ответ)
+    _cache: dict[str, tuple[float, str | None, str | None, ty.Any]] | None = None
+    _lock = threading.Lock()
+
+    # Метрики
+    _fresh = 0  # Кол-во ответов из кэша без запроса к серверу
+    _revalidated = 0  # Кол-во ответов из кэша, подтвержденных сервером (304)
+    _fetched = 0  # Кол-во ответов, полученных от сервера
+    _stale = 0  # Кол-во ответов из кэша при недоступном сервере
+    _total_time = 0.0  # Суммарное время запросов (в секундах)
+    _max_time = 0.0  # Максимальное время запроса (в секундах)
+
+    @staticmethod
+    def ttl() -> float:
+        """
+        :return: Время, в течение которого ответ не проверяется (в секундах).
+        """
+        return float(os.environ.get("HTTP_CACHE_TTL", 5 * 60))
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        """
+        :return: Общая сессия с пулом соединений.
+        """
+        with cls._lock:
+            if cls._session is None:
+                cls._session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=4, max_retries=cls.retries)
+                cls._session.mount("https://", adapter)
+                cls._session.mount("http://", adapter)
+            return cls._session
+
+    @classmethod
+    def get_json(cls, url: str, params: dict[str, ...] | None = None) -> ty.Any:
+        """
+        GET запрос, возвращающий JSON.
+        Может вызываться из любого потока.
+        :param url: Адрес.
+        :param params: Параметры запроса.
+        :return: Ответ сервера.
+        """
+        url = requests.Request("GET", url, params=params).prepare().url
+        start = time.perf_counter()
+        with cls._lock:
+            entry = cls._load().get(url)
+
+        if entry is not None and time.time() - entry[0] < cls.ttl():
+            cls._fresh += 1
+            cls._log(url, "cache", start)
+            return entry[3]
+
+        headers = {}
+        if entry is not None:
+            if entry[1]:
+                headers["If-None-Match"] = entry[1]
+            if entry[2]:
+                headers["If-Modified-Since"] = entry[2]
+        try:
+            response = cls.session().get(url, headers=headers, timeout=cls.timeout)
+            if response.status_code == 304 and entry is not None:
+                entry = (time.time(), *entry[1:])
+                cls._revalidated += 1
+            else:
+                response.raise_for_status()
+                entry = (
+                    time.time(),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    response.json(),
+                )
+                cls._fetched += 1
+        except (requests.RequestException, ValueError) as error:
+            if entry is None:
+                raise
+            logger.opt(colors=True).warning(
+                f"HTTP <y>{url}</y>: {type(error).__name__}, "
+                "используется сохраненный ответ"
+            )
+            cls._stale += 1
+            cls._log(url, "stale", start)
+            return entry[3]
+
+        with cls._lock:
+            cls._cache[url] = entry
+            cls._save()
+        cls._log(url, response.status_code, start)
+        return entry[3]
+
+    @classmethod
+    def _load(cls) -> dict[str, tuple[float, str | None, str | None, ty.Any]]:
+        """
+        Загружает кэш из файла при первом обращении.
+        Вызывается при захваченном cls._lock.
+        """
+        if cls._cache is None:
+            cls._cache = {}
+            path = os.environ.get("HTTP_CACHE_PATH")
+            if path and os.path.isfile(path):
+                try:
+                    with open(path, encoding="utf-8") as file:
+                        cls._cache = {
+                            url: tuple(entry) for url, entry in json.load(file).items()
+                        }
+                except (OSError, ValueError):
+                    logger.warning("Файл кэша HTTP поврежден")
+        return cls._cache
+
+    @classmethod
+    def _save(cls) -> None:
+        """
+        Сохраняет кэш в файл.
+        Вызывается при захваченном cls._lock.
+        """
+        if not (path := os.environ.get("HTTP_CACHE_PATH")):
+            return
+        try:
+            with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+                json.dump(cls._cache, file, ensure_ascii=False)
+            os.replace(f"{path}.tmp", path)
+        except OSError as error:
+            logger.warning(f"Не удалось сохранить кэш HTTP: {error}")
+
+    @classmethod
+    def _log(cls, url: str, status: int | str, start: float) -> None:
+        duration = time.perf_counter() - start
+        cls._total_time += duration
+        cls._max_time = max(cls._max_time, duration)
+        logger.opt(colors=True).debug(
+            f"HTTP <y>{url}</y>: <c>{status}</c> <e>{duration * 1000:.1f}</e> ms"
+        )
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Очищает кэш ответов.
+        """
+        with cls._lock:
+            cls._cache = {}
+            cls._save()
+
+    @classmethod
+    def stats(cls) -> dict[str, int | float]:
+        """
+        :return: Метрики HTTP запросов.
+        """
+        requests_count = cls._fresh + cls._revalidated + cls._fetched + cls._stale
+        return {
+            "fresh": cls._fresh,
+            "revalidated": cls._revalidated,
+            "fetched": cls._fetched,
+            "stale": cls._stale,
+            "avg_ms": cls._total_time * 1000 / (requests_count or 1),
+            "max_ms": cls._max_time * 1000,
+        }
@@ -0,0 +1,399 @@
+"""
+
+Протокол сервера DOM, общий для NetworkClient и AsyncNetworkClient.
+
+Здесь описаны события сервера, запросы клиента и события ответа на них
+(REQUESTS), сопоставление ответов с запросами (RequestMatcher)
+и обновление комнаты клиента по событиям сервера (update_room).
+
+Запрос отправляется с подтверждением socket.io (ack), и socket.io сопоставляет
+подтверждение с запросом. Если сервер возвращает ответ в подтверждении,
+запрос завершается им.
+Иначе ответом считается событие сервера (REQUESTS[запрос].reply).
+Событие не указывает, на какой запрос оно отвечает, поэтому запросы
+с общим событием ответа отправляются по одному: следующий - после ответа
+на предыдущий. Запросы с разными событиями ответа отправляются сразу.
+После первого ответа в подтверждении запросы с тем же названием
+отправляются сразу.
+На одни запросы сервер отвечает всегда (expects_reply), на другие - только
+при ошибке. Клиент socket.io обрабатывает пакеты независимо друг от друга,
+и подтверждение может прийти раньше события, поэтому подтверждение
+без ответа запрос не завершает. Запрос первого вида ждет события ответа.
+Запрос второго вида ждет события ошибки еще RequestMatcher.grace секунд
+и, если его нет, завершается без ответа: сервер обработал запрос без ошибки.
+
+"""
+
+from __future__ import annotations
+
+import time
+import typing as ty
+from collections import deque
+from dataclasses import dataclass
+
+from game.room import Move
+
+if ty.TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Future
+
+    from network import NetworkClient
+    from network_async import AsyncNetworkClient
+
+
+class UserStatus(ty.NamedTuple):
+    text: str
+    color: str
+
+
+@dataclass
+class User:
+    """
+    Модель пользователя.
+    """
+
+    uid: int
+    username: str
+    icon: int  # ID иконки
+    friends: list[int]
+    friend_requests: list[int]
+    status: UserStatus
+
+    def __post_init__(self):
+        if self.status == 0:
+            self.status = UserStatus("Не в сети", "gray")
+        elif self.status == 1:
+            self.status = UserStatus("В сети", "green")
+        elif self.status == 2:
+            self.status = UserStatus("В лобби", "#0ACBE6")
+        elif self.status == 3:
+            self.status = UserStatus("Играет", "#0ACBE6")
+
+
+# ===== REQUESTS =====
+
+
+class RequestRule(ty.NamedTuple):
+    reply: str  # Событие сервера, которым приходит ответ
+    expects_reply: True | False  # True - сервер отвечает всегда, False - при ошибке
+
+
+# Запросы клиента, на которые сервер отвечает
+REQUESTS: dict[str, RequestRule] = {
+    "login": RequestRule("login", True),
+    "signup": RequestRule("signup", True),
+    "get social": RequestRule("get social", True),
+    "send friend request": RequestRule("send friend request", True),
+    "create lobby": RequestRule("create lobby", True),
+    "join lobby": RequestRule("join lobby", True),
+    "send invite": RequestRule("send invite", False),
+    "start game": RequestRule("start game fail", False),
+    "buy item": RequestRule("buy item", False),
+    "move": RequestRule("move", False),
+    "roll the dice": RequestRule("roll the dice", False),
+    "pass move": RequestRule("pass move", False),
+    "roll the fight dice": RequestRule("roll the fight dice", False),
+    "choice enemy": RequestRule("choice enemy", False),
+}
+
+# События, которыми сервер отвечает на запросы клиента
+REPLIES: tuple[str, ...] = tuple(
+    dict.fromkeys(rule.reply for rule in REQUESTS.values())
+)
+
+
+class PendingRequest:
+    __slots__ = (
+        "event",
+        "data",
+        "reply",
+        "expects_reply",
+        "future",
+        "start",
+        "acked_at",
+        "timer",
+    )
+
+    def __init__(
+        self,
+        event: str,
+        data: ty.Any,
+        future: Future | asyncio.Future,
+        *,
+        reply: str | None = None,
+        expects_reply: True | False | None = None,
+    ):
+        """
+        Запрос, ожидающий ответа.
+        :param event: Название запроса.
+        :param data: Данные запроса.
+        :param future: Future, которое завершается ответом.
+        :param reply: Событие сервера, которым приходит ответ.
+            По умолчанию - по REQUESTS или событие с названием запроса.
+        :param expects_reply: True - сервер всегда отвечает на запрос.
+            По умолчанию - по REQUESTS.
+        """
+        rule = REQUESTS.get(event, RequestRule(event, False))
+        self.event = event
+        self.data = data
+        self.reply = reply or rule.reply
+        self.expects_reply = (
+            rule.expects_reply if expects_reply is None else expects_reply
+        )
+        self.future = future
+        self.start = time.perf_counter()
+        self.acked_at: float | None = None  # Время подтверждения без ответа
+        # Завершает запрос по времени. Отменяется, когда запрос больше не ожидается
+        self.timer: ty.Any = None
+
+
+class RequestMatcher:
+    # Время ожидания события ошибки после подтверждения без ответа (в секундах)
+    grace: float = 0.1
+
+    def __init__(self):
+        """
+        Сопоставление ответов сервера с запросами.
+        Не обращается к сети: методы возвращают запросы, которые клиент
+        должен отправить. Методы вызываются из одного потока
+        или под блокировкой клиента.
+        """
+        # Событие ответа -> отправленные запросы, ожидающие ответа
+        self.pending: dict[str, deque[PendingRequest]] = {}
+        # Событие ответа -> запросы, ожидающие отправки
+        self.waiting: dict[str, deque[PendingRequest]] = {}
+        # Запросы, на которые сервер отвечает в подтверждении
+        self.acked: set[str] = set()
+
+    def add(self, request: PendingRequest) -> True | False:
+        """
+        :return: True - запрос нужно отправить сейчас,
+            False - запрос ждет ответа на предыдущий.
+        """
+        if request.event not in self.acked and self.pending.get(request.reply):
+            self.waiting.setdefault(request.reply, deque()).append(request)
+            return False
+        self.pending.setdefault(request.reply, deque()).append(request)
+        return True
+
+    def on_ack(
+        self, request: PendingRequest, response: tuple
+    ) -> tuple[True | False, list[PendingRequest]]:
+        """
+        Подтверждение запроса сервером.
+        Подтверждение без ответа запрос не завершает: запрос ждет события
+        ответа, а если сервер отвечает только при ошибке - события ошибки
+        в течение grace секунд, после чего клиент завершает его (settle).
+        :param response: Данные подтверждения.
+        :return: True - запрос нужно завершить ответом из подтверждения;
+            запросы, которые теперь можно отправить.
+        """
+        if not response:
+            request.acked_at = time.perf_counter()
+            return False, []
+        self.acked.add(request.event)
+        return self.settle(request)
+
+    def settle(
+        self, request: PendingRequest
+    ) -> tuple[True | False, list[PendingRequest]]:
+        """
+        Завершает запрос без события ответа.
+        :return: True - запрос ожидал ответа и должен быть завершен;
+            запросы, которые теперь можно отправить.
+        """
+        pending = self.pending.get(request.reply, ())
+        if request not in pending:
+            return False, []  # Ответ уже пришел событием или запрос просрочен
+        pending.remove(request)
+        return True, self._next(request.reply)
+
+    def on_reply(
+        self, reply: str
+    ) -> tuple[PendingRequest | None, list[PendingRequest]]:
+        """
+        Ответ событием сервера.
+        :param reply: Событие.
+        :return: Самый ранний запрос, ожидающий события (None - таких нет);
+            запросы, которые теперь можно отправить.
+        """
+        pending = self.pending.get(reply)
+        if not pending:
+            return None, []
+        return pending.popleft(), self._next(reply)
+
+    def remove(self, request: PendingRequest) -> list[PendingRequest]:
+        """
+        Убирает просроченный или отмененный запрос.
+        :return: Запросы, которые теперь можно отправить.
+        """
+        pending = self.pending.get(request.reply, ())
+        if request in pending:
+            # Ответ больше не ожидается, иначе следующие запросы
+            # с тем же событием ответа не будут отправлены
+            pending.remove(request)
+            return self._next(request.reply)
+        if request in self.waiting.get(request.reply, ()):
+            self.waiting[request.reply].remove(request)
+        return []
+
+    def _next(self, reply: str) -> list[PendingRequest]:
+        """
+        :return: Запросы с событием ответа reply, которые можно отправить:
+            запросы, на которые сервер отвечает в подтверждении,
+            и не больше одного запроса, ответ на который придет событием.
+        """
+        following = []
+        waiting = self.waiting.get(reply)
+        while waiting:
+            request = waiting.popleft()
+            if request.future.cancelled():
+                if request.timer is not None:
+                    request.timer.cancel()
+                continue  # Отмененный до отправки запрос не отправляется
+            self.pending[reply].append(request)
+            following.append(request)
+            if request.event not in self.acked:
+                break
+        return following
+
+    def in_flight(self) -> int:
+        """
+        :return: Кол-во запросов, ожидающих ответа.
+        """
+        return sum(len(pending) for pending in self.pending.values())
+
+
+# ===== EVENTS =====
+
+# События, которые сервер отправляет сам (не в ответ на запрос клиента)
+EVENTS = (
+    "friend request",
+    "add friend",
+    "delete friend",
+    "change user status",
+    "lobby invite",
+    "joining the lobby",
+    "leaving the lobby",
+    "character selection",
+    "ready",
+    "no ready",
+    "loading game",
+    "start game",
+    "update players",
+    "update enemies",
+    "boss heal",
+    "game over",
+    "ping",
+    "buying an item",
+    "removing an item",
+    "player moving",
+    "enemy moving",
+    "boss moving",
+    "rolling the dice",
+    "set queue",
+    "need next",
+    "fight",
+    "rolling the fight dice",
+    "boss rolling the dice",
+    "hit player",
+    "kill player",
+    "hit enemy",
+    "kill enemy",
+    "hit boss",
+    "kill boss",
+    "hit",
+    "need choice enemy",
+    "error",
+)
+
+Client = ty.Union["NetworkClient", "AsyncNetworkClient"]
+
+
+def _on_joining_the_lobby(client: Client, response: dict[str, ...]) -> None:
+    if client.room is not ... and not client.room.get_by_uid(response["user"]["uid"]):
+        client.room.join(User(**response["user"]))
+
+
+def _on_buying_an_item(client: Client, response: dict[str, ...]) -> None:
+    client.room.shop[response["item_index"]] = None
+    client.room.update_player(response["player"])
+
+
+# Событие сервера -> обновление комнаты клиента
+ROOM_UPDATES: dict[str, ty.Callable[[Client, ty.Any], None]] = {
+    "joining the lobby": _on_joining_the_lobby,
+    "leaving the lobby": lambda client, response: client.room.leave(response["uid"]),
+    "start game": lambda client, response: client.room.init_lvl(**response),
+    "update players": lambda client, response: [
+        client.room.update_player(player) for player in response["players"]
+    ],
+    "update enemies": lambda client, response: client.room.update_enemies(
+        response["enemies"]
+    ),
+    "boss heal": lambda client, response: client.room.update_boss(response["boss"]),
+    "game over": lambda client, response: client.__setattr__("room", ...),
+    "buying an item": _on_buying_an_item,
+    "removing an item": lambda client, response: client.room.update_player(
+        response["player"]
+    ),
+    "player moving": lambda client, response: client.room.update_player(
+        response["player"]
+    ),
+    "enemy moving": lambda client, response: client.room.update_enemy(
+        response["enemy"]
+    ),
+    "boss moving": lambda client, response: client.room.update_boss(response["boss"]),
+    "rolling the dice": lambda client, response: client.room.__setattr__(
+        "move_data", Move(response["uid"], response["result"], response["movement"])
+    ),
+    "set queue": lambda client, response: client.room.__setattr__(
+        "queue", response["queue"]
+    ),
+    "hit player": lambda client, response: client.room.update_player(
+        response["player"]
+    ),
+    "kill player": lambda client, response: client.room.update_player(
+        response["player"]
+    ),
+    "hit enemy": lambda client, response: client.room.update_enemy(response["enemy"]),
+    "kill enemy": lambda client, response: client.room.enemies.remove(
+        client.room.get_by_eid(response["eid"])
+    ),
+    "hit boss": lambda client, response: client.room.update_boss(response["boss"]),
+    "kill boss": lambda client, response: client.room.update_boss(response["boss"]),
+}
+
+# События, после обработки которых клиент отправляет серверу next
+NEXT_EVENTS = frozenset(
+    {
+        "enemy moving",
+        "boss moving",
+        "need next",
+        "kill player",
+        "hit enemy",
+        "kill enemy",
+        "hit boss",
+        "kill boss",
+    }
+)
+
+# События - снимки состояния: событие -> ключ снимка по данным события.
+# Необработанный снимок заменяется более поздним с тем же ключом
+SNAPSHOT_EVENTS: dict[str, ty.Callable[[ty.Any], ty.Hashable]] = {
+    "change user status": lambda response: response["user"]["uid"],
+    "update players": lambda response: None,
+    "update enemies": lambda response: None,
+    "set queue": lambda response: None,
+}
+
+
+def update_room(client: Client, event: str, *response) -> None:
+    """
+    Обновляет комнату клиента по событию сервера.
+    :param client: Клиент.
+    :param event: Название события.
+    :param response: Данные события.
+    """
+    if (update := ROOM_UPDATES.get(event)) is not None:
+        update(client, response[0] if response else None)
@@ -0,0 +1,288 @@
+"""
+
+Запросы к серверу DOM с ответами.
+
+Каждый запрос возвращает concurrent.futures.Future: ответ можно ждать
+(future.result(timeout)), отменить (future.cancel()) или получить в функции
+(future.add_done_callback). Из asyncio запрос ожидается через
+asyncio.wrap_future. Несколько запросов можно отправить, не дожидаясь ответов.
+
+Запросы сопоставляются с ответами по правилам протокола
+(см. network_protocol): на каждое событие ответа подключается один
+постоянный обработчик.
+
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+import typing as ty
+from concurrent.futures import Future
+
+from loguru import logger
+
+from base import Thread
+from network_protocol import PendingRequest, RequestMatcher
+
+if ty.TYPE_CHECKING:
+    import socketio  # noqa
+
+
+class RequestTimeout(TimeoutError):
+    """
+    Сервер не ответил на запрос вовремя.
+    """
+
+
+class LatencyHistogram:
+    # Верхние границы корзин (в миллисекундах)
+    bounds: tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    def __init__(self):
+        """
+        Гистограмма задержек ответа.
+        """
+        self.counts = [0] * (len(self.bounds) + 1)  # Последняя корзина - больше 5 с
+        self.count = 0
+        self.total = 0.0  # Сумма задержек (в миллисекундах)
+        self.max = 0.0
+
+    def add(self, latency: float) -> None:
+        """
+        :param latency: Задержка (в миллисекундах).
+        """
+        self.counts[bisect.bisect_left(self.bounds, latency)] += 1
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    def percentile(self, q: float) -> float:
+        """
+        :param q: Доля запросов (от 0 до 1).
+        :return: Верхняя граница корзины, в которую попадает доля q запросов
+            (в миллисекундах).
+        """
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def stats(self) -> dict[str, int | float | dict[str, int]]:
+        return {
+            "count": self.count,
+            "avg_ms": self.total / (self.count or 1),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max,
+            "buckets": {
+                f"<={bound}": count
+                for bound, count in zip(self.bounds, self.counts)
+                if count
+            }
+            | ({f">{self.bounds[-1]}": self.counts[-1]} if self.counts[-1] else {}),
+        }
+
+
+class RequestLayer:
+    timeout: float = 10  # Время ожидания ответа по умолчанию (в секундах)
+
+    def __init__(self, sio: socketio.Client):
+        """
+        Запросы к серверу с ответами.
+        :param sio: Клиент socket.io.
+        """
+        self.sio = sio
+        self._lock = threading.Lock()
+        self._matcher = RequestMatcher()
+        self._handlers: dict[str, ty.Callable[..., None]] = {}  # Обработчики ответов
+        self.latency: dict[str, LatencyHistogram] = {}  # Задержки по запросам
+
+        # Метрики
+        self._sent = 0  # Кол-во отправленных запросов
+        self._queued = 0  # Кол-во запросов, ожидавших ответа на предыдущий
+        self._timeouts = 0  # Кол-во запросов без ответа
+        self._late = 0  # Кол-во ответов на отмененные запросы
+        self._max_in_flight = 0  # Наибольшее кол-во одновременных запросов
+
+    def request(
+        self,
+        event: str,
+        data: ty.Any = None,
+        *,
+        reply: str | None = None,
+        expects_reply: True | False | None = None,
+        timeout: float | None = None,
+    ) -> Future:
+        """
+        Отправляет запрос.
+        Может вызываться из любого потока.
+        :param event: Название запроса.
+        :param data: Данные запроса.
+        :param reply: Событие сервера, которым приходит ответ.
+            По умолчанию - по network_protocol.REQUESTS.
+        :param expects_reply: True - сервер всегда отвечает на запрос,
+            False - отвечает только при ошибке.
+            По умолчанию - по network_protocol.REQUESTS.
+        :param timeout: Время ожидания ответа (в секундах). По истечении
+            future завершается исключением RequestTimeout.
+        :return: Ответ сервера (None - сервер подтвердил запрос без ответа).
+        """
+        request = PendingRequest(
+            event, data, Future(), reply=reply, expects_reply=expects_reply
+        )
+        with self._lock:
+            self._listen(request.reply)
+            request.timer = Thread(
+                self._on_timeout,
+                args=(request,),
+                delay=self.timeout if timeout is None else timeout,
+            ).run()
+            if not self._matcher.add(request):
+                self._queued += 1
+                return request.future
+        self._emit(request)
+        return request.future
+
+    def _emit(self, request: PendingRequest) -> None:
+        with self._lock:
+            self._sent += 1
+            self._max_in_flight = max(self._max_in_flight, self.in_flight())
+        logger.opt(colors=True).trace(f"Запрос <y>{request.event}</y>")
+        self.sio.emit(
+            request.event,
+            request.data,
+            callback=lambda *response: self._on_ack(request, response),
+        )
+
+    def _listen(self, reply: str) -> None:
+        """
+        Подключает обработчик ответов, если он еще не подключен
+        (или был отключен очисткой обработчиков клиента).
+        Вызывается при захваченном self._lock.
+        """
+        handler = self._handlers.get(reply)
+        if handler is None:
+            handler = self._handlers[reply] = lambda *response: self._on_reply(
+                reply, response
+            )
+        if self.sio.handlers.get("/", {}).get(reply) is not handler:
+            self.sio.on(reply, handler)
+
+    def _on_reply(self, reply: str, response: tuple) -> None:
+        """
+        Ответ событием сервера: завершает самый ранний запрос, ожидающий его.
+        """
+        with self._lock:
+            request, following = self._matcher.on_reply(reply)
+            if request is None:
+                logger.opt(colors=True).debug(
+                    f"Ответ <y>{reply}</y> без ожидающего запроса"
+                )
+                return
+            claimed = self._claim(request)
+        if claimed:
+            request.future.set_result(response[0] if response else None)
+        for next_request in following:
+            self._emit(next_request)
+
+    def _on_ack(self, request: PendingRequest, response: tuple) -> None:
+        """
+        Подтверждение запроса сервером.
+        """
+        with self._lock:
+            matched, following = self._matcher.on_ack(request, response)
+            if not matched:
+                if not response and not request.expects_reply:
+                    # Событие ошибки может прийти после подтверждения:
+                    # запрос ждет его вместо ответа
+                    request.timer.cancel()
+                    request.timer = Thread(
+                        self._on_grace, args=(request,), delay=self._matcher.grace
+                    ).run()
+                return
+            claimed = self._claim(request)
+        if claimed:
+            request.future.set_result(response[0] if response else None)
+        for next_request in following:
+            self._emit(next_request)
+
+    def _on_grace(self, request: PendingRequest) -> None:
+        """
+        Завершает без ответа подтвержденный запрос, если событие ошибки не пришло.
+        """
+        with self._lock:
+            matched, following = self._matcher.settle(request)
+            claimed = matched and self._claim(request, request.acked_at)
+        if claimed:
+            request.future.set_result(None)
+        for next_request in following:
+            self._emit(next_request)
+
+    def _on_timeout(self, request: PendingRequest) -> None:
+        """
+        Завершает запрос исключением RequestTimeout, если ответ не пришел.
+        Отмененный запрос удаляется из очереди.
+        """
+        future = request.future
+        with self._lock:
+            if future.running() or future.done() and not future.cancelled():
+                return  # Ответ пришел
+            expired = future.set_running_or_notify_cancel()
+            following = self._matcher.remove(request)
+            if expired:
+                self._timeouts += 1
+        if expired:
+            logger.opt(colors=True).debug(
+                f"Нет ответа на запрос <y>{request.event}</y>"
+            )
+            future.set_exception(RequestTimeout(request.event))
+        for next_request in following:
+            self._emit(next_request)
+
+    def _claim(
+        self, request: PendingRequest, answered: float | None = None
+    ) -> True | False:
+        """
+        Учитывает задержку ответа и забирает запрос для завершения.
+        Вызывается при захваченном self._lock.
+        :param answered: Время ответа (по умолчанию - текущее).
+        :return: True - запрос ожидал ответа и должен быть завершен им,
+            False - запрос отменен, ответ отбрасывается.
+        """
+        request.timer.cancel()
+        if request.future.cancelled():
+            self._late += 1
+            return False
+        self.latency.setdefault(request.event, LatencyHistogram()).add(
+            ((answered or time.perf_counter()) - request.start) * 1000
+        )
+        return request.future.set_running_or_notify_cancel()
+
+    def in_flight(self) -> int:
+        """
+        :return: Кол-во запросов, ожидающих ответа.
+        """
+        return self._matcher.in_flight()
+
+    def stats(self) -> dict[str, ...]:
+        """
+        :return: Метрики запросов и гистограммы задержек по запросам.
+        """
+        with self._lock:
+            return {
+                "sent": self._sent,
+                "in_flight": self.in_flight(),
+                "max_in_flight": self._max_in_flight,
+                "queued": self._queued,
+                "timeouts": self._timeouts,
+                "late": self._late,
+                "latency": {
+                    event: histogram.stats()
+                    for event, histogram in self.latency.items()
+                },
+            }
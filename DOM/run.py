@@ -78,6 +78,12 @@ os.environ["CUBE_PATH"] = os.path.join(os.environ["APP_DIR"], "cube")
 os.environ["FONT"] = os.path.join(os.environ["APP_DIR"], "font.ttf")
 # Версия приложения
 os.environ["VERSION"] = "1.0.0-beta.1"
+# Максимальный объем кэша изображений (в байтах)
+os.environ["IMAGES_CACHE_SIZE"] = str(64 * 1024 * 1024)
+# Путь к файлу кэша HTTP ответов сервера
+os.environ["HTTP_CACHE_PATH"] = os.path.join(os.environ["APP_DIR"], "http_cache.json")
+# Время, в течение которого HTTP ответ сервера не проверяется (в секундах)
+os.environ["HTTP_CACHE_TTL"] = str(5 * 60)
 # Уровень логирования
 os.environ["LOGGING_LEVEL"] = args.ll
 # Сервер
@@ -12,7 +12,7 @@ import typing as ty
 import pygame as pg
 from loguru import logger
 
-from base import Button, WidgetsGroup, Alert, Label
+from base import Button, WidgetsGroup, Alert, Label, FontRegistry
 from base.events import ButtonClickEvent
 from database import Config
 from database.field_types import ALLOWED_RESOLUTION, Resolution
@@ -22,6 +22,8 @@ if ty.TYPE_CHECKING:
 
 
 class Settings(Alert):
+    event_types = (ButtonClickEvent,)
+
     def __init__(self, parent: Group):
         resolution = Resolution.converter(os.environ["resolution"])
         font_size = int(os.environ["font_size"])
@@ -48,7 +50,7 @@ class Settings(Alert):
             text=" X ",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=FontRegistry.get(font, int(font_size * 0.7)),
             border_width=2,
             callback=lambda event: self.hide(),
         )
@@ -115,6 +117,8 @@ class Settings(Alert):
             int(30 * (1 + ALLOWED_RESOLUTION.index(resolution) * 0.4))
         )  # Масштабируем размер кнопок в зависимости от размера окна
 
+        FontRegistry.preload_ui()
+
 
 class ResolutionSetting(WidgetsGroup):
     """
@@ -134,7 +138,7 @@ class ResolutionSetting(WidgetsGroup):
             x=0,
             y=0,
             text="Разрешение:",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         self.btn_low = Button(
@@ -145,7 +149,7 @@ class ResolutionSetting(WidgetsGroup):
             text=" < ",
             padding=2,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=FontRegistry.get(font, int(font_size * 0.7)),
             border_width=2,
         )
 
@@ -156,7 +160,7 @@ class ResolutionSetting(WidgetsGroup):
             y=lambda obj: round(self.btn_low.rect.height / 2 - obj.rect.height / 2),
             text=str(resolution),
             color=pg.Color("#b9a66d"),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         self.btn_up = Button(
@@ -167,7 +171,7 @@ class ResolutionSetting(WidgetsGroup):
             text=" > ",
             padding=2,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=FontRegistry.get(font, int(font_size * 0.7)),
             border_width=2,
         )
 
@@ -17,6 +17,7 @@ import pygame as pg
 from loguru import logger
 
 from base import (
+    FontRegistry,
     Button,
     WidgetsGroup,
     Label,
@@ -70,7 +71,7 @@ class FriendDropMenu(DropMenu):
             text="Удалить друга",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=FontRegistry.get(font, int(font_size * 0.7)),
         )
 
         self.send_invite_button = Button(
@@ -81,7 +82,7 @@ class FriendDropMenu(DropMenu):
             text="Пригласить в группу",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=FontRegistry.get(font, int(font_size * 0.7)),
         )
 
     def show(self) -> None:
@@ -155,7 +156,7 @@ class UserWidget(WidgetsGroup):
             x=self.icon.rect.right + 30,
             y=0,
             text=user.username,
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         self.status = Label(
@@ -165,7 +166,7 @@ class UserWidget(WidgetsGroup):
             y=self.username.rect.bottom + 5,
             text=user.status.text,
             color=pg.Color(user.status.color),
-            font=pg.font.Font(font, int(font_size * 0.8)),
+            font=FontRegistry.get(font, int(font_size * 0.8)),
         )
 
     def set_status(self, status: UserStatus) -> None:
@@ -181,6 +182,8 @@ class UserWidget(WidgetsGroup):
 
 
 class FriendWidget(UserWidget):
+    event_types = (ButtonClickEvent,)
+
     def __init__(
         self,
         parent: Social,
@@ -264,7 +267,7 @@ class FriendRequestWidget(UserWidget):
             text=" + ",
             padding=1,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.8)),
+            font=FontRegistry.get(font, int(font_size * 0.8)),
             callback=lambda event: callback("ok", self),
         )
 
@@ -276,7 +279,7 @@ class FriendRequestWidget(UserWidget):
             text=" - ",
             padding=1,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.8)),
+            font=FontRegistry.get(font, int(font_size * 0.8)),
             callback=lambda event: callback("cancel", self),
         )
 
@@ -323,7 +326,7 @@ class FriendRequests(Alert):
             text=" X ",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, int(font_size * 0.7)),
+            font=FontRegistry.get(font, int(font_size * 0.7)),
             border_width=2,
             callback=lambda event: self.hide(),
         )
@@ -336,7 +339,7 @@ class FriendRequests(Alert):
             ),
             y=0,
             text="Добавить друзей",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         self.username_input = InputBox(
@@ -347,7 +350,7 @@ class FriendRequests(Alert):
             description="Имя пользователя",
             width=int(self.rect.width * 0.8) - self.padding * 2,
             padding=5,
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             inactive_border_color=pg.Color("#b9a66d"),
             active_border_color=pg.Color("#f0ce69"),
             border_width=3,
@@ -363,7 +366,7 @@ class FriendRequests(Alert):
             height=self.username_input.input_line.rect.height,
             text="Найти",
             padding=5,
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             active_background=pg.Color(222, 222, 222, 100),
             border_width=3,
             callback=lambda event: self.send_request(),
@@ -377,7 +380,7 @@ class FriendRequests(Alert):
             ),
             y=self.find_friend_button.rect.bottom + 10,
             text="Запросы в друзья",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
         )
 
         self.friend_requests = []
@@ -489,7 +492,7 @@ class Social(WidgetsGroup):
             x=5,
             y=self.line.rect.bottom + 5,
             text="Сообщество",
-            font=pg.font.Font(font, int(font_size * 0.8)),
+            font=FontRegistry.get(font, int(font_size * 0.8)),
         )
         self.add_friend_button = Button(
             self,
@@ -498,7 +501,7 @@ class Social(WidgetsGroup):
             y=self.title.rect.top,
             text=" + ",
             color=pg.Color("#b9a66d"),
-            font=pg.font.Font(font, int(font_size * 0.8)),
+            font=FontRegistry.get(font, int(font_size * 0.8)),
             padding=1,
             active_background=pg.Color(222, 222, 222, 100),
             callback=lambda event: self.friend_requests.show(),
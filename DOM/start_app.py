@@ -22,7 +22,7 @@ import socketio.exceptions  # noqa
 from loguru import logger
 
 import hashing
-from base import Thread, Label, Group, Text, Anchor
+from base import Thread, Label, Group, Text, Anchor, Inbox, RunLoop, FontRegistry
 from utils import FinishStatus, load_image
 
 if ty.TYPE_CHECKING:
@@ -51,7 +51,7 @@ class StartAppScreen(Group):
             text="DOM",
             padding=6,
             color=pg.Color("red"),
-            font=pg.font.Font(None, 60),
+            font=FontRegistry.get(None, 60),
             border_color=pg.Color("red"),
             border_width=2,
         )
@@ -64,7 +64,7 @@ class StartAppScreen(Group):
             width=self.SIZE[0] - 40,
             text="Запуск клиента",
             color=pg.Color("red"),
-            font=pg.font.Font(None, 30),
+            font=FontRegistry.get(None, 30),
             anchor=Anchor.center,
             soft_split=True,
         )
@@ -81,11 +81,7 @@ class StartAppScreen(Group):
         logger.debug("Запуск окна загрузки клиента")
         Thread(self.worker).run()
 
-        while self.running:  # Цикл окна
-            for event in pg.event.get():
-                if event.type == pg.QUIT:
-                    self.terminate()
-            self.render()
+        RunLoop(self).run()
         return self.finish_status
 
     def worker(self) -> None:
@@ -98,15 +94,15 @@ class StartAppScreen(Group):
         logger.debug("Загрузка клиента")
         while not self.network_client.sio.connected:
             try:
-                self.status.text = "Подключение к серверу"
+                self.set_status("Подключение к серверу")
                 self.network_client.init()
                 logger.info("Соединение с сервером установлено")
             except socketio.exceptions.ConnectionError as err:
                 logger.error(f"{type(err).__name__}: {str(err)}")
                 if "[Errno 11001]" in str(err):
-                    self.status.text = "Проверьте подключение к интернету"
+                    self.set_status("Проверьте подключение к интернету")
                 else:
-                    self.status.text = "Сервер недоступен\nПопробуйте позже"
+                    self.set_status("Сервер недоступен\nПопробуйте позже")
                 time.sleep(5)
 
         self.check_update()
@@ -117,7 +113,7 @@ class StartAppScreen(Group):
             with open(os.environ["AUTH_PATH"], encoding="utf-8") as file:
                 data = file.readlines()
             if len(data) == 2:
-                self.status.text = "Авторизация"
+                self.set_status("Авторизация")
                 login, password = map(str.strip, data)
                 self.network_client.login(
                     login,
@@ -132,17 +128,17 @@ class StartAppScreen(Group):
                     ),
                 )
             else:
-                self.terminate()
+                Inbox.post(self.terminate)
                 logger.warning("Файл .auth поврежден")
         else:
             logger.info("Файл .auth не найден")
-            self.terminate()
+            Inbox.post(self.terminate)
 
     def check_update(self) -> None:
         if sys.executable.endswith("python.exe"):
             return
 
-        self.status.text = "Проверка обновлений"
+        self.set_status("Проверка обновлений")
 
         last_version = self.network_client.get_last_version()
         updater_path = os.path.join(
@@ -153,7 +149,7 @@ class StartAppScreen(Group):
                 "Update available "
                 f"<y>{os.environ['VERSION']}</y> -> <c>{last_version['v']}</c>"
             )
-            self.status.text = f"Скачивание обновления: {last_version['v']}"
+            self.set_status(f"Скачивание обновления: {last_version['v']}")
             if not os.path.isfile(updater_path):
                 response = urllib.request.urlopen(last_version["updater"])  # Скачивание
                 while response.getcode() != 200:
@@ -168,13 +164,13 @@ class StartAppScreen(Group):
             ctypes.windll.shell32.ShellExecuteW(
                 None, "runas", updater_path, None, None, 1
             )
-            self.terminate()
+            Inbox.post(self.terminate)
         else:
             if os.path.isfile(updater_path):
                 os.remove(updater_path)
 
     def check_files(self) -> None:
-        self.status.text = "Проверка целостности файлов"
+        self.set_status("Проверка целостности файлов")
 
         data_file_path = os.path.join(os.environ["APP_DIR"], "files.json")
         if not os.path.isfile(
@@ -197,7 +193,7 @@ class StartAppScreen(Group):
                 load_image(file_path, "")
 
     def fix_media_files(self):
-        self.status.text = "Восстановление файлов"
+        self.set_status("Восстановление файлов")
 
         data_links = self.network_client.get_data_links()
         response = urllib.request.urlopen(data_links["resources"])  # Скачивание
@@ -211,6 +207,14 @@ class StartAppScreen(Group):
 
         self.check_files()
 
+    def set_status(self, text: str) -> None:
+        """
+        Изменяет текст статуса запуска.
+        Может вызываться из потока запуска приложения.
+        :param text: Текст статуса.
+        """
+        Inbox.post(setattr, self.status, "text", text)
+
     def render(self) -> None:
         """
         Отображает интерфейс.
@@ -8,12 +8,14 @@ from __future__ import annotations
 
 import os
 import re
+import threading
 import typing as ty
+from collections import OrderedDict
 
 import pygame as pg
 from loguru import logger
 
-from base import Alert, Text, Button, WidgetsGroup, Anchor
+from base import Alert, Text, Button, WidgetsGroup, Anchor, FontRegistry
 from base.text_filters import LengthTextFilter, AlphabetTextFilter
 from database.field_types import Resolution
 
@@ -32,7 +34,104 @@ PasswordTextFilter = LengthTextFilter(40) & AlphabetTextFilter(
     list("-_@$!%*#?&"), nums=True, eng=True, rus=False, ignore_case=True
 )
 
-_images_cash = {}
+
+class ImageCache:
+    """
+    Кэш изображений с вытеснением давно не использованных (LRU).
+    Ключ - (путь к файлу, размер, save_ratio), поэтому каждый размер картинки
+    масштабируется один раз и переиспользуется всеми виджетами.
+    Объем кэша ограничен переменной окружения IMAGES_CACHE_SIZE (в байтах).
+    Изображения из кэша нельзя изменять.
+    """
+
+    _images: OrderedDict[tuple, pg.Surface] = OrderedDict()
+    _missing: set[str] = set()  # Файлы, которые не удалось найти
+    _size = 0  # Объем изображений в кэше (в байтах)
+    _lock = threading.Lock()
+
+    # Метрики
+    hits = 0  # Кол-во изображений, найденных в кэше
+    misses = 0  # Кол-во изображений, загруженных с диска или масштабированных
+    evictions = 0  # Кол-во вытесненных изображений
+
+    @staticmethod
+    def budget() -> int:
+        """
+        :return: Максимальный объем кэша (в байтах).
+        """
+        return int(os.environ.get("IMAGES_CACHE_SIZE", 64 * 1024 * 1024))
+
+    @classmethod
+    def get(cls, key: tuple, count: True | False = False) -> pg.Surface | None:
+        """
+        :param key: Ключ изображения.
+        :param count: True - учесть обращение в метриках hits/misses.
+        :return: Изображение или None, если его нет в кэше.
+        """
+        with cls._lock:
+            if (image := cls._images.get(key)) is not None:
+                cls._images.move_to_end(key)
+            if count:
+                if image is not None:
+                    cls.hits += 1
+                else:
+                    cls.misses += 1
+            return image
+
+    @classmethod
+    def put(cls, key: tuple, image: pg.Surface) -> None:
+        """
+        Добавляет изображение в кэш и вытесняет давно не использованные,
+        если объем кэша превышен.
+        :param key: Ключ изображения.
+        :param image: Изображение.
+        """
+        with cls._lock:
+            if (old := cls._images.pop(key, None)) is not None:
+                cls._size -= old.get_pitch() * old.get_height()
+            cls._images[key] = image
+            cls._size += image.get_pitch() * image.get_height()
+
+            budget = cls.budget()
+            while cls._size > budget and len(cls._images) > 1:
+                _, old = cls._images.popitem(last=False)
+                cls._size -= old.get_pitch() * old.get_height()
+                cls.evictions += 1
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._images.clear()
+            cls._size = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """
+        :return: Метрики кэша.
+        """
+        return {
+            "images": len(cls._images),
+            "bytes": cls._size,
+            "budget": cls.budget(),
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "evictions": cls.evictions,
+        }
+
+    @classmethod
+    def prewarm_location(cls, location_name: str, tile_size: tuple[int, int]) -> None:
+        """
+        Загружает в кэш все плитки пола и стен локации.
+        :param location_name: Название локации.
+        :param tile_size: Размер плитки.
+        """
+        for kind in ("floors", "walls"):
+            namespace = os.path.join(os.environ["LOCATIONS_PATH"], location_name, kind)
+            if not os.path.isdir(namespace):
+                continue
+            for file_name in os.listdir(namespace):
+                if file_name.endswith(".png"):
+                    load_image(file_name, namespace=namespace, size=tile_size)
 
 
 class FinishStatus:
@@ -98,6 +197,17 @@ def check_password(password: str) -> True | False:
     return False
 
 
+def is_opaque(image: pg.Surface) -> True | False:
+    """
+    :param image: Изображение с альфа-каналом.
+    :return: True - все пиксели изображения непрозрачны.
+    """
+    return (
+        pg.mask.from_surface(image, 254).count()
+        == image.get_width() * image.get_height()
+    )
+
+
 def load_image(
     file_name: str,
     namespace: str = None,
@@ -120,15 +230,23 @@ def load_image(
         "\\", "/"
     )
 
-    if not (image := _images_cash.get(path)):
+    key = (path, tuple(size) if size is not None else None, save_ratio)
+    if (image := ImageCache.get(key, count=True)) is not None:
+        return image
+
+    if (image := ImageCache.get((path, None, False))) is None:
         if not os.path.isfile(path):
-            if path not in _images_cash:
-                _images_cash[path] = None
+            if path not in ImageCache._missing:
+                ImageCache._missing.add(path)
                 logger.opt(colors=True).error(f"Файл <y>{path}</y> не найден")
             # Возвращаем пустое изображение
             return pg.Surface((1, 1), pg.SRCALPHA).convert_alpha()
 
-        _images_cash[path] = image = pg.image.load(path).convert_alpha()
+        image = pg.image.load(path).convert_alpha()
+        if is_opaque(image):
+            # Непрозрачные изображения рисуются без попиксельного смешивания
+            image = image.convert()
+        ImageCache.put((path, None, False), image)
 
     if size is not None:
         if not save_ratio:
@@ -147,6 +265,7 @@ def load_image(
                 # Высчитываем подходящее значение ширины
                 size = ((size[1] * base_size[0]) / base_size[1], size[1])
             image = pg.transform.scale(image, size)
+        ImageCache.put(key, image)
 
     return image
 
@@ -189,7 +308,7 @@ class LoadingAlert(Alert):
             y=0,
             width=self.rect.width - self.padding * 2 - self.border_width * 2,
             text="...",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             anchor=Anchor.center,
             soft_split=True,
         )
@@ -241,13 +360,15 @@ class InfoAlert(LoadingAlert):
             text="ок",
             padding=5,
             active_background=pg.Color(222, 222, 222, 100),
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             border_width=2,
             callback=lambda event: self.hide(),
         )
 
 
 class DropMenu(WidgetsGroup):
+    event_types = (pg.MOUSEBUTTONDOWN,)
+
     def __init__(
         self,
         parent: WidgetsGroup,
@@ -366,7 +487,7 @@ class LoadingScreen(Alert):
             y=0,
             width=self.rect.width - self.padding * 2,
             text="...",
-            font=pg.font.Font(font, font_size),
+            font=FontRegistry.get(font, font_size),
             anchor=Anchor.center,
             soft_split=True,
         )
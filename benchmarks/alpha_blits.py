@@ -0,0 +1,106 @@
+"""
+
+Отрисовка изображений с альфа-каналом и без него.
+Выводится скорость отрисовки поверхности размером с окно в каждом формате,
+время полной перерисовки игрового окна, когда все изображения виджетов
+имеют альфа-канал (как раньше) и когда непрозрачные виджеты рисуются без него,
+и отчет о виджетах, изображения которых по-прежнему имеют альфа-канал.
+
+"""
+
+from __future__ import annotations
+
+import time
+
+from session import FakeNetworkClient, logger, pg
+
+import game_client
+from base import Group
+from base.widget import BaseWidget
+
+BLITS = 300
+FRAMES = 100
+
+
+def blit_rate(image: pg.Surface, surface: pg.Surface) -> float:
+    """
+    :return: Кол-во отрисовок изображения в секунду.
+    """
+    start = time.perf_counter()
+    for _ in range(BLITS):
+        surface.blit(image, (0, 0))
+    return BLITS / (time.perf_counter() - start)
+
+
+def full_redraw(screen: game_client.GameClientScreen) -> float:
+    """
+    :return: Среднее время полной перерисовки окна (в миллисекундах).
+    """
+    screen.render()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        screen.track_dirty_rects()
+        screen.render()
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+def build_screen() -> game_client.GameClientScreen:
+    BaseWidget.opaque_images = BaseWidget.alpha_images = 0
+    with Group.batch():
+        screen = game_client.GameClientScreen(FakeNetworkClient())
+    screen.render()  # Изображения строятся при первой отрисовке
+    return screen
+
+
+def legacy_create_image(self: BaseWidget, size: tuple[int, int]) -> pg.Surface:
+    """
+    _create_image, всегда создающий изображение с альфа-каналом.
+    """
+    BaseWidget.alpha_images += 1
+    return pg.Surface(size, pg.SRCALPHA, 32).convert_alpha()
+
+
+def main() -> None:
+    surface = pg.display.get_surface()
+    filled = pg.Surface(surface.get_size(), pg.SRCALPHA, 32).convert_alpha()
+    filled.fill("#f0f0f0")
+    for name, image in (
+        ("alpha", filled),
+        ("opaque", filled.convert()),
+    ):
+        logger.opt(colors=True).info(
+            f"<g>{name:>7}</g> {image.get_width()}x{image.get_height()}: "
+            f"<e>{blit_rate(image, surface):7.0f}</e> blits per second"
+        )
+
+    create_image = BaseWidget._create_image
+    BaseWidget._create_image = legacy_create_image
+    try:
+        screen = build_screen()
+        legacy = full_redraw(screen)
+    finally:
+        BaseWidget._create_image = create_image
+    logger.opt(colors=True).info(
+        f"<g>{'legacy':>7}</g>: full redraw <e>{legacy:.3f}</e> ms, "
+        f"images: <c>{BaseWidget.alpha_images}</c> alpha"
+    )
+
+    screen = build_screen()
+    current = full_redraw(screen)
+    logger.opt(colors=True).info(
+        f"<g>{'current':>7}</g>: full redraw <e>{current:.3f}</e> ms, "
+        f"images: <c>{BaseWidget.alpha_images}</c> alpha, "
+        f"<c>{BaseWidget.opaque_images}</c> opaque"
+    )
+
+    report = screen.alpha_report()
+    logger.opt(colors=True).info(
+        f"alpha images on screen: <c>{len(report)}</c>, "
+        f"area: <c>{sum(area for *_, area in report)}</c> px"
+    )
+    for widget, reason, area in report[:5]:
+        logger.opt(colors=True).info(f"  {widget}: {reason}, <c>{area}</c> px")
+
+
+if __name__ == "__main__":
+    main()
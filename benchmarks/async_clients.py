@@ -0,0 +1,117 @@
+"""
+
+Сотни асинхронных клиентов в одном процессе и одном цикле событий.
+Сервер эмулируется: вместо socketio.AsyncClient клиенты получают объект,
+который отвечает на запросы с задержкой LATENCY.
+Каждый клиент авторизуется, входит в лобби, ставит в очередь MOVES ходов
+и ждет события смены хода. Ошибку хода сервер отправляет событием,
+поэтому ходы одного клиента уходят по одному.
+Выводится общее время, кол-во запросов в секунду, память на клиента
+(замеряется отдельным запуском) и задержки ответов.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import tracemalloc
+import typing as ty
+
+from session import logger
+
+import network_async
+from network_async import AsyncNetworkClient
+
+CLIENTS = (100, 500)
+MOVES = 10
+LATENCY = 0.02  # Задержка сервера (в секундах)
+
+
+class FakeAsyncSio:
+    def __init__(self):
+        """
+        Клиент socket.io, подключенный к эмулированному серверу.
+        Сервер отвечает в подтверждении.
+        """
+        self.handlers: dict[str, dict[str, ty.Callable]] = {}
+
+    def on(self, event: str, handler: ty.Callable) -> None:
+        self.handlers.setdefault("/", {})[event] = handler
+
+    async def connect(self, *args, **kwargs) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def emit(self, event: str, data: ty.Any = None, callback=None) -> None:
+        asyncio.get_running_loop().call_later(
+            LATENCY, lambda: asyncio.ensure_future(self._handle(event, data, callback))
+        )
+
+    async def _handle(self, event: str, data: ty.Any, callback) -> None:
+        if event == "login":
+            await callback(
+                dict(
+                    status="ok",
+                    user=dict(
+                        uid=hash(data["username"]),
+                        username=data["username"],
+                        icon=0,
+                        friends=[],
+                        friend_requests=[],
+                        status=1,
+                    ),
+                )
+            )
+        elif event == "join lobby":
+            await callback(dict(status="ok", room_id=data["room_id"], users=[]))
+        elif event == "move":
+            await callback()
+            if data["y"] == MOVES:
+                await self.handlers["/"]["set queue"](dict(queue="next player"))
+        elif callback is not None:
+            await callback()
+
+
+async def bot(index: int) -> AsyncNetworkClient:
+    client = AsyncNetworkClient()
+    await client.connect("http://localhost")
+    await client.login(f"bot{index}", "password")
+    await client.join_lobby(index)
+    queue = asyncio.ensure_future(client.wait_event("set queue"))
+    await asyncio.gather(*(client.move(y, 1) for y in range(1, MOVES + 1)))
+    await queue
+    return client
+
+
+async def run(count: int) -> None:
+    start = time.perf_counter()
+    clients = await asyncio.gather(*(bot(i) for i in range(count)))
+    total = time.perf_counter() - start
+
+    tracemalloc.start()
+    await asyncio.gather(*(bot(i) for i in range(count)))
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    requests = count * (MOVES + 2)
+    moves = [client.latency["move"] for client in clients]
+    logger.opt(colors=True).info(
+        f"<g>{count:4}</g> clients: <e>{total * 1000:6.1f}</e> ms, "
+        f"<e>{requests / total:7.0f}</e> requests/s, "
+        f"<c>{memory / count / 1024:5.1f}</c> KiB per client, "
+        f"move latency p50 <c>{max(m.percentile(0.5) for m in moves)}</c> ms, "
+        f"p95 <c>{max(m.percentile(0.95) for m in moves)}</c> ms"
+    )
+
+
+def main() -> None:
+    network_async.socketio.AsyncClient = FakeAsyncSio
+    for count in CLIENTS:
+        asyncio.run(run(count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+
+Кадр вращения двух костей (DicesWidget):
+прежняя отрисовка (новая поверхность и масштабирование граней на каждом кадре)
+против воспроизведения кадров DiceFrames - первый бросок (кадры строятся)
+и повторные броски (кадры из кэша).
+
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from session import FakeNetworkClient, logger, pg
+
+import game_client
+from base import Group, Timeline
+from dice import Dice, DiceFrames, polygon_size, rotation_corners
+
+ROLLS = 20
+FPS = 60
+
+
+def make_rolls(graph: list[list[int]], count: int) -> list[list[tuple[int, int]]]:
+    """
+    :param graph: Соседние грани кости.
+    :return: Случайные броски: списки команд (направление, грань с 1).
+    """
+    rolls = []
+    for _ in range(count):
+        facet, roll = 0, []
+        for _ in range(3):
+            direction = random.randrange(4)
+            facet = graph[facet][direction]
+            roll.append((direction, facet + 1))
+        rolls.append(roll)
+    return rolls
+
+
+class LegacyDice(Dice):
+    """
+    Кость, отрисовывающая каждый кадр вращения заново (прежний Dice._render).
+    Углы граней вычисляются один раз на бросок.
+    """
+
+    def move_from_list(self, data: list[tuple[int, int]]) -> None:
+        self._frames = []
+        facet = 0
+        for direction, number in data:
+            self._frames += [
+                (facet, number - 1, polygons)
+                for polygons in rotation_corners(self.width, self.speed, direction)
+            ]
+            facet = number - 1
+        super(LegacyDice, self).move_from_list(data)
+
+    def _rotation(self, from_facet: int, to_facet: int, direction: int) -> list:
+        return [None] * len(rotation_corners(self.width, self.speed, direction))
+
+    def _render(self) -> pg.Surface:
+        if not (self.__dict__.get("in_move") and self.rotation is not None):
+            return super(LegacyDice, self)._render()
+        from_facet, to_facet, polygons = self._frames[self.frame]
+        facets = DiceFrames.facets(self.files_namespace, self.width)
+        image = pg.Surface(self.rect.size, pg.SRCALPHA, 32).convert_alpha()
+        for facet, polygon in zip((from_facet, to_facet), polygons):
+            image.blit(
+                pg.transform.scale(facets[facet], polygon_size(polygon)), polygon[0]
+            )
+        return image
+
+
+class FrameClock:
+    """
+    Часы Timeline, идущие на один кадр (1 / FPS секунды) за шаг.
+    """
+
+    now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def tick(self) -> None:
+        self.now += 1 / FPS
+
+
+def play(clock: FrameClock, dices: list[Dice], roll: list[tuple[int, int]]) -> int:
+    """
+    Вращает кости до остановки.
+    :return: Кол-во кадров.
+    """
+    for dice in dices:
+        dice.move_from_list(roll)
+    count = 0
+    while any(dice.animating for dice in dices):
+        clock.tick()
+        Timeline.step()
+        for dice in dices:
+            dice.update()
+            dice.image  # noqa
+        count += 1
+    pg.event.clear()
+    return count
+
+
+def measure(func, rolls: list[list[tuple[int, int]]]) -> float:
+    """
+    :return: Среднее время кадра (в микросекундах).
+    """
+    frames = 0
+    start = time.perf_counter()
+    for roll in rolls:
+        frames += func(roll)
+    return (time.perf_counter() - start) * 1_000_000 / max(frames, 1)
+
+
+def main() -> None:
+    random.seed(0)
+    with Group.batch():
+        screen = game_client.GameClientScreen(FakeNetworkClient())
+    rolls = make_rolls(screen.dices_widget.dice.graph, ROLLS)
+    clock = Timeline.clock = FrameClock()
+
+    def dices(cls: type[Dice]) -> list[Dice]:
+        return [
+            cls(
+                None,
+                speed=dice.speed,
+                x=0,
+                y=0,
+                width=dice.width,
+                files_namespace=dice.files_namespace,
+            )
+            for dice in (screen.dices_widget.dice, screen.dices_widget.dice2)
+        ]
+
+    legacy_dices = dices(LegacyDice)
+    legacy = measure(lambda roll: play(clock, legacy_dices, roll), rolls)
+    DiceFrames.clear()
+    cached_dices = dices(Dice)
+    first = measure(lambda roll: play(clock, cached_dices, roll), rolls)
+    cached = measure(lambda roll: play(clock, cached_dices, roll), rolls)
+    logger.opt(colors=True).info(
+        f"<g>2 dices, width {cached_dices[0].width}</g>: "
+        f"legacy <e>{legacy:6.1f}</e> us per frame, "
+        f"first rolls <e>{first:6.1f}</e> us, "
+        f"cached <e>{cached:5.1f}</e> us"
+    )
+    logger.opt(colors=True).info(f"DiceFrames: <c>{DiceFrames.stats()}</c>")
+
+
+if __name__ == "__main__":
+    main()
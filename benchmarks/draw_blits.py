@@ -0,0 +1,114 @@
+"""
+
+Сравнение отрисовки окна отдельными вызовами Surface.blit
+с отрисовкой одним вызовом Surface.blits.
+Замеряется полная перерисовка окон меню, лобби и игры и перерисовка
+измененных областей окна игры (draw_dirty). Проверяется, что изображения
+окон совпадают.
+
+"""
+
+from __future__ import annotations
+
+from session import FakeNetworkClient, logger, pg, timeit
+
+import game_client
+import menu
+from base import Group, WidgetsGroup
+
+FRAMES = 2000
+# Измененные области окна игры за кадр
+DIRTY_RECTS = [pg.Rect(40 + i * 160, 60 + i * 90, 120, 80) for i in range(6)]
+
+
+def legacy_draw(obj, surface: pg.Surface) -> None:
+    """
+    Отрисовка объекта отдельными вызовами Surface.blit
+    (как до появления Group.collect_blits).
+    """
+    if obj.hidden:
+        return
+    if isinstance(obj, WidgetsGroup):
+        if hasattr(obj, "image"):
+            surface.blit(obj.image, obj.get_global_rect())
+            for child in obj.objects:
+                if isinstance(child, Group):
+                    legacy_draw(child, surface)
+    elif isinstance(obj, Group):
+        for child in obj.objects:
+            legacy_draw(child, surface)
+    else:
+        surface.blit(obj.image, obj.rect)
+
+
+def legacy_draw_dirty(screen: Group, surface: pg.Surface) -> None:
+    """
+    draw_dirty с обходом дерева виджетов для каждой области.
+    """
+    for rect in DIRTY_RECTS:
+        surface.set_clip(rect)
+        surface.fill("black")
+        legacy_draw(screen, surface)
+    surface.set_clip(None)
+
+
+def draw_dirty(screen: Group, surface: pg.Surface) -> None:
+    screen._dirty_rects = list(DIRTY_RECTS)
+    screen.draw_dirty(surface, lambda surface: surface.fill("black"))
+
+
+def check_same(draw, legacy, surface: pg.Surface) -> None:
+    """
+    Проверяет, что отрисовка списком совпадает с отрисовкой по одному.
+    """
+    surface.fill("black")
+    draw()
+    image = surface.copy()
+    surface.fill("black")
+    legacy()
+    assert pg.image.tobytes(image, "RGB") == pg.image.tobytes(surface, "RGB")
+
+
+def main() -> None:
+    network_client = FakeNetworkClient()
+    menu_screen = menu.MenuScreen(network_client)
+    lobby_screen = menu.MenuScreen(network_client)
+    lobby_screen.open_lobby()
+    game_screen = game_client.GameClientScreen(network_client)
+
+    for name, screen in (
+        ("menu", menu_screen),
+        ("lobby", lobby_screen),
+        ("game", game_screen),
+    ):
+        surface = screen.screen
+        blits = []
+        screen.collect_blits(blits)
+        check_same(
+            lambda: screen.draw(surface), lambda: legacy_draw(screen, surface), surface
+        )
+        legacy = timeit(lambda: legacy_draw(screen, surface), FRAMES)
+        batched = timeit(lambda: screen.draw(surface), FRAMES)
+        logger.opt(colors=True).info(
+            f"<g>{name:>5}</g> (<c>{len(blits)}</c> images): "
+            f"blit <e>{legacy:.3f}</e> ms, "
+            f"blits <e>{batched:.3f}</e> ms"
+        )
+
+    surface = game_screen.screen
+    check_same(
+        lambda: draw_dirty(game_screen, surface),
+        lambda: legacy_draw_dirty(game_screen, surface),
+        surface,
+    )
+    legacy = timeit(lambda: legacy_draw_dirty(game_screen, surface), FRAMES)
+    batched = timeit(lambda: draw_dirty(game_screen, surface), FRAMES)
+    logger.opt(colors=True).info(
+        f"<g>dirty</g> (<c>{len(DIRTY_RECTS)}</c> regions): "
+        f"blit <e>{legacy:.3f}</e> ms, "
+        f"blits <e>{batched:.3f}</e> ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
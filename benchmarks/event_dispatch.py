@@ -0,0 +1,96 @@
+"""
+
+Доставка событий объектам окна:
+рассылка каждого события всем объектам дерева (прежний Group.handle_event)
+против пересылки только подписанным объектам (event_types).
+
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from contextlib import contextmanager
+
+from session import FakeNetworkClient, logger, pg
+
+import game_client
+import menu
+from base import Group
+from base.events import EventBus
+
+EVENTS = 2000
+
+
+@contextmanager
+def broadcast():
+    """
+    Группы пересылают каждое событие всем своим объектам.
+    """
+    route = Group._route  # noqa
+    Group._route = lambda self, event_type: self.__dict__.get("_objects", [])
+    try:
+        yield
+    finally:
+        Group._route = route
+
+
+def make_events(screen: Group, event_type: int) -> list[pg.event.Event]:
+    """
+    События, которые не вызывают действий у виджетов
+    (кнопка мыши X1, клавиша без назначения).
+    """
+    width, height = screen.screen.get_size()
+    events = []
+    for _ in range(EVENTS):
+        pos = (random.randrange(width), random.randrange(height))
+        if event_type == pg.MOUSEMOTION:
+            events.append(pg.event.Event(event_type, pos=pos, rel=(1, 1), buttons=()))
+        elif event_type == pg.MOUSEBUTTONDOWN:
+            events.append(pg.event.Event(event_type, pos=pos, button=pg.BUTTON_X1))
+        else:
+            events.append(pg.event.Event(event_type, key=pg.K_F15, unicode="", mod=0))
+    return events
+
+
+def measure(screen: Group, events: list[pg.event.Event]) -> tuple[float, float]:
+    """
+    :return: Среднее время доставки события (в микросекундах)
+        и среднее кол-во вызовов handle_event.
+    """
+    delivered = sum(EventBus._delivered.values())  # noqa
+    start = time.perf_counter()
+    for event in events:
+        screen.handle_event(event)
+    elapsed = (time.perf_counter() - start) * 1_000_000 / len(events)
+    calls = (sum(EventBus._delivered.values()) - delivered) / len(events)  # noqa
+    return elapsed, calls
+
+
+def dispatch(name: str, screen: Group) -> None:
+    for event_type in (pg.MOUSEMOTION, pg.MOUSEBUTTONDOWN, pg.KEYDOWN):
+        events = make_events(screen, event_type)
+        with broadcast():
+            all_time, all_calls = measure(screen, events)
+        routed_time, routed_calls = measure(screen, events)
+        logger.opt(colors=True).info(
+            f"<g>{name:>16}</g> {pg.event.event_name(event_type):>15}: "
+            f"broadcast <e>{all_time:6.1f}</e> us / <c>{all_calls:5.1f}</c> calls, "
+            f"routed <e>{routed_time:5.1f}</e> us / <c>{routed_calls:5.1f}</c> calls"
+        )
+
+
+def main() -> None:
+    random.seed(0)
+    network_client = FakeNetworkClient()
+    menu_screen = menu.MenuScreen(network_client)
+    dispatch("MenuScreen", menu_screen)
+    menu_screen.open_lobby()
+    dispatch("Lobby", menu_screen)
+    game_screen = game_client.GameClientScreen(network_client)
+    dispatch("GameClientScreen", game_screen)
+    logger.opt(colors=True).info(f"EventBus: <c>{EventBus.stats()}</c>")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+
+Загрузка процессора игровым окном во время матча, в котором часто ставят пинги.
+Сравнивается прежнее удаление пингов (опрос всех пингов каждые 0.5 секунды
+и пересборка поля) с Expiry (пробуждение к ближайшему времени исчезновения
+и перерисовка только исчезнувших клеток; если поле обновляется в том же
+кадре, клетки перерисовываются вместе с ним).
+
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import typing as ty
+
+from session import FakeNetworkClient, logger, pg
+
+import game_client
+from base import Expiry, Group, Inbox, Thread
+
+DURATION = 5  # Время работы окна (в секундах)
+RATES = (0, 1, 20)  # Кол-во пингов в секунду
+REMOVALS = 200
+
+
+class LegacyPings:
+    """
+    Прежние пинги: время появления и опрос повторяющимся заданием.
+    """
+
+    def __init__(self, field: game_client.Field):
+        self.field = field
+        self.spawn_times: dict[tuple[int, int], float] = {}
+
+    def spawn_ping(self, y: int, x: int) -> None:
+        field = self.field
+        pos = (y, x)
+        self.spawn_times[pos] = time.time()
+        if pos not in field.pings:
+            field.pings[pos] = game_client.Ping(
+                pg.Rect(
+                    field.block_width * x,
+                    field.block_height * y,
+                    round(field.block_width),
+                    round(field.block_height),
+                )
+            )
+            field.request_update()
+
+    def manage_pings(self) -> None:
+        upd = False
+        for pos, spawn_time in self.spawn_times.copy().items():
+            if time.time() - spawn_time > 3:
+                del self.spawn_times[pos]
+                del self.field.pings[pos]
+                upd = True
+        if upd:
+            self.field.request_update()
+
+
+def play(
+    name: str,
+    screen: game_client.GameClientScreen,
+    spawn_ping: ty.Callable[[int, int], ty.Any],
+    rate: int,
+) -> None:
+    """
+    :param rate: Кол-во пингов в секунду.
+    """
+    field = screen.field
+    grid = field.network_client.room.grid
+    field_time = [0.0]  # Время обновления поля (в секундах)
+
+    def timed(func: ty.Callable) -> ty.Callable:
+        def wrapper(*args) -> None:
+            start = time.perf_counter()
+            func(*args)
+            field_time[0] += time.perf_counter() - start
+
+        return wrapper
+
+    def spawn() -> None:
+        spawn_ping(random.randrange(grid.height), random.randrange(grid.width))
+
+    field.update_field = timed(field.update_field)
+    field._expire = timed(field._expire)  # noqa
+    field._redraw_expired = timed(field._redraw_expired)  # noqa
+    spawner = (
+        Thread(Inbox.post, args=(spawn,), repetitive=True, timeout=1 / rate).run()
+        if rate
+        else None
+    )
+    screen.running = True
+    Thread(Inbox.post, args=(setattr, screen, "running", False), delay=DURATION).run()
+    frames = screen.loop._frames  # noqa
+    wall, cpu = time.perf_counter(), time.process_time()
+    screen.exec()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    frames = screen.loop._frames - frames  # noqa
+    if spawner is not None:
+        spawner.cancel()
+    del field.update_field, field._expire, field._redraw_expired
+
+    logger.opt(colors=True).info(
+        f"<g>{name:>7}</g>, <c>{rate:2}</c> pings/s: "
+        f"<c>{frames / wall:5.1f}</c> fps, "
+        f"CPU <e>{cpu / wall * 100:5.1f}</e> %, "
+        f"field updates <e>{field_time[0] * 1000:6.1f}</e> ms"
+    )
+
+
+def removal_cost(field: game_client.Field, expire: True | False) -> float:
+    """
+    :param expire: True - удаление через Field._expire и перерисовка клеток,
+        False - удаление из словаря и пересборка поля (как раньше).
+    :return: Среднее время удаления одного пинга (в микросекундах).
+    """
+    total = 0.0
+    for i in range(REMOVALS):
+        pos = (i % 5 + 1, i % 7 + 1)
+        field.spawn_ping(*pos)
+        Expiry.cancel((field, "ping", pos))
+        field.update_field()
+        start = time.perf_counter()
+        if expire:
+            field._expire(field.pings, "ping", pos)  # noqa
+            Inbox.process()
+        else:
+            del field.pings[pos]
+            field.update_field()
+        total += time.perf_counter() - start
+    return total * 1_000_000 / REMOVALS
+
+
+def clear_pings(field: game_client.Field) -> None:
+    for pos in field.pings:
+        Expiry.cancel((field, "ping", pos))
+    field.pings.clear()
+    field.request_update()
+
+
+def main() -> None:
+    random.seed(0)
+    with Group.batch():
+        screen = game_client.GameClientScreen(FakeNetworkClient())
+
+    logger.opt(colors=True).info(
+        f"ping removal: field rebuild <e>{removal_cost(screen.field, False):.1f}</e>"
+        f" us, expired cells redraw <e>{removal_cost(screen.field, True):.1f}</e> us"
+    )
+    for rate in RATES:
+        legacy = LegacyPings(screen.field)
+        manager = Thread(
+            Inbox.post, args=(legacy.manage_pings,), repetitive=True, timeout=0.5
+        ).run()
+        play("legacy", screen, legacy.spawn_ping, rate)
+        manager.cancel()
+        clear_pings(screen.field)
+
+        play("expiry", screen, screen.field.spawn_ping, rate)
+        clear_pings(screen.field)
+    logger.opt(colors=True).info(f"Expiry: <c>{Expiry.stats()}</c>")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+
+Стоимость Field.update_field при перемещении одного врага:
+полная перерисовка поля против перерисовки только измененных клеток.
+
+"""
+
+from __future__ import annotations
+
+from session import FakeNetworkClient, logger, timeit
+
+import game_client
+
+REPEAT = 50
+
+
+def main() -> None:
+    for size in (15, 30, 60):
+        screen = game_client.GameClientScreen(FakeNetworkClient(size))
+        field = screen.field
+        enemy = screen.network_client.room.enemies[0]
+        start_pos = list(enemy.pos)
+
+        def move_enemy() -> None:
+            enemy.pos = [start_pos[0], start_pos[1] + (enemy.pos[1] == start_pos[1])]
+
+        def full_update() -> None:
+            move_enemy()
+            field._layers = {}  # noqa: Сброс слоев - поле рисуется целиком
+            field.update_field()
+
+        def incremental_update() -> None:
+            move_enemy()
+            field.update_field()
+
+        full = timeit(full_update, REPEAT)
+        incremental = timeit(incremental_update, REPEAT)
+        logger.info(
+            f"{size}x{size}: full {full:.3f} ms, incremental {incremental:.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+
+Отрисовка больших полей.
+Поле, вписанное в окно целиком (клетки уменьшаются вместе с ростом поля,
+каждая клетка рисуется при перерисовке), сравнивается с областью просмотра
+(клетка не меньше Field.min_block_size, рисуются только видимые клетки).
+Для области просмотра также замеряется кадр прокрутки на одну клетку
+и перерисовка поля после перемещения врага и проверяется, что нажатие
+вне области просмотра прокрученного поля не попадает в клетку.
+
+"""
+
+from __future__ import annotations
+
+import time
+
+from session import FakeNetworkClient, logger, timeit
+
+import game_client
+from base import Group
+
+SIZES = (50, 200, 1000)
+REPEAT = 30
+
+
+def build(network_client: FakeNetworkClient) -> game_client.GameClientScreen:
+    with Group.batch():
+        screen = game_client.GameClientScreen(network_client)
+    screen.render()
+    return screen
+
+
+def full_redraw(field: game_client.Field, repeat: int) -> float:
+    """
+    :return: Среднее время перерисовки всей области просмотра (в миллисекундах).
+    """
+    return timeit(lambda: field._redraw([field._camera.copy()]), repeat)  # noqa
+
+
+def click_outside() -> None:
+    """
+    Нажатие слева от области просмотра поля, прокрученного к правому краю.
+    """
+    field = build(FakeNetworkClient(60)).field
+    field.scroll_to(10**6, 0)
+    viewport = field.get_global_rect_of(field._camera)  # noqa
+    pos = (viewport.left - 1, viewport.top + 100)
+    items = {
+        kind: field.items_at(pos, kind)
+        for kind in ("way", "enemy", "character", "boss", "finish")
+    }
+    assert not any(items.values()), items
+    assert field.cell_at(pos) is None, field.cell_at(pos)
+    logger.opt(colors=True).info(
+        f"click at <c>{pos}</c> outside viewport <c>{viewport}</c>: no cell"
+    )
+
+
+def main() -> None:
+    min_block_size = game_client.Field.min_block_size
+    for size in SIZES:
+        network_client = FakeNetworkClient(size)
+
+        game_client.Field.min_block_size = 0
+        try:
+            field = build(network_client).field
+            fit = full_redraw(field, 1 if size > 200 else REPEAT)
+            fit_block = field.block_width
+        finally:
+            game_client.Field.min_block_size = min_block_size
+
+        start = time.perf_counter()
+        screen = build(network_client)
+        setup = (time.perf_counter() - start) * 1000
+        field = screen.field
+        full = full_redraw(field, REPEAT)
+
+        step = [1]
+
+        def scroll() -> None:
+            # Туда и обратно по диагонали на одну клетку
+            step[0] = -step[0]
+            field.scroll_by(step[0] * field.block_width, step[0] * field.block_height)
+            screen.render()
+
+        field.scroll_to(field._world.centerx, field._world.centery)  # noqa
+        scroll_frame = timeit(scroll, REPEAT)
+
+        enemy = network_client.room.enemies[0]
+        start_pos = list(enemy.pos)
+
+        def move_enemy() -> None:
+            enemy.pos = [start_pos[0], start_pos[1] + (enemy.pos[1] == start_pos[1])]
+            field.update_field()
+
+        # Враг в центре области просмотра
+        rect = field.enemies[tuple(start_pos)].rect
+        field.scroll_to(
+            rect.centerx - field._camera.width / 2,  # noqa
+            rect.centery - field._camera.height / 2,  # noqa
+        )
+        incremental = timeit(move_enemy, REPEAT)
+
+        logger.opt(colors=True).info(
+            f"<g>{size}x{size}</g>: fit to window "
+            f"(block <c>{fit_block:.1f}</c> px) full redraw <e>{fit:8.2f}</e> ms; "
+            f"viewport (block <c>{field.block_width:.0f}</c> px) "
+            f"setup <e>{setup:7.1f}</e> ms, full redraw <e>{full:5.2f}</e> ms, "
+            f"scroll frame <e>{scroll_frame:5.2f}</e> ms, "
+            f"enemy move <e>{incremental:5.2f}</e> ms"
+        )
+    click_outside()
+
+
+if __name__ == "__main__":
+    main()
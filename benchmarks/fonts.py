@@ -0,0 +1,51 @@
+"""
+
+Загрузка шрифтов при построении окон через FontRegistry.
+Выводится кол-во запрошенных и загруженных шрифтов
+и оценка времени и памяти, которые заняли бы шрифты каждого виджета.
+
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+from session import FakeNetworkClient, logger, pg
+
+import game_client
+import menu
+from base import FontRegistry
+
+REPEATS = 200
+
+
+def main() -> None:
+    network_client = FakeNetworkClient()
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        pg.font.Font(os.environ["FONT"], 20)
+    load_time = (time.perf_counter() - start) * 1000 / REPEATS
+
+    for name, build in (
+        ("MenuScreen", lambda: menu.MenuScreen(network_client)),
+        ("GameClientScreen", lambda: game_client.GameClientScreen(network_client)),
+    ):
+        FontRegistry.clear()
+        FontRegistry.hits = FontRegistry.misses = 0
+        build()
+        requests = FontRegistry.hits + FontRegistry.misses
+        resident = FontRegistry.stats()["bytes"]
+        logger.opt(colors=True).info(
+            f"<g>{name:>16}</g>: "
+            f"<c>{requests:>4}</c> fonts requested, "
+            f"<c>{FontRegistry.misses:>3}</c> loaded, "
+            f"saved ~<e>{FontRegistry.hits * load_time:5.1f}</e> ms of loading, "
+            f"resident ~<e>{resident // 1024}</e> KB "
+            f"instead of ~<e>{resident * requests // FontRegistry.misses // 1024}</e> KB"
+        )
+    logger.opt(colors=True).info(f"FontRegistry: <c>{FontRegistry.stats()}</c>")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+
+Вычисление положения виджетов в окне (get_global_rect)
+с запоминанием и с обходом цепочки родителей при каждом вызове.
+Выводится кол-во вызовов и обходов за кадр и время отрисовки окна.
+
+"""
+
+from __future__ import annotations
+
+import time
+
+import pygame as pg
+from session import FakeNetworkClient, logger
+
+import game_client
+from base.widget import BaseWidget
+
+FRAMES = 300
+
+
+def walk_global_rect(self: BaseWidget):
+    """
+    get_global_rect без запоминания (как до появления кэша).
+    """
+    BaseWidget.global_rect_misses += 1
+    rect = self.rect.copy()
+    if self.parent and hasattr(self.parent, "get_global_rect"):
+        parent_rect = self.parent.get_global_rect()
+        padding = self.parent.padding if hasattr(self.parent, "padding") else 0
+        border_width = (
+            self.parent.border_width if hasattr(self.parent, "border_width") else 0
+        )
+        rect.x += parent_rect.x + padding + border_width
+        rect.y += parent_rect.y + padding + border_width
+    return rect
+
+
+def play(screen: game_client.GameClientScreen, name: str) -> None:
+    """
+    Кадры окна: отрисовка всего окна и проверка нажатия на кость.
+    """
+    surface = pg.display.get_surface()
+    BaseWidget.global_rect_hits = BaseWidget.global_rect_misses = 0
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        if frame % 50 == 0:
+            screen.players_menu.client_player.stats.coins.value.text = str(frame)
+        screen.draw(surface)
+        screen.dices_widget.dice.get_global_rect()
+    elapsed = (time.perf_counter() - start) * 1000 / FRAMES
+    hits, misses = BaseWidget.global_rect_hits, BaseWidget.global_rect_misses
+    logger.opt(colors=True).info(
+        f"<g>{name:>8}</g>: "
+        f"<c>{(hits + misses) / FRAMES:6.1f}</c> calls, "
+        f"<c>{misses / FRAMES:6.1f}</c> parent-chain walks, "
+        f"<c>{hits / FRAMES:6.1f}</c> walks saved per frame, "
+        f"<e>{elapsed:.3f}</e> ms"
+    )
+
+
+def main() -> None:
+    screen = game_client.GameClientScreen(FakeNetworkClient())
+    get_global_rect = BaseWidget.get_global_rect
+    BaseWidget.get_global_rect = walk_global_rect
+    try:
+        play(screen, "walk")
+    finally:
+        BaseWidget.get_global_rect = get_global_rect
+    play(screen, "cached")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+
+Поиск объектов под курсором:
+проверка глобального прямоугольника каждого виджета (обход цепочки родителей)
+против HitIndex окна, и перебор клеток и сущностей поля против сетки поля.
+
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from session import FakeNetworkClient, logger
+
+import game_client
+import menu
+from base import Group, Inbox
+from base.object import Object
+
+CLICKS = 2000
+
+
+def pointer_targets(group: Group) -> list:
+    """
+    :return: Включенные виджеты группы, обрабатывающие нажатия.
+    """
+    result = []
+    for obj in group.__dict__.get("_objects", ()):
+        if not obj.enabled:
+            continue
+        if getattr(obj, "pointer_target", False):
+            result.append(obj)
+        if hasattr(obj, "objects"):
+            result.extend(pointer_targets(obj))
+    return result
+
+
+def measure(func, points: list[tuple[int, int]]) -> float:
+    """
+    :return: Среднее время обработки точки (в микросекундах).
+    """
+    start = time.perf_counter()
+    for pos in points:
+        func(pos)
+    return (time.perf_counter() - start) * 1_000_000 / len(points)
+
+
+def log(name: str, linear: float, indexed: float, extra: str = "") -> None:
+    logger.opt(colors=True).info(
+        f"<g>{name:>16}</g>: linear <e>{linear:7.1f}</e> us, "
+        f"indexed <e>{indexed:6.2f}</e> us per click{extra}"
+    )
+
+
+def widgets(name: str, screen: Group) -> None:
+    targets = pointer_targets(screen)
+    width, height = screen.screen.get_size()
+    points = [
+        (random.randrange(width), random.randrange(height)) for _ in range(CLICKS)
+    ]
+
+    def linear(pos: tuple[int, int]) -> None:
+        for widget in targets:
+            widget.get_global_rect().collidepoint(pos)
+
+    start = time.perf_counter()
+    Object._layout_version += 1
+    screen.widget_at((0, 0))
+    build = (time.perf_counter() - start) * 1000
+    log(
+        name,
+        measure(linear, points),
+        measure(screen.widget_at, points),
+        f", <c>{len(targets)}</c> widgets, index built in <e>{build:.2f}</e> ms",
+    )
+
+
+def field(screen: game_client.GameClientScreen) -> None:
+    field_widget = screen.field
+    grid = screen.network_client.room.grid
+    field_widget.init_ways(
+        (i, j)
+        for i in range(grid.height)
+        for j in range(grid.width)
+        if grid.is_walkable(i, j)
+    )
+    Inbox.process()
+    rect = field_widget.get_global_rect()
+    points = [
+        (
+            random.randrange(rect.left, rect.right),
+            random.randrange(rect.top, rect.bottom),
+        )
+        for _ in range(CLICKS)
+    ]
+
+    def linear(pos: tuple[int, int]) -> None:
+        # Прежний обработчик нажатия на поле
+        for way in field_widget.ways.values():
+            field_widget.get_global_rect_of(way).collidepoint(pos)
+        field_widget.get_global_rect_of(field_widget.boss.rect).collidepoint(pos)
+        for enemy in field_widget.enemies.values():
+            field_widget.get_global_rect_of(enemy.rect).collidepoint(pos)
+        for character in field_widget.characters.values():
+            field_widget.get_global_rect_of(character.rect).collidepoint(pos)
+
+    def indexed(pos: tuple[int, int]) -> None:
+        for kind in ("way", "boss", "enemy", "character"):
+            field_widget.items_at(pos, kind)
+
+    log(
+        "Field",
+        measure(linear, points),
+        measure(indexed, points),
+        f", <c>{len(field_widget.ways)}</c> ways",
+    )
+
+
+def main() -> None:
+    random.seed(0)
+    network_client = FakeNetworkClient()
+    menu_screen = menu.MenuScreen(network_client)
+    widgets("MenuScreen", menu_screen)
+    menu_screen.open_lobby()
+    widgets("Lobby", menu_screen)
+    game_screen = game_client.GameClientScreen(network_client)
+    widgets("GameClientScreen", game_screen)
+    field(game_screen)
+
+
+if __name__ == "__main__":
+    main()
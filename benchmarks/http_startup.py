@@ -0,0 +1,133 @@
+"""
+
+HTTP запросы при запуске клиента (get_last_version, get_data_hash,
+get_data_links) к локальному серверу с задержкой LATENCY на соединение
+(как установка TLS соединения) и на ответ.
+Сравниваются прежние запросы (requests.get: новое соединение на запрос)
+и HttpClient: холодный запуск (общая сессия), повторный запуск в пределах
+HTTP_CACHE_TTL (ответы из файла кэша) и после него (условные запросы, 304).
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import typing as ty
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from session import logger
+
+from network import NetworkClient
+from network_http import HttpClient
+
+LATENCY = 0.03  # Задержка соединения и ответа сервера (в секундах)
+STARTS = 5
+
+RESPONSES = {
+    "/get_last_version": {"v": "1.0.0-beta.1", "updater": "https://example.com"},
+    "/data_hash": {"data_hash": "0" * 64},
+    "/data_links": {"resources": "https://example.com/resources.zip"},
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    wbufsize = 64 * 1024  # Заголовки и тело ответа отправляются вместе
+    connections = 0
+    requests = 0
+
+    def setup(self) -> None:
+        time.sleep(LATENCY)
+        Handler.connections += 1
+        super().setup()
+
+    def do_GET(self) -> None:  # noqa
+        time.sleep(LATENCY)
+        Handler.requests += 1
+        body = json.dumps(RESPONSES[self.path.split("?")[0]]).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def legacy_send_request(namespace, **kwargs) -> dict:
+    return requests.get(
+        f"{os.environ['HOST']}/{namespace}?"
+        + "&".join(f"{k}={v}" for k, v in kwargs.items())
+    ).json()
+
+
+def start(name: str, starts: int, before: ty.Callable[[], ty.Any]) -> None:
+    total = 0.0
+    Handler.connections = Handler.requests = 0
+    for _ in range(starts):
+        before()
+        network_client = NetworkClient()
+        begin = time.perf_counter()
+        network_client.get_last_version()
+        network_client.get_data_hash()
+        network_client.get_data_links()
+        total += time.perf_counter() - begin
+    logger.opt(colors=True).info(
+        f"<g>{name:>12}</g>: start <e>{total * 1000 / starts:6.1f}</e> ms, "
+        f"<c>{Handler.connections / starts:.0f}</c> connections, "
+        f"<c>{Handler.requests / starts:.0f}</c> requests"
+    )
+
+
+def new_process() -> None:
+    """
+    Запуск клиента заново: сессия и кэш в памяти сбрасываются,
+    файл кэша остается.
+    """
+    HttpClient._session = HttpClient._cache = None  # noqa
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["HOST"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ["HTTP_CACHE_PATH"] = os.path.join(
+        tempfile.gettempdir(), "dom-benchmark-http-cache.json"
+    )
+
+    send_request = NetworkClient.__dict__["_send_request"]
+    NetworkClient._send_request = staticmethod(legacy_send_request)
+    try:
+        start("legacy", STARTS, lambda: None)
+    finally:
+        NetworkClient._send_request = send_request
+
+    def cold() -> None:
+        new_process()
+        HttpClient.clear()
+
+    start("cold", STARTS, cold)
+    os.environ["HTTP_CACHE_TTL"] = "300"
+    start("warm", STARTS, new_process)
+    os.environ["HTTP_CACHE_TTL"] = "0"
+    start("revalidate", STARTS, new_process)
+    logger.opt(colors=True).info(f"HttpClient: <c>{HttpClient.stats()}</c>")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
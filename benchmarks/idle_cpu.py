@@ -0,0 +1,72 @@
+"""
+
+Загрузка процессора окнами, в которых ничего не происходит.
+Сравнивается цикл без ожидания событий и ограничения частоты кадров
+(как до появления RunLoop) с RunLoop.
+
+"""
+
+from __future__ import annotations
+
+import time
+import typing as ty
+
+from session import FakeNetworkClient, logger, pg
+
+import game_client
+import menu
+from base import Group, Inbox, RunLoop, Thread
+
+DURATION = 3  # Время работы каждого цикла (в секундах)
+
+
+def busy_loop(screen: Group) -> int:
+    """
+    Цикл окна без ожидания событий и ограничения частоты кадров.
+    :return: Кол-во кадров.
+    """
+    frames = 0
+    while screen.running:
+        for event in pg.event.get():
+            screen.handle_event(event)
+        Inbox.process()
+        screen.render()
+        frames += 1
+    return frames
+
+
+def run_loop(screen: Group) -> int:
+    """
+    :return: Кол-во кадров.
+    """
+    loop = RunLoop(screen)
+    loop.run()
+    return loop._frames  # noqa
+
+
+def measure(name: str, screen: Group, run: ty.Callable[[Group], int]) -> None:
+    screen.running = True
+    Thread(Inbox.post, args=(setattr, screen, "running", False), delay=DURATION).run()
+    wall, cpu = time.perf_counter(), time.process_time()
+    frames = run(screen)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    logger.opt(colors=True).info(
+        f"<g>{name:>22}</g>: <c>{frames / wall:8.1f}</c> fps, "
+        f"CPU <e>{cpu / wall * 100:5.1f}</e> %"
+    )
+
+
+def main() -> None:
+    network_client = FakeNetworkClient()
+    with Group.batch():
+        menu_screen = menu.MenuScreen(network_client)
+    with Group.batch():
+        game_screen = game_client.GameClientScreen(network_client)
+
+    for name, screen in (("menu", menu_screen), ("game", game_screen)):
+        measure(f"{name} busy loop", screen, busy_loop)
+        measure(f"{name} RunLoop", screen, run_loop)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+
+Очередь основного потока (Inbox) при потоке событий сервера.
+Несколько потоков socket.io одновременно передают NetworkClient снимки
+состояния (смена хода, статусы друзей) и события, которые нельзя
+пропускать (пинги), пока основной поток не обрабатывает очередь.
+Проверяется, что снимков в очереди не больше, чем ключей, после обработки
+применен последний снимок каждого ключа и выполнены все пинги.
+Выводится длина очереди и время ее обработки.
+
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from session import logger
+
+from base import Inbox
+from game import Room
+from network import NetworkClient
+
+THREADS = 4
+EVENTS = 5000  # Кол-во событий каждого вида в каждом потоке
+FRIENDS = 20
+
+
+def user(uid: int, status: int) -> dict[str, ...]:
+    return dict(
+        uid=uid,
+        username=f"friend{uid}",
+        icon=0,
+        friends=[],
+        friend_requests=[],
+        status=status,
+    )
+
+
+def main() -> None:
+    network_client = NetworkClient()
+    network_client.room = Room(1)
+    queues, statuses, pings = [], {}, []
+    network_client.on_set_queue(queues.append)
+    network_client.on_change_user_status(
+        lambda friend: statuses.__setitem__(friend.uid, friend.status.text)
+    )
+    network_client.on_ping(lambda y, x: pings.append((y, x)))
+    handlers = network_client.sio.handlers["/"]
+
+    def server(thread: int) -> None:
+        for i in range(EVENTS):
+            handlers["set queue"](dict(queue=f"player{thread}"))
+            handlers["change user status"](dict(user=user(i % FRIENDS, 1)))
+            handlers["ping"](dict(y=thread, x=i))
+
+    threads = [threading.Thread(target=server, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Последние снимки: ход передан игроку 0, все друзья не в сети
+    handlers["set queue"](dict(queue="player0"))
+    for uid in range(FRIENDS):
+        handlers["change user status"](dict(user=user(uid, 0)))
+
+    stats = Inbox.stats()
+    assert stats["updates"] == 1 + FRIENDS, stats
+    start = time.perf_counter()
+    Inbox.process()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    assert queues == ["player0"], queues
+    assert statuses == {uid: "Не в сети" for uid in range(FRIENDS)}, statuses
+    assert len(pings) == THREADS * EVENTS, len(pings)
+    assert sorted(pings) == [(y, x) for y in range(THREADS) for x in range(EVENTS)]
+    logger.opt(colors=True).info(
+        f"{THREADS * EVENTS * 3} events: queue <c>{stats['queue_depth']}</c> calls "
+        f"+ <c>{stats['updates']}</c> updates, "
+        f"coalesced <c>{Inbox.stats()['coalesced']}</c>, "
+        f"processed in <e>{elapsed:.1f}</e> ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+
+Запросы к серверу без подключения: сервер эмулируется клиентом socket.io,
+который обрабатывает каждое событие в отдельном потоке с задержкой LATENCY.
+Сравнивается прежняя отправка (запрос за запросом: обработчик ответа
+подключается заново, и следующий запрос отправляется после ответа на предыдущий),
+отправка через NetworkClient, когда сервер отвечает событием (запросы
+с общим событием ответа отправляются по одному), и когда сервер отвечает
+в подтверждении (запросы отправляются сразу).
+Затем проверяется, что ответы сопоставляются с запросами, когда подтверждение
+и событие ответа приходят в случайном порядке, как у клиента socket.io,
+обрабатывающего каждый пакет в отдельном потоке: авторизации получают свои
+ответы, а ходы, на которые сервер отвечает только при ошибке, - свои ошибки.
+
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+import typing as ty
+from concurrent.futures import wait
+
+from session import logger
+
+from network import NetworkClient
+from network_requests import RequestLayer
+
+LATENCY = 0.02  # Задержка сервера (в секундах)
+REQUESTS = 50
+
+
+class FakeSio:
+    def __init__(self, ack_response: True | False):
+        """
+        Клиент socket.io, подключенный к эмулированному серверу.
+        :param ack_response: True - сервер отвечает в подтверждении,
+            False - событием с названием запроса.
+        """
+        self.ack_response = ack_response
+        self.handlers: dict[str, dict[str, ty.Callable]] = {}
+
+    def on(self, event: str, handler: ty.Callable) -> None:
+        self.handlers.setdefault("/", {})[event] = handler
+
+    def emit(self, event: str, data: ty.Any = None, callback=None) -> None:
+        threading.Timer(LATENCY, self._handle, args=(event, data, callback)).start()
+
+    def _handle(self, event: str, data: ty.Any, callback) -> None:
+        response = dict(status="ok", data=data)
+        if self.ack_response:
+            callback and callback(response)
+        else:
+            self.handlers["/"][event](response)
+            callback and callback()
+
+
+class ShuffledSio:
+    def __init__(self):
+        """
+        Клиент socket.io, который получает подтверждение и событие ответа
+        в случайном порядке. Сервер отвечает на авторизацию событием
+        и пустым подтверждением, на ход - событием только при ошибке
+        (нечетный ход).
+        """
+        self.handlers: dict[str, dict[str, ty.Callable]] = {}
+
+    def on(self, event: str, handler: ty.Callable) -> None:
+        self.handlers.setdefault("/", {})[event] = handler
+
+    def emit(self, event: str, data: ty.Any = None, callback=None) -> None:
+        threading.Timer(LATENCY, self._handle, args=(event, data, callback)).start()
+
+    def _handle(self, event: str, data: ty.Any, callback) -> None:
+        packets = [callback]
+        if event == "login" or data["n"] % 2:
+            packets.append(lambda: self.handlers["/"][event](dict(n=data["n"])))
+        for packet in packets:
+            threading.Timer(random.random() * LATENCY / 2, packet).start()
+
+
+def shuffled() -> dict[str, ...]:
+    """
+    :return: Метрики запросов.
+    """
+    request_layer = RequestLayer(ShuffledSio())
+    logins = [request_layer.request("login", dict(n=n)) for n in range(REQUESTS)]
+    moves = [request_layer.request("move", dict(n=n)) for n in range(REQUESTS // 5)]
+    wait(logins + moves)
+    responses = [future.result()["n"] for future in logins]
+    assert responses == list(range(REQUESTS)), responses
+    errors = [future.result() for future in moves]
+    assert errors == [n % 2 and dict(n=n) or None for n in range(len(moves))], errors
+    return request_layer.stats()
+
+
+def legacy(sio: FakeSio) -> float:
+    """
+    :return: Время ответа на все запросы (в секундах).
+    """
+    done = threading.Event()
+
+    def send(i: int) -> None:
+        if i == REQUESTS:
+            done.set()
+            return
+        sio.on("get social", lambda response: send(i + 1))
+        sio.emit("get social")
+
+    start = time.perf_counter()
+    send(0)
+    done.wait()
+    return time.perf_counter() - start
+
+
+def pipelined(sio: FakeSio) -> tuple[float, dict[str, ...]]:
+    """
+    :return: Время ответа на все запросы (в секундах) и метрики запросов.
+    """
+    network_client = NetworkClient()
+    network_client.request_layer = RequestLayer(sio)
+    start = time.perf_counter()
+    futures = [network_client.request("get social") for _ in range(REQUESTS)]
+    wait(futures)
+    return time.perf_counter() - start, network_client.request_layer.stats()
+
+
+def main() -> None:
+    total = legacy(FakeSio(False))
+    logger.opt(colors=True).info(
+        f"<g>{'legacy':>13}</g>: {REQUESTS} requests in <e>{total * 1000:6.1f}</e> ms"
+    )
+    for name, ack_response in (("reply event", False), ("ack response", True)):
+        total, stats = pipelined(FakeSio(ack_response))
+        latency = stats["latency"]["get social"]
+        logger.opt(colors=True).info(
+            f"<g>{name:>13}</g>: {REQUESTS} requests in <e>{total * 1000:6.1f}</e> ms,"
+            f" in flight <c>{stats['max_in_flight']}</c>, "
+            f"latency p50 <c>{latency['p50_ms']}</c> ms, "
+            f"p95 <c>{latency['p95_ms']}</c> ms, buckets <c>{latency['buckets']}</c>"
+        )
+    for _ in range(5):
+        stats = shuffled()
+        assert stats["timeouts"] == 0 and stats["in_flight"] == 0, stats
+    logger.opt(colors=True).info(
+        f"<g>{'shuffled':>13}</g>: replies matched, "
+        f"move latency p50 <c>{stats['latency']['move']['p50_ms']}</c> ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+
+Сравнение поиска достижимых клеток:
+рекурсивный перебор путей (get_ways) против поиска в ширину по битовой маске
+(get_reachable) на сгенерированных лабиринтах от 10x10 до 200x200.
+
+"""
+
+from __future__ import annotations
+
+import random
+
+from session import generate_field, logger, timeit
+
+from game.grid import GridIndex
+from game.tools import get_reachable, get_ways
+
+SIZES = (10, 25, 50, 100, 200)
+STEPS = (6, 8, 12)  # Число на кости + скорость персонажа
+REPEAT = 5
+
+
+def generate_maze(size: int, loops: float = 0.1, seed: int = 1) -> list[list[bool]]:
+    """
+    Генерирует лабиринт обходом в глубину.
+    :param size: Размер поля.
+    :param loops: Доля стен, удаляемых после генерации (создает циклы).
+    :param seed: Зерно генератора.
+    :return: Поле.
+    """
+    rnd = random.Random(seed)
+    field = [[False] * size for _ in range(size)]
+    stack = [(1, 1)]
+    field[1][1] = True
+    while stack:
+        y, x = stack[-1]
+        neighbors = [
+            (y + dy, x + dx)
+            for dy, dx in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < y + dy < size - 1
+            and 0 < x + dx < size - 1
+            and not field[y + dy][x + dx]
+        ]
+        if not neighbors:
+            stack.pop()
+            continue
+        ny, nx = rnd.choice(neighbors)
+        field[(y + ny) // 2][(x + nx) // 2] = field[ny][nx] = True
+        stack.append((ny, nx))
+
+    for y in range(1, size - 1):
+        for x in range(1, size - 1):
+            if not field[y][x] and rnd.random() < loops:
+                field[y][x] = True
+    return field
+
+
+def main() -> None:
+    for kind, generate in (("maze", generate_maze), ("open", generate_field)):
+        for size in SIZES:
+            field = GridIndex(generate(size))
+            for steps in STEPS:
+                old = timeit(lambda: get_ways((1, 1), steps, field), REPEAT)
+                new = timeit(lambda: get_reachable((1, 1), steps, field), REPEAT)
+                cells = {
+                    tuple(cord)
+                    for way in get_ways((1, 1), steps, field)
+                    for cord in way
+                }
+                assert cells == get_reachable((1, 1), steps, field)
+                logger.info(
+                    f"{kind} {size}x{size}, {steps} steps ({len(cells)} cells): "
+                    f"get_ways {old:.3f} ms, get_reachable {new:.3f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
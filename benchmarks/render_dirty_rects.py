@@ -0,0 +1,75 @@
+"""
+
+Сравнение полной перерисовки окна игрового клиента
+с перерисовкой только измененных областей.
+
+"""
+
+from __future__ import annotations
+
+import time
+
+from session import FakeNetworkClient, logger, pg
+
+import game_client
+
+FRAMES = 600
+
+
+def full_render(screen: game_client.GameClientScreen) -> None:
+    """
+    Полная перерисовка окна (как до появления отслеживания измененных областей).
+    """
+    screen.pop_dirty_rects(screen.screen.get_rect())
+    screen._draw_background(screen.screen)  # noqa
+    screen.draw(screen.screen)
+    pg.display.flip()
+
+
+def play(screen: game_client.GameClientScreen, render) -> list[float]:
+    """
+    Сценарий игровой сессии.
+    Большая часть кадров - простой, изредка меняются характеристики,
+    двигаются враги и бросается кость.
+    :return: Время каждого кадра (в миллисекундах).
+    """
+    room = screen.network_client.room
+    frames = []
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        if frame % 50 == 0:
+            screen.players_menu.client_player.stats.coins.value.text = str(frame)
+        if frame % 120 == 60:
+            enemy = room.enemies[0]
+            enemy.pos = [enemy.pos[0], enemy.pos[1] % 5 + 1]
+            screen.field.update_field()
+        if frame == 200:
+            screen.dices_widget.dice.move_from_list([[0, 2], [2, 3], [1, 5]])
+        screen.dices_widget.update()
+        render(screen)
+        frames.append((time.perf_counter() - start) * 1000)
+        screen.loop.clock.tick()
+    return frames
+
+
+def main() -> None:
+    screen = game_client.GameClientScreen(FakeNetworkClient())
+    for _ in range(10):
+        screen.loop.clock.tick(120)
+
+    for name, render in (
+        ("full redraw", full_render),
+        ("dirty rects", game_client.GameClientScreen.render),
+    ):
+        render(screen)
+        frames = sorted(play(screen, render))
+        logger.opt(colors=True).info(
+            f"<g>{name:>12}</g>: "
+            f"mean <e>{sum(frames) / len(frames):.3f}</e> ms, "
+            f"median <e>{frames[len(frames) // 2]:.3f}</e> ms, "
+            f"max <e>{frames[-1]:.3f}</e> ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+
+Окружение для замеров производительности клиента.
+Запускает pygame без окна и создает игровую сессию без подключения к серверу.
+
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tempfile
+import time
+import typing as ty
+
+from loguru import logger
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESOURCES_DIR = os.path.join(ROOT_DIR, "build", "sources", "resources")
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+os.environ["APP_DIR"] = RESOURCES_DIR
+for _env, _dir in {
+    "CHARACTERS_PATH": "characters",
+    "USER_ICONS_PATH": "user_icons",
+    "UI_ICONS_PATH": "ui_icons",
+    "ITEMS_PATH": "items",
+    "ITEM_BORDERS_PATH": "item_borders",
+    "ITEM_STANDS_PATH": "item_stands",
+    "BUTTONS_PATH": "buttons",
+    "BOSSES_PATH": "bosses",
+    "ENEMIES_PATH": "enemies",
+    "LOCATIONS_PATH": "locations",
+    "CUBE_PATH": "cube",
+}.items():
+    os.environ[_env] = os.path.join(RESOURCES_DIR, _dir)
+os.environ["FONT"] = os.path.join(RESOURCES_DIR, "font.ttf")
+os.environ["VERSION"] = "benchmark"
+os.environ["DB_PATH"] = os.path.join(tempfile.gettempdir(), "dom-benchmark.sqlite")
+os.environ["MAX_RESOLUTION"] = "3840;2160"
+os.environ["resolution"] = "1600;900"
+os.environ["font_size"] = "20"
+os.environ["icon_size"] = "40"
+os.environ["buttons_size"] = "50"
+
+sys.path.insert(0, os.path.join(ROOT_DIR, "DOM"))
+
+import pygame as pg  # noqa
+
+pg.init()
+pg.display.set_mode((1600, 900))
+
+logger.remove()
+logger.add(sys.stdout, format="<lvl><n>{message}</n></lvl>", level="INFO")
+
+from game import Room  # noqa
+from network import User  # noqa
+
+
+def generate_field(size: int, walls: float = 0.25, seed: int = 1) -> list[list[bool]]:
+    """
+    Генерирует случайное поле.
+    :param size: Размер поля.
+    :param walls: Доля стен.
+    :param seed: Зерно генератора.
+    :return: Поле.
+    """
+    rnd = random.Random(seed)
+    field = [
+        [
+            0 < i < size - 1 and 0 < j < size - 1 and rnd.random() > walls
+            for j in range(size)
+        ]
+        for i in range(size)
+    ]
+    # Стартовая клетка, клетки игроков и выход с уровня
+    field[1][1] = field[2][1] = True
+    field[-1][size // 2] = field[-2][size // 2] = True
+    return field
+
+
+class FakeNetworkClient:
+    """
+    Клиент, не подключающийся к серверу.
+    Обработчики событий сервера не регистрируются, запросы не отправляются.
+    """
+
+    def __init__(self, size: int = 15, enemies: int = 3):
+        self.user = User(1, "tester", 1, [], [], 1)
+        self.room = Room(1)
+
+        rnd = random.Random(size)
+        self.room.init_lvl(
+            lvl=1,
+            field=generate_field(size),
+            location_name="desert",
+            location=[[rnd.randint(1, 3) for _ in range(size)] for _ in range(size)],
+            shop=[None] * 8,
+            players=[
+                dict(
+                    uid=uid,
+                    username=f"player{uid}",
+                    icon=uid,
+                    character_id=uid - 1,
+                    character=dict(
+                        name="...", hp=5, max_hp=5, damage=1, items=[None] * 6, pos=pos
+                    ),
+                )
+                for uid, pos in ((1, [1, 1]), (2, [2, 1]))
+            ],
+            boss=dict(
+                name="Diablo",
+                hp=10,
+                pos=[size - 3, size // 2],
+                desc=[{"desc": "...", "damage": 2}],
+                icon="diablo.png",
+            ),
+            enemies=[
+                dict(
+                    eid=eid,
+                    name="...",
+                    hp=3,
+                    damage=1,
+                    attack_range=1,
+                    reward=1,
+                    pos=[3 + eid, 3],
+                    icon="mogus.png",
+                )
+                for eid in range(enemies)
+            ],
+            queue="p1",
+        )
+
+    def __getattr__(self, item: str) -> ty.Callable[..., None]:
+        return lambda *args, **kwargs: None
+
+
+def timeit(func: ty.Callable[[], ...], repeat: int) -> float:
+    """
+    :param func: Замеряемая функция.
+    :param repeat: Кол-во повторов.
+    :return: Среднее время выполнения (в миллисекундах).
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
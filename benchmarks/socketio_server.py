@@ -0,0 +1,191 @@
+"""
+
+NetworkClient и настоящий сервер socket.io (socketio.Server) в том же
+процессе, транспорт - long-polling.
+Сервер отвечает так же, как сервер DOM: на авторизацию и вход в лобби -
+событием ответа и пустым подтверждением, на ход - событием только при ошибке
+(каждый нечетный ход).
+Клиент socket.io обрабатывает каждый пакет в отдельном потоке, поэтому
+подтверждение может прийти раньше события ответа.
+Проверяется, что каждый запрос получает свой ответ, а комната обновляется
+по событиям сервера. Выводится время запросов и их метрики.
+AsyncNetworkClient проверяется тем же сервером, если установлен aiohttp.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import threading
+import time
+import typing as ty
+from concurrent.futures import wait
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import socketio  # noqa
+from session import logger
+
+from base import Inbox
+from network import NetworkClient
+
+REQUESTS = 100
+MOVES = 20
+
+server = socketio.Server(async_mode="threading")
+
+
+def user(uid: int, username: str) -> dict[str, ...]:
+    return dict(
+        uid=uid, username=username, icon=0, friends=[], friend_requests=[], status=1
+    )
+
+
+@server.on("login")
+def on_login(sid: str, data: dict[str, ...]) -> None:
+    server.emit(
+        "login",
+        dict(status="ok", user=user(hash(data["username"]), data["username"])),
+        to=sid,
+    )
+
+
+@server.on("join lobby")
+def on_join_lobby(sid: str, data: dict[str, ...]) -> None:
+    server.emit(
+        "join lobby",
+        dict(
+            status="ok",
+            room_id=data["room_id"],
+            users=[dict(uid=0, username="owner", icon=0)],
+        ),
+        to=sid,
+    )
+    server.emit("joining the lobby", dict(user=user(1, "guest")), to=sid)
+
+
+@server.on("move")
+def on_move(sid: str, data: dict[str, ...]) -> None:
+    if data["y"] % 2:
+        server.emit("move", dict(msg="Стена"), to=sid)
+
+
+@server.on("leave lobby")
+def on_leave_lobby(sid: str, data: dict[str, ...]) -> None:
+    server.emit("leave lobby", to=sid)
+
+
+@server.on("logout")
+def on_logout(sid: str, data: ty.Any = None) -> None:
+    pass
+
+
+class Server(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class Handler(WSGIRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+
+def process_inbox(condition: ty.Callable[[], True | False], timeout: float) -> None:
+    """
+    Основной цикл окна: выполняет Inbox, пока не выполнится условие.
+    """
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError(condition)
+        Inbox.process()
+        time.sleep(0.001)
+
+
+def check_network_client(host: str) -> None:
+    network_client = NetworkClient()
+    network_client.sio.connect(host, wait_timeout=10)
+    network_client.connect_handlers()
+
+    start = time.perf_counter()
+    futures = [
+        network_client.request("login", dict(username=f"bot{i}", password=""))
+        for i in range(REQUESTS)
+    ]
+    wait(futures, timeout=30)
+    total = time.perf_counter() - start
+    usernames = [future.result()["user"]["username"] for future in futures]
+    assert usernames == [f"bot{i}" for i in range(REQUESTS)], usernames
+    logger.opt(colors=True).info(
+        f"<g>NetworkClient</g>: {REQUESTS} logins in <e>{total * 1000:6.1f}</e> ms"
+    )
+
+    done = []
+    network_client.login("player", "", lambda: done.append("login"), done.append)
+    process_inbox(lambda: done, 10)
+    network_client.on_joining_the_lobby(lambda: done.append("joining the lobby"))
+    network_client.join_lobby(1, lambda: done.append("join lobby"), done.append)
+    process_inbox(lambda: len(done) == 3, 10)
+    assert done == ["login", "join lobby", "joining the lobby"], done
+    assert network_client.user.username == "player"
+    assert [player.username for player in network_client.room.players] == [
+        "owner",
+        "guest",
+    ]
+
+    errors = []
+    futures = [network_client.move(y, 0, errors.append) for y in range(1, MOVES + 1)]
+    wait(futures, timeout=30)
+    process_inbox(lambda: not Inbox.has_pending(), 10)
+    assert errors == ["Стена"] * (MOVES // 2), errors
+
+    network_client.disconnect()
+    stats = network_client.request_layer.stats()
+    assert stats["timeouts"] == 0 and stats["in_flight"] == 0, stats
+    logger.opt(colors=True).info(f"<g>NetworkClient</g>: <c>{stats}</c>")
+
+
+async def check_async_network_client(host: str) -> None:
+    from network_async import AsyncNetworkClient
+
+    client = AsyncNetworkClient()
+    await client.connect(host)
+    start = time.perf_counter()
+    users = await asyncio.gather(
+        *(client.request("login", dict(username=f"bot{i}")) for i in range(REQUESTS))
+    )
+    total = time.perf_counter() - start
+    usernames = [response["user"]["username"] for response in users]
+    assert usernames == [f"bot{i}" for i in range(REQUESTS)], usernames
+    await client.login("player", "")
+    room = await client.join_lobby(1)
+    await asyncio.sleep(0.1)
+    assert [player.username for player in room.players] == ["owner", "guest"]
+    await client.disconnect()
+    logger.opt(colors=True).info(
+        f"<g>AsyncNetworkClient</g>: {REQUESTS} logins in "
+        f"<e>{total * 1000:6.1f}</e> ms, <c>{client.stats()}</c>"
+    )
+
+
+def main() -> None:
+    httpd = make_server(
+        "127.0.0.1",
+        0,
+        socketio.WSGIApp(server),
+        server_class=Server,
+        handler_class=Handler,
+    )
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    host = f"http://127.0.0.1:{httpd.server_port}"
+
+    check_network_client(host)
+    if importlib.util.find_spec("aiohttp") is None:
+        logger.warning("aiohttp не установлен, AsyncNetworkClient не проверен")
+    else:
+        asyncio.run(check_async_network_client(host))
+    httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+
+Отрисовка текста виджетов с кэшем TextCache и без него.
+Замеряется построение окон и обновление всех надписей окна игрового клиента
+(как при наведении на кнопки: меняется фон, а не текст).
+
+"""
+
+from __future__ import annotations
+
+import time
+
+from session import FakeNetworkClient, logger, pg
+
+import game_client
+import menu
+from base import Label
+from base.text_cache import TextCache
+
+UPDATES = 20
+
+font_renders = 0  # Кол-во вызовов font.render без кэша
+
+
+def labels(group) -> list[Label]:
+    """
+    :return: Все надписи группы и вложенных групп.
+    """
+    result = []
+    for obj in group.objects:
+        if isinstance(obj, Label):
+            result.append(obj)
+        if hasattr(obj, "objects"):
+            result.extend(labels(obj))
+    return result
+
+
+def uncached_render(font, text, color, antialias=True) -> pg.Surface:
+    global font_renders
+    font_renders += 1
+    return font.render(text, antialias, color)
+
+
+def always_refresh_text(self: Label) -> None:
+    self._rendered_text = self._render_text()
+
+
+def run(name: str, func, cached: True | False) -> None:
+    """
+    :param func: Замеряемая функция.
+    :param cached: False - текст перерисовывается при каждом обновлении
+        виджета и без кэша (как до появления TextCache).
+    """
+    global font_renders
+    render, refresh_text = TextCache.__dict__["render"], Label._refresh_text
+    if not cached:
+        TextCache.render = staticmethod(uncached_render)
+        Label._refresh_text = always_refresh_text
+
+    font_renders, misses = 0, TextCache.misses
+    start = time.perf_counter()
+    try:
+        func()
+    finally:
+        TextCache.render, Label._refresh_text = render, refresh_text
+    if cached:
+        font_renders = TextCache.misses - misses
+    logger.opt(colors=True).info(
+        f"<g>{name:>16}</g> {'cached' if cached else 'uncached':>8}: "
+        f"<c>{font_renders:>6}</c> font.render "
+        f"<e>{(time.perf_counter() - start) * 1000:8.1f}</e> ms"
+    )
+
+
+def main() -> None:
+    network_client = FakeNetworkClient()
+    game_screen = game_client.GameClientScreen(network_client)
+    widgets = labels(game_screen)
+
+    def update_labels() -> None:
+        for _ in range(UPDATES):
+            for widget in widgets:
+                widget.update()
+
+    for cached in (False, True):
+        TextCache.clear()
+        run("MenuScreen", lambda: menu.MenuScreen(network_client), cached)
+        run(
+            "GameClientScreen",
+            lambda: game_client.GameClientScreen(network_client),
+            cached,
+        )
+        run(f"{len(widgets)} labels x{UPDATES}", update_labels, cached)
+    logger.opt(colors=True).info(f"TextCache: <c>{TextCache.stats()}</c>")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+
+Разбиение длинного текста на строки виджетом Text:
+прежний алгоритм (измерение растущего префикса строки)
+и TextLayout: с пустым кэшем, с измеренными словами
+(новое сообщение из знакомых слов) и с запомненным разбиением.
+
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+
+from session import logger, pg
+
+from base.text_layout import TextLayout
+
+REPEATS = 20
+WORDS = "игрок получил урон от врага и потерял здоровье монеты предмет".split()
+
+
+def prefix_wrap(font: pg.font.Font, text: str, width: int, soft_split: bool):
+    """
+    Прежний алгоритм Text._render_text.
+    """
+    lines = []
+    for line in text.splitlines():
+        if font.size(line)[0] <= width:
+            lines.append(line)
+        elif soft_split:
+            words = line.split()
+            _line = words[0]
+            for word in words[1:]:
+                if font.size(_line + " " + word)[0] > width:
+                    lines.append(_line)
+                    _line = ""
+                _line += " " + word
+                _line = _line.strip()
+            if len(_line):
+                lines.append(_line)
+        else:
+            _line = ""
+            for char in line:
+                if font.size(_line + char)[0] > width:
+                    lines.append(_line)
+                    _line = ""
+                _line += char
+            if len(_line):
+                lines.append(_line)
+    return tuple(lines)
+
+
+def measure(func) -> float:
+    """
+    :return: Среднее время вызова (в миллисекундах).
+    """
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        func()
+    return (time.perf_counter() - start) * 1000 / REPEATS
+
+
+def main() -> None:
+    random.seed(0)
+    font = pg.font.Font(os.environ["FONT"], 20)
+    width = 300
+
+    for length in (200, 1000, 5000):
+        text = " ".join(random.choice(WORDS) for _ in range(length // 6))
+        for soft_split in (True, False):
+
+            def prefix() -> tuple[str, ...]:
+                return prefix_wrap(font, text, width, soft_split)
+
+            def memoized() -> tuple[str, ...]:
+                return TextLayout.wrap(font, text, width, soft_split)
+
+            def cold() -> None:
+                TextLayout.clear()
+                memoized()
+
+            def known_words() -> None:
+                TextLayout._layouts.clear()  # noqa
+                memoized()
+
+            assert prefix() == memoized()
+            logger.opt(colors=True).info(
+                f"<g>{len(text):>5}</g> chars "
+                f"{'words' if soft_split else 'chars':>5}: "
+                f"prefix <e>{measure(prefix):7.2f}</e> ms, "
+                f"TextLayout cold <e>{measure(cold):6.2f}</e> ms, "
+                f"known words <e>{measure(known_words):6.2f}</e> ms, "
+                f"memoized <e>{measure(memoized):6.3f}</e> ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+
+Подсчет перерисовок виджетов при построении окон.
+Для каждого окна выводится кол-во вызовов _render и время построения
+с первой отрисовкой: с немедленными обновлениями виджетов
+и с обновлениями, отложенными блоком batch.
+
+"""
+
+from __future__ import annotations
+
+import time
+
+from session import FakeNetworkClient, logger, pg
+
+import game_client
+import menu
+from base import Group
+from base.widget import BaseWidget
+
+renders = 0
+
+
+def count_renders(cls: type) -> None:
+    """
+    Оборачивает методы _render класса и всех его наследников счетчиком вызовов.
+    """
+    if "_render" in cls.__dict__:
+        render = cls.__dict__["_render"]
+
+        def counted(self, *args, **kwargs):
+            global renders
+            renders += 1
+            return render(self, *args, **kwargs)
+
+        cls._render = counted
+    for subclass in cls.__subclasses__():
+        count_renders(subclass)
+
+
+def run(build, surface: pg.Surface, batch: True | False) -> tuple[int, float]:
+    """
+    :return: Кол-во вызовов _render и время (в миллисекундах).
+    """
+    global renders
+    renders = 0
+    start = time.perf_counter()
+    if batch:
+        with Group.batch():
+            group = build()
+    else:
+        group = build()
+    group.draw(surface)
+    return renders, (time.perf_counter() - start) * 1000
+
+
+def measure(name: str, build, surface: pg.Surface) -> None:
+    """
+    :param build: Функция, строящая группу и возвращающая группу для отрисовки.
+    :param surface: Поверхность для отрисовки.
+    """
+    eager_renders, eager_time = run(build, surface, batch=False)
+    batch_renders, batch_time = run(build, surface, batch=True)
+    logger.opt(colors=True).info(
+        f"<g>{name:>16}</g>: "
+        f"<c>{eager_renders:>4}</c> renders <e>{eager_time:7.1f}</e> ms -> "
+        f"<c>{batch_renders:>4}</c> renders <e>{batch_time:7.1f}</e> ms"
+    )
+
+
+def main() -> None:
+    network_client = FakeNetworkClient()
+    count_renders(BaseWidget)
+
+    menu_screen = menu.MenuScreen(network_client)
+    menu_screen.open_lobby()
+    game_screen = game_client.GameClientScreen(network_client)
+    surface = pg.Surface(game_screen.screen.get_size())
+
+    def init_lobby() -> Group:
+        menu_screen.lobby.init()
+        return menu_screen
+
+    def build_shop() -> Group:
+        game_screen.remove(game_screen.shop)
+        game_screen.shop = game_client.ShopMenu(game_screen)
+        return game_screen
+
+    def build_player_widget() -> Group:
+        game_screen.remove(game_screen.player_nemu)
+        game_screen.player_nemu = game_client.PlayerWidget(
+            game_screen,
+            network_client,
+            width=game_screen.player_nemu.rect.width,
+            x=0,
+            y=0,
+            player=network_client.room.players[0],
+        )
+        return game_screen
+
+    measure("MenuScreen", lambda: menu.MenuScreen(network_client), surface)
+    measure("Lobby.init", init_lobby, surface)
+    measure(
+        "GameClientScreen",
+        lambda: game_client.GameClientScreen(network_client),
+        surface,
+    )
+    measure("ShopMenu", build_shop, surface)
+    measure("PlayerWidget", build_player_widget, surface)
+
+
+if __name__ == "__main__":
+    main()